@@ -0,0 +1,29 @@
+"""add keyset index for game updates feed
+
+Revision ID: 0004_game_updates_keyset
+Revises: 0003_game_updates
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004_game_updates_keyset"
+down_revision = "0003_game_updates"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_game_updates_keyset",
+        "game_updates",
+        ["patch_date", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_game_updates_keyset", table_name="game_updates")
@@ -0,0 +1,140 @@
+"""store excerpt, word count and toc for articles and updates
+
+Revision ID: 0006_content_meta
+Revises: 0005_search_documents
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0006_content_meta"
+down_revision = "0005_search_documents"
+branch_labels = None
+depends_on = None
+
+TABLES = ("articles", "game_updates")
+BACKFILL_BATCH = 200
+
+# Frozen copy of app.services.sanitize.content_fields as of this revision, so later
+# changes to the app code do not change what this migration writes.
+EXCERPT_MAX_CHARS = 280
+BLOCK_TAGS = {
+    "blockquote",
+    "br",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "hr",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "ul",
+}
+TOC_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4}
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self.headings: list[tuple[int, str]] = []
+        self._heading: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in BLOCK_TAGS:
+            self.parts.append(" ")
+        if tag in TOC_LEVELS:
+            self._heading = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in BLOCK_TAGS:
+            self.parts.append(" ")
+        if tag in TOC_LEVELS and self._heading is not None:
+            title = _WHITESPACE_RE.sub(" ", "".join(self._heading)).strip()
+            if title:
+                self.headings.append((TOC_LEVELS[tag], title))
+            self._heading = None
+
+    def handle_data(self, data: str) -> None:
+        self.parts.append(data)
+        if self._heading is not None:
+            self._heading.append(data)
+
+
+def _content_fields(content: str) -> dict[str, object]:
+    extractor = _TextExtractor()
+    extractor.feed(content)
+    extractor.close()
+    text = _WHITESPACE_RE.sub(" ", "".join(extractor.parts)).strip()
+    excerpt = text
+    if len(text) > EXCERPT_MAX_CHARS:
+        cut = text[:EXCERPT_MAX_CHARS]
+        if " " in cut:
+            cut = cut.rsplit(" ", 1)[0]
+        excerpt = cut.rstrip(" ,.;:-") + "…"
+    return {
+        "excerpt": excerpt,
+        "word_count": len(text.split()),
+        "toc": [{"level": level, "title": title} for level, title in extractor.headings],
+    }
+
+
+def _backfill(table_name: str) -> None:
+    bind = op.get_bind()
+    table = sa.table(
+        table_name,
+        sa.column("id", sa.String),
+        sa.column("content", sa.Text),
+        sa.column("excerpt", sa.String),
+        sa.column("word_count", sa.Integer),
+        sa.column("toc", sa.JSON),
+    )
+    last_id = ""
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, table.c.content)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            break
+        for row in rows:
+            bind.execute(
+                table.update()
+                .where(table.c.id == row.id)
+                .values(**_content_fields(row.content or ""))
+            )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    for table_name in TABLES:
+        op.add_column(table_name, sa.Column("excerpt", sa.String(length=512), nullable=True))
+        op.add_column(
+            table_name,
+            sa.Column("word_count", sa.Integer(), nullable=False, server_default="0"),
+        )
+        op.add_column(table_name, sa.Column("toc", sa.JSON(), nullable=True))
+        _backfill(table_name)
+
+
+def downgrade() -> None:
+    for table_name in TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column("toc")
+            batch_op.drop_column("word_count")
+            batch_op.drop_column("excerpt")
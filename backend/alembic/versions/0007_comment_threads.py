@@ -0,0 +1,96 @@
+"""thread columns on comments: root_id, depth, reply_count
+
+Revision ID: 0007_comment_threads
+Revises: 0006_content_meta
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0007_comment_threads"
+down_revision = "0006_content_meta"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH = 500
+
+comments = sa.table(
+    "comments",
+    sa.column("id", sa.String),
+    sa.column("parent_id", sa.String),
+    sa.column("is_hidden", sa.Boolean),
+    sa.column("root_id", sa.String),
+    sa.column("depth", sa.Integer),
+    sa.column("reply_count", sa.Integer),
+)
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    parents: dict[str, str | None] = {}
+    reply_counts: dict[str, int] = {}
+    for row in bind.execute(sa.select(comments.c.id, comments.c.parent_id, comments.c.is_hidden)):
+        parents[row.id] = row.parent_id
+        if row.parent_id and not row.is_hidden:
+            reply_counts[row.parent_id] = reply_counts.get(row.parent_id, 0) + 1
+
+    placement: dict[str, tuple[str | None, int]] = {}
+
+    def place(comment_id: str) -> tuple[str | None, int]:
+        # Walk up to the first placed ancestor, then place the chain top-down.
+        chain = []
+        current: str | None = comment_id
+        while current is not None and current not in placement:
+            chain.append(current)
+            parent = parents[current]
+            current = parent if parent in parents else None
+        for node in reversed(chain):
+            parent = parents[node]
+            if parent is None or parent not in placement:
+                placement[node] = (None, 0)
+            else:
+                parent_root, parent_depth = placement[parent]
+                placement[node] = (parent_root or parent, parent_depth + 1)
+        return placement[comment_id]
+
+    rows = []
+    for comment_id in parents:
+        root_id, depth = place(comment_id)
+        count = reply_counts.get(comment_id, 0)
+        if depth or count:
+            rows.append({"b_id": comment_id, "root_id": root_id, "depth": depth, "count": count})
+
+    statement = (
+        comments.update()
+        .where(comments.c.id == sa.bindparam("b_id"))
+        .values(
+            root_id=sa.bindparam("root_id"),
+            depth=sa.bindparam("depth"),
+            reply_count=sa.bindparam("count"),
+        )
+    )
+    for start in range(0, len(rows), BACKFILL_BATCH):
+        bind.execute(statement, rows[start : start + BACKFILL_BATCH])
+
+
+def upgrade() -> None:
+    op.add_column("comments", sa.Column("root_id", sa.String(length=36), nullable=True))
+    op.add_column("comments", sa.Column("depth", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column(
+        "comments", sa.Column("reply_count", sa.Integer(), nullable=False, server_default="0")
+    )
+    op.create_index("ix_comments_root_created", "comments", ["root_id", "created_at"])
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comments_root_created", table_name="comments")
+    with op.batch_alter_table("comments") as batch_op:
+        batch_op.drop_column("reply_count")
+        batch_op.drop_column("depth")
+        batch_op.drop_column("root_id")
@@ -0,0 +1,57 @@
+"""composite indexes matching the feed, comment, audit and registration queries
+
+Revision ID: 0008_query_indexes
+Revises: 0007_comment_threads
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0008_query_indexes"
+down_revision = "0007_comment_threads"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    (
+        "ix_articles_status_section_published",
+        "articles",
+        ["status", "section_id", "published_at", "id"],
+    ),
+    ("ix_articles_status_published", "articles", ["status", "published_at", "id"]),
+    (
+        "ix_game_updates_status_feed",
+        "game_updates",
+        ["status", "deleted_at", "patch_date", "created_at", "id"],
+    ),
+    ("ix_comments_article_visible", "comments", ["article_id", "is_hidden", "created_at"]),
+    # Thread roots page: parent_id IS NULL, keyset on (created_at, id) for staff and readers.
+    ("ix_comments_article_roots", "comments", ["article_id", "parent_id", "created_at", "id"]),
+    (
+        "ix_registration_requests_username_status",
+        "registration_requests",
+        ["username", "status", "created_at"],
+    ),
+    ("ix_game_update_audits_update_created", "game_update_audits", ["update_id", "created_at"]),
+)
+
+
+# ix_game_updates_status_feed ends with the same columns and serves the public feed.
+REPLACED_INDEX = ("ix_game_updates_keyset", "game_updates", ["patch_date", "created_at", "id"])
+
+
+def upgrade() -> None:
+    for name, table_name, columns in INDEXES:
+        op.create_index(name, table_name, columns, unique=False)
+    name, table_name, _ = REPLACED_INDEX
+    op.drop_index(name, table_name=table_name)
+
+
+def downgrade() -> None:
+    name, table_name, columns = REPLACED_INDEX
+    op.create_index(name, table_name, columns, unique=False)
+    for name, table_name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table_name)
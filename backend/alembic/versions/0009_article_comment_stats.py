@@ -0,0 +1,84 @@
+"""comment_count and last_commented_at on articles
+
+Revision ID: 0009_article_comment_stats
+Revises: 0008_query_indexes
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0009_article_comment_stats"
+down_revision = "0008_query_indexes"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH = 500
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    articles = sa.table(
+        "articles",
+        sa.column("id", sa.String),
+        sa.column("comment_count", sa.Integer),
+        sa.column("last_commented_at", sa.DateTime),
+    )
+    comments = sa.table(
+        "comments",
+        sa.column("id", sa.String),
+        sa.column("article_id", sa.String),
+        sa.column("parent_id", sa.String),
+        sa.column("is_hidden", sa.Boolean),
+        sa.column("created_at", sa.DateTime),
+    )
+    # Same rule as the app's visible_comments(), inlined so this revision does not
+    # depend on app code: a comment counts only while it and every ancestor are visible.
+    tree = (
+        sa.select(comments.c.id, comments.c.article_id, comments.c.created_at)
+        .where(comments.c.parent_id.is_(None), comments.c.is_hidden.is_(False))
+        .cte("visible_comments", recursive=True)
+    )
+    child = comments.alias("child")
+    tree = tree.union_all(
+        sa.select(child.c.id, child.c.article_id, child.c.created_at).where(
+            child.c.parent_id == tree.c.id, child.c.is_hidden.is_(False)
+        )
+    )
+    rows = [
+        {"b_id": row.article_id, "count": row.count, "last": row.last}
+        for row in bind.execute(
+            sa.select(
+                tree.c.article_id,
+                sa.func.count().label("count"),
+                sa.func.max(tree.c.created_at).label("last"),
+            ).group_by(tree.c.article_id)
+        )
+    ]
+    statement = (
+        articles.update()
+        .where(articles.c.id == sa.bindparam("b_id"))
+        .values(comment_count=sa.bindparam("count"), last_commented_at=sa.bindparam("last"))
+    )
+    for start in range(0, len(rows), BACKFILL_BATCH):
+        bind.execute(statement, rows[start : start + BACKFILL_BATCH])
+
+
+def upgrade() -> None:
+    op.add_column(
+        "articles", sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0")
+    )
+    op.add_column(
+        "articles", sa.Column("last_commented_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("articles") as batch_op:
+        batch_op.drop_column("last_commented_at")
+        batch_op.drop_column("comment_count")
@@ -0,0 +1,39 @@
+"""backfill published_at of published articles from created_at
+
+Revision ID: 0010_article_published_at_backfill
+Revises: 0009_article_comment_stats
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0010_article_published_at_backfill"
+down_revision = "0009_article_comment_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The keyset feed orders by (published_at, id) and skips NULLs; articles published
+    # before published_at was always set would otherwise drop out of /api/articles.
+    articles = sa.table(
+        "articles",
+        sa.column("status", sa.String),
+        sa.column("created_at", sa.DateTime),
+        sa.column("published_at", sa.DateTime),
+    )
+    op.execute(
+        articles.update()
+        .where(articles.c.status == "published", articles.c.published_at.is_(None))
+        .values(published_at=articles.c.created_at)
+    )
+
+
+def downgrade() -> None:
+    # Backfilled values cannot be told apart from real ones; leaving them is harmless.
+    pass
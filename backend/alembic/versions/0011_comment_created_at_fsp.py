@@ -0,0 +1,48 @@
+"""microsecond precision for comments.created_at on MySQL
+
+Revision ID: 0011_comment_created_at_fsp
+Revises: 0010_article_published_at_backfill
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+revision = "0011_comment_created_at_fsp"
+down_revision = "0010_article_published_at_backfill"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Plain DATETIME keeps whole seconds on MySQL, so comments from the same second
+    # were ordered only by the random UUID tiebreaker. SQLite and PostgreSQL keep
+    # microseconds already.
+    if op.get_bind().dialect.name != "mysql":
+        return
+    op.alter_column(
+        "comments",
+        "created_at",
+        type_=mysql.DATETIME(fsp=6),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        server_default=sa.text("CURRENT_TIMESTAMP(6)"),
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "mysql":
+        return
+    op.alter_column(
+        "comments",
+        "created_at",
+        type_=sa.DateTime(timezone=True),
+        existing_type=mysql.DATETIME(fsp=6),
+        existing_nullable=True,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
+    )
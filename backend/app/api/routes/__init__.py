@@ -1,3 +1,25 @@
-from app.api.routes import articles, auth, comments, health, install, sections, telegram, updates
+from app.api.routes import (
+    articles,
+    auth,
+    comments,
+    health,
+    install,
+    metrics,
+    search,
+    sections,
+    telegram,
+    updates,
+)
 
-__all__ = ["articles", "auth", "comments", "health", "install", "sections", "telegram", "updates"]
+__all__ = [
+    "articles",
+    "auth",
+    "comments",
+    "health",
+    "install",
+    "metrics",
+    "search",
+    "sections",
+    "telegram",
+    "updates",
+]
@@ -2,31 +2,91 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user_optional, get_db, require_role
+from app.core.cache import (
+    cache_get_async,
+    cache_invalidate,
+    cache_set_async,
+    cached_json_response,
+)
+from app.core.deps import (
+    get_async_read_db,
+    get_current_user_optional,
+    get_db,
+    require_role,
+    uses_primary,
+)
+from app.core.http_cache import PRIVATE_CACHE_CONTROL, conditional_json_response, entity_headers
+from app.core.ndjson import ndjson_response, read_ndjson
+from app.core.pagination import keyset_page, keyset_statement
 from app.models.article import Article
 from app.models.section import Section
-from app.schemas.articles import ArticleCreate, ArticleOut, ArticleUpdate
-from app.services.sanitize import sanitize_html
+from app.schemas.articles import ArticleCreate, ArticleListOut, ArticleOut, ArticleUpdate
+from app.schemas.base import BulkImportOut
+from app.services.bulk import (
+    ARTICLE_EXPORT_FIELDS,
+    article_conflicts,
+    export_rows,
+    import_articles,
+)
+from app.services.revalidate import request_revalidation
+from app.services.sanitize import content_fields, sanitize_html
+from app.services.search import index_article
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
+MAX_PER_PAGE = 50
+FEED_KEYS = (Article.published_at, Article.id)
 
-@router.get("", response_model=list[ArticleOut])
-def list_articles(section: str | None = None, db: Session = Depends(get_db)) -> list[ArticleOut]:
-    query = db.query(Article).filter(Article.status == "published")
+
+@router.get("", response_model=ArticleListOut)
+async def list_articles(
+    section: str | None = None,
+    per_page: int = Query(20, ge=1, le=MAX_PER_PAGE),
+    cursor: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_read_db),
+    primary: bool = Depends(uses_primary),
+) -> ArticleListOut:
+    cache_key = f"articles:list:{section or '*'}:{per_page}:{cursor or ''}"
+    cached = await cache_get_async(cache_key, bypass=primary)
+    if cached is not None:
+        return cached_json_response(cached[0], hit=True)
+
+    statement = select(
+        Article.id,
+        Article.slug,
+        Article.title,
+        Article.section_id,
+        Article.excerpt,
+        Article.word_count,
+        Article.comment_count,
+        Article.last_commented_at,
+        Article.published_at,
+    ).where(Article.status == "published", Article.published_at.is_not(None))
 
     if section:
-        section_obj = db.query(Section).filter(Section.slug == section).first()
-        if not section_obj:
-            return []
-        query = query.filter(Article.section_id == section_obj.id)
+        statement = statement.join(Section, Section.id == Article.section_id).where(
+            Section.slug == section
+        )
 
-    articles = query.order_by(Article.published_at.desc().nullslast()).all()
-    return articles
+    statement = keyset_statement(statement, FEED_KEYS, per_page, cursor=cursor)
+    rows = (await db.execute(statement)).all()
+    items, next_cursor = keyset_page(rows, FEED_KEYS, per_page)
+    result = ArticleListOut(
+        items=items,
+        per_page=per_page,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
+    )
+    payload = result.model_dump_json().encode("utf-8")
+    await cache_set_async(cache_key, payload, tags=["articles"])
+    return cached_json_response(payload, hit=False)
 
 
 @router.get("/all", response_model=list[ArticleOut])
@@ -38,13 +98,57 @@ def list_all_articles(
     return articles
 
 
+@router.post("/bulk", response_model=BulkImportOut, status_code=status.HTTP_201_CREATED)
+async def bulk_import_articles(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_role(["moderator", "admin"])),
+) -> BulkImportOut:
+    items = await read_ndjson(request, ArticleCreate)
+    errors = await run_in_threadpool(article_conflicts, db, items)
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=errors)
+    try:
+        created = await run_in_threadpool(import_articles, db, items, current_user.id)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Slug already exists"
+        ) from None
+    # Both make blocking Redis round trips; keep them off the event loop.
+    await run_in_threadpool(cache_invalidate, "articles")
+    await run_in_threadpool(request_revalidation, "articles")
+    return BulkImportOut(created=created)
+
+
+@router.get("/export")
+def export_articles(
+    db: Session = Depends(get_db),
+    _: object = Depends(require_role(["moderator", "admin"])),
+):
+    rows = export_rows(
+        db,
+        [getattr(Article, field) for field in ARTICLE_EXPORT_FIELDS],
+        order_by=(Article.created_at, Article.id),
+    )
+    return ndjson_response(rows, "articles.ndjson")
+
+
 @router.get("/{slug}", response_model=ArticleOut)
-def get_article(
+async def get_article(
     slug: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
+    primary: bool = Depends(uses_primary),
     current_user=Depends(get_current_user_optional),
 ) -> ArticleOut:
-    article = db.query(Article).filter(Article.slug == slug).first()
+    cache_key = f"article:{slug}"
+    cached = await cache_get_async(cache_key, bypass=primary)
+    if cached is not None:
+        payload, headers = cached
+        return conditional_json_response(request, payload, headers, hit=True)
+
+    article = (await db.execute(select(Article).where(Article.slug == slug))).scalars().first()
     if not article:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
@@ -52,7 +156,22 @@ def get_article(
         if not current_user or current_user.role not in ["moderator", "admin"]:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
-    return article
+    payload = ArticleOut.model_validate(article).model_dump_json().encode("utf-8")
+    # last_commented_at too: the payload carries the comment stats.
+    headers = entity_headers(
+        payload,
+        article.created_at,
+        article.updated_at,
+        article.published_at,
+        article.last_commented_at,
+    )
+    if article.status != "published":
+        return conditional_json_response(
+            request, payload, headers, hit=False, cache_control=PRIVATE_CACHE_CONTROL
+        )
+
+    await cache_set_async(cache_key, payload, tags=[cache_key], headers=headers)
+    return conditional_json_response(request, payload, headers, hit=False)
 
 
 @router.post("", response_model=ArticleOut, status_code=status.HTTP_201_CREATED)
@@ -69,19 +188,23 @@ def create_article(
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Slug already exists")
 
+    content = sanitize_html(payload.content)
     article = Article(
         section_id=payload.section_id,
         slug=payload.slug,
         title=payload.title,
-        content=sanitize_html(payload.content),
+        content=content,
         status=payload.status,
         author_id=current_user.id,
+        **content_fields(content),
     )
     if payload.status == "published":
         article.published_at = datetime.now(timezone.utc)
 
     db.add(article)
     try:
+        db.flush()
+        index_article(db, article)
         db.commit()
     except IntegrityError:
         db.rollback()
@@ -89,6 +212,8 @@ def create_article(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Slug already exists"
         ) from None
     db.refresh(article)
+    cache_invalidate("articles", f"article:{article.slug}")
+    request_revalidation("articles", f"article:{article.slug}")
     return article
 
 
@@ -103,6 +228,7 @@ def update_article(
     if not article:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
+    previous_slug = article.slug
     if payload.section_id:
         section = db.query(Section).filter(Section.id == payload.section_id).first()
         if not section:
@@ -124,6 +250,8 @@ def update_article(
 
     if payload.content:
         article.content = sanitize_html(payload.content)
+        for field, value in content_fields(article.content).items():
+            setattr(article, field, value)
 
     if payload.status:
         article.status = payload.status
@@ -131,6 +259,7 @@ def update_article(
             article.published_at = datetime.now(timezone.utc)
 
     db.add(article)
+    index_article(db, article)
     try:
         db.commit()
     except IntegrityError:
@@ -143,6 +272,8 @@ def update_article(
             status_code=status.HTTP_409_CONFLICT, detail="Update conflict"
         ) from None
     db.refresh(article)
+    cache_invalidate("articles", f"article:{previous_slug}", f"article:{article.slug}")
+    request_revalidation("articles", f"article:{previous_slug}", f"article:{article.slug}")
     return article
 
 
@@ -160,6 +291,9 @@ def publish_article(
     article.published_at = datetime.now(timezone.utc)
 
     db.add(article)
+    index_article(db, article)
     db.commit()
     db.refresh(article)
+    cache_invalidate("articles", f"article:{article.slug}")
+    request_revalidation("articles", f"article:{article.slug}")
     return article
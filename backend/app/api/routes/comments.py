@@ -1,36 +1,191 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user, get_current_user_optional, get_db, require_role
+from app.core.cache import cache_invalidate
+from app.core.deps import (
+    get_async_read_db,
+    get_current_user,
+    get_current_user_optional,
+    get_db,
+    require_role,
+)
+from app.core.pagination import encode_cursor, keyset_page, keyset_statement
+from app.core.principal_cache import Principal
 from app.models.article import Article
 from app.models.comment import Comment
-from app.schemas.comments import CommentCreate, CommentOut
+from app.schemas.comments import (
+    CommentCreate,
+    CommentOut,
+    CommentReplyListOut,
+    CommentThreadListOut,
+    CommentThreadOut,
+)
+from app.services.comments import (
+    article_comment_stats,
+    hidden_in_ancestry,
+    visible_comments,
+)
 from app.services.sanitize import sanitize_html
 
 router = APIRouter(tags=["comments"])
 
+MAX_PER_PAGE = 50
+MAX_REPLIES_PER_PAGE = 100
+MAX_COMMENT_DEPTH = 6
+THREAD_KEYS = (Comment.created_at, Comment.id)
+
+
+def _is_staff(current_user: Principal | None) -> bool:
+    return current_user is not None and current_user.role in ["moderator", "admin"]
+
+
+async def _readable_article(
+    db: AsyncSession, article_id: str, current_user: Principal | None
+) -> Article:
+    article = await db.get(Article, article_id)
+    if not article or (article.status != "published" and not _is_staff(current_user)):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
+    return article
+
+
+def _build_threads(
+    roots: list[Comment], replies: list[Comment], per_root: int
+) -> list[CommentThreadOut]:
+    # Two passes over a flat list: create every node, then attach it to its parent.
+    nodes = {comment.id: CommentThreadOut.model_validate(comment) for comment in roots}
+    kept: dict[str, list[Comment]] = {comment.id: [] for comment in roots}
+    for reply in replies:
+        shown = kept[reply.root_id]
+        if len(shown) == per_root:
+            # The query fetches one reply past the cap to tell whether more exist.
+            root = nodes[reply.root_id]
+            root.has_more_replies = True
+            root.replies_cursor = encode_cursor(
+                [getattr(shown[-1], key.key) for key in THREAD_KEYS]
+            )
+            continue
+        shown.append(reply)
+        nodes[reply.id] = CommentThreadOut.model_validate(reply)
+    for shown in kept.values():
+        for reply in shown:
+            parent = nodes.get(reply.parent_id)
+            # Replies under a hidden comment stay hidden with it.
+            if parent is not None:
+                parent.replies.append(nodes[reply.id])
+    return [nodes[comment.id] for comment in roots]
+
 
 @router.get("/articles/{article_id}/comments", response_model=list[CommentOut])
-def list_comments(
+async def list_comments(
     article_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user=Depends(get_current_user_optional),
 ) -> list[CommentOut]:
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if not article:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
+    await _readable_article(db, article_id, current_user)
 
-    if article.status != "published":
-        if not current_user or current_user.role not in ["moderator", "admin"]:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
+    statement = select(Comment).where(Comment.article_id == article_id)
+    if not _is_staff(current_user):
+        statement = statement.where(Comment.is_hidden.is_(False))
 
-    query = db.query(Comment).filter(Comment.article_id == article_id)
-    if not current_user or current_user.role not in ["moderator", "admin"]:
-        query = query.filter(Comment.is_hidden.is_(False))
+    result = await db.execute(statement.order_by(Comment.created_at.asc()))
+    return result.scalars().all()
 
-    return query.order_by(Comment.created_at.asc()).all()
+
+@router.get("/articles/{article_id}/comments/threads", response_model=CommentThreadListOut)
+async def list_comment_threads(
+    article_id: str,
+    per_page: int = Query(20, ge=1, le=MAX_PER_PAGE),
+    cursor: str | None = Query(default=None),
+    replies_per_page: int = Query(20, ge=1, le=MAX_REPLIES_PER_PAGE),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user=Depends(get_current_user_optional),
+) -> CommentThreadListOut:
+    await _readable_article(db, article_id, current_user)
+    visible = () if _is_staff(current_user) else (Comment.is_hidden.is_(False),)
+
+    statement = select(Comment).where(
+        Comment.article_id == article_id, Comment.parent_id.is_(None), *visible
+    )
+    statement = keyset_statement(statement, THREAD_KEYS, per_page, cursor=cursor)
+    rows = (await db.execute(statement)).scalars().all()
+    roots, next_cursor = keyset_page(rows, THREAD_KEYS, per_page)
+
+    replies: list[Comment] = []
+    if roots:
+        # At most replies_per_page + 1 oldest replies per root. A reply is always
+        # newer than its parent, so the cut never leaves a reply without its parent.
+        ranked = (
+            select(
+                Comment.id,
+                func.row_number()
+                .over(
+                    partition_by=Comment.root_id,
+                    order_by=(Comment.created_at.asc(), Comment.id.asc()),
+                )
+                .label("position"),
+            )
+            .where(Comment.root_id.in_([root.id for root in roots]), *visible)
+            .subquery()
+        )
+        reply_statement = (
+            select(Comment)
+            .join(ranked, ranked.c.id == Comment.id)
+            .where(ranked.c.position <= replies_per_page + 1)
+            .order_by(Comment.created_at.asc(), Comment.id.asc())
+        )
+        replies = list((await db.execute(reply_statement)).scalars().all())
+
+    return CommentThreadListOut(
+        items=_build_threads(roots, replies, replies_per_page),
+        per_page=per_page,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/comments/{comment_id}/replies", response_model=CommentReplyListOut)
+async def list_comment_replies(
+    comment_id: str,
+    per_page: int = Query(20, ge=1, le=MAX_REPLIES_PER_PAGE),
+    cursor: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user=Depends(get_current_user_optional),
+) -> CommentReplyListOut:
+    # Continues a thread past the replies embedded in /comments/threads, oldest first.
+    root = await db.get(Comment, comment_id)
+    staff = _is_staff(current_user)
+    if not root or root.parent_id is not None or (root.is_hidden and not staff):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+    await _readable_article(db, root.article_id, current_user)
+
+    statement = select(Comment).where(Comment.root_id == root.id)
+    if not staff:
+        tree = visible_comments(Comment.id == root.id)
+        statement = statement.where(Comment.id.in_(select(tree.c.id)))
+    statement = keyset_statement(statement, THREAD_KEYS, per_page, cursor=cursor, descending=False)
+    rows = (await db.execute(statement)).scalars().all()
+    items, next_cursor = keyset_page(rows, THREAD_KEYS, per_page)
+    return CommentReplyListOut(
+        items=items,
+        per_page=per_page,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
+    )
+
+
+def _adjust_reply_count(db: Session, comment_id: str, delta: int) -> None:
+    # Single UPDATE so concurrent replies cannot lose increments; updated_at is pinned
+    # because a new reply is not an edit of the parent.
+    db.query(Comment).filter(Comment.id == comment_id).update(
+        {Comment.reply_count: Comment.reply_count + delta, Comment.updated_at: Comment.updated_at},
+        synchronize_session=False,
+    )
 
 
 @router.post(
@@ -50,15 +205,54 @@ def create_comment(
     if not article:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
+    parent = None
+    if payload.parent_id:
+        parent = (
+            db.query(Comment)
+            .filter(
+                Comment.id == payload.parent_id,
+                Comment.article_id == article_id,
+                # A parent under a hidden ancestor is hidden from readers too, and the
+                # comment counters would not count a reply there.
+                ~hidden_in_ancestry(payload.parent_id),
+            )
+            .first()
+        )
+        if not parent:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid parent")
+        if parent.depth >= MAX_COMMENT_DEPTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Thread is too deep"
+            )
+
     comment = Comment(
         article_id=article_id,
         author_id=current_user.id,
         parent_id=payload.parent_id,
+        root_id=(parent.root_id or parent.id) if parent else None,
+        depth=parent.depth + 1 if parent else 0,
         content=sanitize_html(payload.content),
+        # Set here rather than by the server default, which has whole-second precision
+        # on MySQL; the column keeps microseconds there since migration 0011.
+        created_at=datetime.now(timezone.utc),
     )
     db.add(comment)
+    if parent:
+        _adjust_reply_count(db, parent.id, 1)
+    db.query(Article).filter(Article.id == article_id).update(
+        {
+            Article.comment_count: Article.comment_count + 1,
+            Article.last_commented_at: comment.created_at,
+            # Counters are not edits: keep onupdate from touching updated_at.
+            Article.updated_at: Article.updated_at,
+        },
+        synchronize_session=False,
+    )
     db.commit()
     db.refresh(comment)
+    # Only the article detail shows the thread; list pages pick up the new
+    # comment_count when their cache entry expires.
+    cache_invalidate(f"article:{article.slug}")
     return comment
 
 
@@ -72,8 +266,27 @@ def hide_comment(
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
 
+    if comment.is_hidden:
+        return comment
+
+    if comment.parent_id:
+        _adjust_reply_count(db, comment.parent_id, -1)
     comment.is_hidden = True
     db.add(comment)
+    db.flush()
+    # Recounted rather than decremented: the replies under the comment disappear
+    # with it, and hiding below an already hidden comment changes nothing.
+    count, last = article_comment_stats(db, comment.article_id)
+    db.query(Article).filter(Article.id == comment.article_id).update(
+        {
+            Article.comment_count: count,
+            Article.last_commented_at: last,
+            Article.updated_at: Article.updated_at,
+        },
+        synchronize_session=False,
+    )
     db.commit()
     db.refresh(comment)
+    slug = db.query(Article.slug).filter(Article.id == comment.article_id).scalar()
+    cache_invalidate("articles", f"article:{slug}")
     return comment
@@ -1,8 +1,37 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.core.cache import cache_stats
+from app.core.deps import require_role
+from app.core.rate_limit import rate_limit_stats
+from app.core.redis_client import redis_status
+from app.db.session import pool_statistics
 
 router = APIRouter()
 
+# Pool, cache and Redis internals are for operators only; /health stays public for probes.
+admin_only = [Depends(require_role(["admin"]))]
+
 
 @router.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/cache", dependencies=admin_only)
+def health_cache() -> dict[str, object]:
+    return cache_stats()
+
+
+@router.get("/health/db-pool", dependencies=admin_only)
+def health_db_pool() -> dict[str, object]:
+    return pool_statistics()
+
+
+@router.get("/health/rate-limit", dependencies=admin_only)
+def health_rate_limit() -> dict[str, object]:
+    return rate_limit_stats()
+
+
+@router.get("/health/redis", dependencies=admin_only)
+def health_redis() -> dict[str, object]:
+    return redis_status()
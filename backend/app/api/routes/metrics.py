@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, status
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_read_db
+from app.schemas.search import SearchOut
+from app.services.search import search
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+MAX_LIMIT = 50
+
+
+@router.get("", response_model=SearchOut)
+def search_content(
+    q: str = Query(min_length=2, max_length=200),
+    kind: Literal["article", "update"] | None = Query(default=None),
+    limit: int = Query(20, ge=1, le=MAX_LIMIT),
+    db: Session = Depends(get_read_db),
+) -> SearchOut:
+    return SearchOut(query=q, items=search(db, q, kind=kind, limit=limit))
@@ -1,25 +1,45 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, require_role
+from app.core.cache import (
+    cache_get_async,
+    cache_invalidate,
+    cache_set_async,
+    cached_json_response,
+)
+from app.core.deps import get_async_read_db, get_db, require_role, uses_primary
 from app.models.section import Section
 from app.schemas.sections import SectionCreate, SectionOut
+from app.services.revalidate import request_revalidation
 
 router = APIRouter(prefix="/sections", tags=["sections"])
 
+_section_list = TypeAdapter(list[SectionOut])
+
 
 @router.get("", response_model=list[SectionOut])
-def list_sections(db: Session = Depends(get_db)) -> list[SectionOut]:
-    sections = (
-        db.query(Section)
-        .filter(Section.is_visible.is_(True))
-        .order_by(Section.sort_order.asc())
-        .all()
+async def list_sections(
+    db: AsyncSession = Depends(get_async_read_db),
+    primary: bool = Depends(uses_primary),
+) -> list[SectionOut]:
+    cache_key = "sections:list"
+    cached = await cache_get_async(cache_key, bypass=primary)
+    if cached is not None:
+        return cached_json_response(cached[0], hit=True)
+
+    result = await db.execute(
+        select(Section).where(Section.is_visible.is_(True)).order_by(Section.sort_order.asc())
     )
-    return sections
+    sections = result.scalars().all()
+    payload = _section_list.dump_json(_section_list.validate_python(sections, from_attributes=True))
+    await cache_set_async(cache_key, payload, tags=["sections"])
+    return cached_json_response(payload, hit=False)
 
 
 @router.get("/all", response_model=list[SectionOut])
@@ -57,4 +77,6 @@ def create_section(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Slug already exists"
         ) from None
     db.refresh(section)
+    cache_invalidate("sections")
+    request_revalidation("sections")
     return section
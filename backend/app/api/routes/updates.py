@@ -2,16 +2,34 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import (
+    cache_get_async,
+    cache_invalidate,
+    cache_set_async,
+    cached_json_response,
+)
 from app.core.config import settings
-from app.core.deps import get_current_user_optional, get_db, require_role
+from app.core.deps import (
+    get_async_read_db,
+    get_current_user_optional,
+    get_db,
+    require_role,
+    uses_primary,
+)
+from app.core.http_cache import PRIVATE_CACHE_CONTROL, conditional_json_response, entity_headers
+from app.core.ndjson import csv_response, ndjson_response, read_ndjson
+from app.core.pagination import keyset_page, keyset_statement, paginate_keyset
 from app.models.game_update import GameUpdate, GameUpdateAudit
+from app.schemas.base import BulkImportOut
 from app.schemas.updates import (
     MediaUploadOut,
     UpdateAdminListOut,
@@ -23,12 +41,27 @@ from app.schemas.updates import (
     UpdatePublishOut,
     UpdateUpdate,
 )
-from app.services.sanitize import sanitize_html
+from app.services.audit import record_update_audit
+from app.services.bulk import UPDATE_EXPORT_FIELDS, export_rows, import_updates
+from app.services.revalidate import request_revalidation
+from app.services.sanitize import content_fields, sanitize_html
+from app.services.search import index_update
+from app.services.telegram import notify_update_published
 
 router = APIRouter(prefix="/updates", tags=["updates"])
 
 MAX_PER_PAGE = 50
 UPLOAD_CHUNK_SIZE = 1024 * 1024
+FEED_KEYS = (GameUpdate.patch_date, GameUpdate.created_at, GameUpdate.id)
+AUDIT_EXPORT_COLUMNS = (
+    GameUpdateAudit.id,
+    GameUpdateAudit.update_id,
+    GameUpdateAudit.actor_id,
+    GameUpdateAudit.action,
+    GameUpdateAudit.meta.label("metadata"),
+    GameUpdateAudit.created_at,
+)
+AUDIT_EXPORT_FIELDS = tuple(column.key for column in AUDIT_EXPORT_COLUMNS)
 
 
 def _paginate(page: int, per_page: int) -> tuple[int, int]:
@@ -37,58 +70,59 @@ def _paginate(page: int, per_page: int) -> tuple[int, int]:
     return safe_page, safe_per_page
 
 
-def _audit(
-    db: Session,
-    update_id: str,
-    actor_id: str,
-    action: str,
-    metadata: dict[str, Any] | None = None,
-) -> None:
-    entry = GameUpdateAudit(
-        update_id=update_id,
-        actor_id=actor_id,
-        action=action,
-        meta=metadata,
-    )
-    db.add(entry)
-
-
 @router.get("", response_model=UpdateListOut)
-def list_updates(
+async def list_updates(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=MAX_PER_PAGE),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    with_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_read_db),
+    primary: bool = Depends(uses_primary),
 ) -> UpdateListOut:
     page, per_page = _paginate(page, per_page)
-    base_query = db.query(GameUpdate).filter(
+    cache_key = f"updates:list:{page}:{per_page}:{cursor or ''}:{int(with_total)}"
+    cached = await cache_get_async(cache_key, bypass=primary)
+    if cached is not None:
+        return cached_json_response(cached[0], hit=True)
+
+    filters = (
         GameUpdate.status == "published",
         GameUpdate.deleted_at.is_(None),
     )
 
-    total = (
-        db.query(func.count(GameUpdate.id))
-        .filter(
-            GameUpdate.status == "published",
-            GameUpdate.deleted_at.is_(None),
-        )
-        .scalar()
-        or 0
+    total = None
+    if with_total and not cursor:
+        total = await db.scalar(select(func.count(GameUpdate.id)).where(*filters)) or 0
+
+    columns = select(
+        GameUpdate.id,
+        GameUpdate.title,
+        GameUpdate.patch_date,
+        GameUpdate.excerpt,
+        GameUpdate.word_count,
+        GameUpdate.created_at,
     )
-
-    items = (
-        base_query.order_by(GameUpdate.patch_date.desc(), GameUpdate.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
-        .all()
+    statement = keyset_statement(
+        columns.where(*filters),
+        FEED_KEYS,
+        per_page,
+        cursor=cursor,
+        offset=(page - 1) * per_page,
     )
+    rows = (await db.execute(statement)).all()
+    items, next_cursor = keyset_page(rows, FEED_KEYS, per_page)
 
-    return UpdateListOut(
+    result = UpdateListOut(
         items=items,
         total=total,
         page=page,
         per_page=per_page,
-        has_more=(page * per_page) < total,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
     )
+    payload = result.model_dump_json().encode("utf-8")
+    await cache_set_async(cache_key, payload, tags=["updates"])
+    return cached_json_response(payload, hit=False)
 
 
 @router.post("/media", response_model=MediaUploadOut)
@@ -142,13 +176,83 @@ def upload_update_media(
     return MediaUploadOut(url=url, filename=filename, size=size)
 
 
+@router.post("/bulk", response_model=BulkImportOut, status_code=status.HTTP_201_CREATED)
+async def bulk_import_updates(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_role(["moderator", "admin"])),
+) -> BulkImportOut:
+    items = await read_ndjson(request, UpdateCreate)
+    created = await run_in_threadpool(import_updates, db, items, current_user.id)
+    # Both make blocking Redis round trips; keep them off the event loop.
+    await run_in_threadpool(cache_invalidate, "updates")
+    await run_in_threadpool(request_revalidation, "updates")
+    return BulkImportOut(created=created)
+
+
+@router.get("/export")
+def export_updates(
+    db: Session = Depends(get_db),
+    _: object = Depends(require_role(["moderator", "admin"])),
+):
+    rows = export_rows(
+        db,
+        [getattr(GameUpdate, field) for field in UPDATE_EXPORT_FIELDS],
+        GameUpdate.deleted_at.is_(None),
+        order_by=FEED_KEYS,
+    )
+    return ndjson_response(rows, "updates.ndjson")
+
+
+@router.get("/audit/export")
+def export_update_audit(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    update_id: str | None = Query(default=None),
+    actor_id: str | None = Query(default=None),
+    action: str | None = Query(default=None),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    db: Session = Depends(get_db),
+    _: object = Depends(require_role(["moderator", "admin"])),
+):
+    filters = []
+    if update_id:
+        filters.append(GameUpdateAudit.update_id == update_id)
+    if actor_id:
+        filters.append(GameUpdateAudit.actor_id == actor_id)
+    if action:
+        filters.append(GameUpdateAudit.action == action)
+    if since:
+        filters.append(GameUpdateAudit.created_at >= since)
+    if until:
+        filters.append(GameUpdateAudit.created_at < until)
+
+    rows = export_rows(
+        db,
+        AUDIT_EXPORT_COLUMNS,
+        *filters,
+        order_by=(GameUpdateAudit.created_at, GameUpdateAudit.id),
+    )
+    if export_format == "csv":
+        return csv_response(rows, AUDIT_EXPORT_FIELDS, "update-audit.csv")
+    return ndjson_response(rows, "update-audit.ndjson")
+
+
 @router.get("/{update_id}", response_model=UpdatePublicDetail)
-def get_update(
+async def get_update(
     update_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
+    primary: bool = Depends(uses_primary),
     current_user=Depends(get_current_user_optional),
 ) -> UpdatePublicDetail:
-    update = db.query(GameUpdate).filter(GameUpdate.id == update_id).first()
+    cache_key = f"update:{update_id}"
+    cached = await cache_get_async(cache_key, bypass=primary)
+    if cached is not None:
+        payload, headers = cached
+        return conditional_json_response(request, payload, headers, hit=True)
+
+    update = await db.get(GameUpdate, update_id)
     if not update or update.deleted_at is not None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Update not found")
 
@@ -156,7 +260,15 @@ def get_update(
     if update.status != "published" and not is_staff:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Update not found")
 
-    return update
+    payload = UpdatePublicDetail.model_validate(update).model_dump_json().encode("utf-8")
+    headers = entity_headers(payload, update.created_at, update.updated_at, update.published_at)
+    if update.status != "published":
+        return conditional_json_response(
+            request, payload, headers, hit=False, cache_control=PRIVATE_CACHE_CONTROL
+        )
+
+    await cache_set_async(cache_key, payload, tags=[cache_key], headers=headers)
+    return conditional_json_response(request, payload, headers, hit=False)
 
 
 @router.get("/admin/list", response_model=UpdateAdminListOut)
@@ -166,6 +278,8 @@ def list_updates_admin(
     include_deleted: bool = Query(False),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=MAX_PER_PAGE),
+    cursor: str | None = Query(default=None),
+    with_total: bool = Query(True),
     db: Session = Depends(get_db),
     _: object = Depends(require_role(["moderator", "admin"])),
 ) -> UpdateAdminListOut:
@@ -181,12 +295,12 @@ def list_updates_admin(
     if query:
         base_query = base_query.filter(GameUpdate.title.ilike(f"%{query}%"))
 
-    total = base_query.with_entities(func.count(GameUpdate.id)).scalar() or 0
-    items = (
-        base_query.order_by(GameUpdate.patch_date.desc(), GameUpdate.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
-        .all()
+    total = None
+    if with_total and not cursor:
+        total = base_query.with_entities(func.count(GameUpdate.id)).scalar() or 0
+
+    items, next_cursor = paginate_keyset(
+        base_query, FEED_KEYS, per_page, cursor=cursor, offset=(page - 1) * per_page
     )
 
     return UpdateAdminListOut(
@@ -194,7 +308,8 @@ def list_updates_admin(
         total=total,
         page=page,
         per_page=per_page,
-        has_more=(page * per_page) < total,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
     )
 
 
@@ -211,6 +326,7 @@ def create_update(
         content=sanitized,
         status=payload.status,
         created_by_id=current_user.id,
+        **content_fields(sanitized),
     )
 
     if payload.status == "published":
@@ -218,10 +334,11 @@ def create_update(
         update.published_by_id = current_user.id
 
     db.add(update)
-    db.commit()
-    db.refresh(update)
+    # Flush assigns the id so the search row and audit entry share one transaction.
+    db.flush()
 
-    _audit(
+    index_update(db, update)
+    record_update_audit(
         db,
         update.id,
         current_user.id,
@@ -229,7 +346,13 @@ def create_update(
         {"status": update.status, "title": update.title},
     )
     db.commit()
+    db.refresh(update)
+
+    cache_invalidate("updates", f"update:{update.id}")
 
+    request_revalidation("updates", f"update:{update.id}")
+    if update.status == "published":
+        notify_update_published(update.title)
     return update
 
 
@@ -250,6 +373,9 @@ def update_update(
         update.patch_date = payload.patch_date
     if payload.content is not None:
         update.content = sanitize_html(payload.content)
+        for field, value in content_fields(update.content).items():
+            setattr(update, field, value)
+    newly_published = payload.status == "published" and update.status != "published"
     if payload.status is not None:
         update.status = payload.status
         if payload.status == "published":
@@ -260,11 +386,9 @@ def update_update(
             update.published_by_id = None
 
     update.updated_by_id = current_user.id
-    db.add(update)
-    db.commit()
-    db.refresh(update)
 
-    _audit(
+    index_update(db, update)
+    record_update_audit(
         db,
         update.id,
         current_user.id,
@@ -272,7 +396,13 @@ def update_update(
         {"status": update.status, "title": update.title},
     )
     db.commit()
+    db.refresh(update)
+
+    cache_invalidate("updates", f"update:{update.id}")
 
+    request_revalidation("updates", f"update:{update.id}")
+    if newly_published:
+        notify_update_published(update.title)
     return update
 
 
@@ -286,16 +416,21 @@ def publish_update(
     if not update or update.deleted_at is not None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Update not found")
 
+    newly_published = update.status != "published"
     update.status = "published"
     update.published_at = datetime.now(timezone.utc)
     update.published_by_id = current_user.id
     update.updated_by_id = current_user.id
-    db.add(update)
-    db.commit()
 
-    _audit(db, update.id, current_user.id, "publish", {"title": update.title})
+    index_update(db, update)
+    record_update_audit(db, update.id, current_user.id, "publish", {"title": update.title})
     db.commit()
 
+    cache_invalidate("updates", f"update:{update.id}")
+
+    request_revalidation("updates", f"update:{update.id}")
+    if newly_published:
+        notify_update_published(update.title)
     return UpdatePublishOut(status="published", published_at=update.published_at)
 
 
@@ -313,12 +448,14 @@ def unpublish_update(
     update.published_at = None
     update.published_by_id = None
     update.updated_by_id = current_user.id
-    db.add(update)
-    db.commit()
 
-    _audit(db, update.id, current_user.id, "unpublish", {"title": update.title})
+    index_update(db, update)
+    record_update_audit(db, update.id, current_user.id, "unpublish", {"title": update.title})
     db.commit()
 
+    cache_invalidate("updates", f"update:{update.id}")
+
+    request_revalidation("updates", f"update:{update.id}")
     return UpdatePublishOut(status="draft", published_at=None)
 
 
@@ -334,12 +471,14 @@ def delete_update(
 
     update.deleted_at = datetime.now(timezone.utc)
     update.updated_by_id = current_user.id
-    db.add(update)
-    db.commit()
 
-    _audit(db, update.id, current_user.id, "delete", {"title": update.title})
+    index_update(db, update)
+    record_update_audit(db, update.id, current_user.id, "delete", {"title": update.title})
     db.commit()
 
+    cache_invalidate("updates", f"update:{update.id}")
+
+    request_revalidation("updates", f"update:{update.id}")
     return UpdatePublishOut(status="deleted", published_at=update.published_at)
 
 
@@ -355,12 +494,14 @@ def restore_update(
 
     update.deleted_at = None
     update.updated_by_id = current_user.id
-    db.add(update)
-    db.commit()
 
-    _audit(db, update.id, current_user.id, "restore", {"title": update.title})
+    index_update(db, update)
+    record_update_audit(db, update.id, current_user.id, "restore", {"title": update.title})
     db.commit()
 
+    cache_invalidate("updates", f"update:{update.id}")
+
+    request_revalidation("updates", f"update:{update.id}")
     return UpdatePublishOut(status="restored", published_at=update.published_at)
 
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import time
+
 from celery import Celery
+from celery.signals import task_postrun, task_prerun
 
 from app.core.config import settings
+from app.core.metrics import CELERY_TASK_SECONDS
 
 celery_app = Celery(
     "bdm",
@@ -15,7 +19,32 @@ celery_app.conf.beat_schedule = {
     "cleanup-expired-registrations": {
         "task": "app.tasks.cleanup.cleanup_expired_registration_requests",
         "schedule": 900.0,
-    }
+    },
+    "reconcile-article-comment-stats": {
+        "task": "app.tasks.comments.reconcile_article_comment_stats",
+        "schedule": 3600.0,
+    },
 }
+if settings.audit_buffer_enabled:
+    celery_app.conf.beat_schedule["flush-update-audits"] = {
+        "task": "app.tasks.audit.flush_update_audit_buffer",
+        "schedule": settings.audit_flush_interval_sec,
+    }
 
 celery_app.autodiscover_tasks(["app.tasks"])
+
+_task_started: dict[str, float] = {}
+
+
+@task_prerun.connect
+def _task_prerun(task_id=None, **kwargs) -> None:
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _task_postrun(task_id=None, task=None, state=None, **kwargs) -> None:
+    started = _task_started.pop(task_id, None)
+    if started is not None and task is not None:
+        CELERY_TASK_SECONDS.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - started
+        )
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from redis.exceptions import RedisError
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.redis_client import get_async_redis, get_redis, redis_status, report_redis_error
+
+logger = logging.getLogger("bdm.cache")
+
+KEY_PREFIX = "cache:"
+TAG_PREFIX = "cache:tag:"
+MEMORY_MAX_ENTRIES = 1024
+
+CachedEntry = tuple[bytes, dict[str, str]]
+
+_memory_cache: OrderedDict[str, tuple[CachedEntry, float, frozenset[str]]] = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "sets": 0, "invalidations": 0, "errors": 0}
+
+# Tag -> monotonic deadline for the delayed second invalidation (see cache_invalidate).
+_reinvalidate_at: dict[str, float] = {}
+_reinvalidate_cond = threading.Condition()
+_reinvalidate_thread: threading.Thread | None = None
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _stats[name] += 1
+
+
+def _drop_redis(exc: RedisError) -> None:
+    report_redis_error(exc)
+    _count("errors")
+
+
+def _pack(entry: CachedEntry) -> bytes:
+    payload, headers = entry
+    return json.dumps(headers, separators=(",", ":")).encode("utf-8") + b"\n" + payload
+
+
+def _unpack(raw: bytes) -> CachedEntry:
+    header_line, _, payload = raw.partition(b"\n")
+    return payload, json.loads(header_line)
+
+
+def _queue_set(pipe, key: str, entry: CachedEntry, tags: frozenset[str], ttl: int):
+    redis_key = f"{KEY_PREFIX}{key}"
+    pipe.set(redis_key, _pack(entry), ex=ttl)
+    for tag in tags:
+        pipe.sadd(f"{TAG_PREFIX}{tag}", redis_key)
+        pipe.expire(f"{TAG_PREFIX}{tag}", ttl)
+    return pipe
+
+
+def _memory_get(key: str) -> CachedEntry | None:
+    now = time.monotonic()
+    with _lock:
+        entry = _memory_cache.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= now:
+            del _memory_cache[key]
+            return None
+        _memory_cache.move_to_end(key)
+        return value
+
+
+def _memory_set(key: str, value: CachedEntry, tags: frozenset[str], ttl: int) -> None:
+    if settings.cache_memory_ttl_sec <= 0:
+        return
+    expires_at = time.monotonic() + min(ttl, settings.cache_memory_ttl_sec)
+    with _lock:
+        _memory_cache[key] = (value, expires_at, tags)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+
+
+def _memory_invalidate(tags: set[str]) -> None:
+    with _lock:
+        stale = [key for key, (_, _, entry_tags) in _memory_cache.items() if entry_tags & tags]
+        for key in stale:
+            del _memory_cache[key]
+
+
+def cache_get(key: str) -> CachedEntry | None:
+    if not settings.cache_enabled:
+        return None
+
+    value: CachedEntry | None = None
+    client = get_redis()
+    if client:
+        try:
+            raw = client.get(f"{KEY_PREFIX}{key}")
+            value = _unpack(raw) if raw is not None else None
+        except RedisError as exc:
+            _drop_redis(exc)
+            value = _memory_get(key)
+    else:
+        value = _memory_get(key)
+
+    _count("hits" if value is not None else "misses")
+    return value
+
+
+async def cache_get_async(key: str, bypass: bool = False) -> CachedEntry | None:
+    # bypass: the client just wrote and reads from the primary, so a cached copy
+    # could predate its own change.
+    if not settings.cache_enabled or bypass:
+        return None
+
+    value: CachedEntry | None = None
+    client = await get_async_redis()
+    if client:
+        try:
+            raw = await client.get(f"{KEY_PREFIX}{key}")
+            value = _unpack(raw) if raw is not None else None
+        except RedisError as exc:
+            _drop_redis(exc)
+            value = _memory_get(key)
+    else:
+        value = _memory_get(key)
+
+    _count("hits" if value is not None else "misses")
+    return value
+
+
+def cache_set(
+    key: str,
+    payload: bytes,
+    tags: Iterable[str],
+    headers: dict[str, str] | None = None,
+    ttl: int | None = None,
+) -> None:
+    if not settings.cache_enabled:
+        return
+
+    ttl = ttl or settings.cache_ttl_sec
+    tag_set = frozenset(tags)
+    entry: CachedEntry = (payload, dict(headers or {}))
+    _count("sets")
+    client = get_redis()
+    if client:
+        try:
+            _queue_set(client.pipeline(transaction=False), key, entry, tag_set, ttl).execute()
+            return
+        except RedisError as exc:
+            _drop_redis(exc)
+    _memory_set(key, entry, tag_set, ttl)
+
+
+async def cache_set_async(
+    key: str,
+    payload: bytes,
+    tags: Iterable[str],
+    headers: dict[str, str] | None = None,
+    ttl: int | None = None,
+) -> None:
+    if not settings.cache_enabled:
+        return
+
+    ttl = ttl or settings.cache_ttl_sec
+    tag_set = frozenset(tags)
+    entry: CachedEntry = (payload, dict(headers or {}))
+    _count("sets")
+    client = await get_async_redis()
+    if client:
+        try:
+            pipe = _queue_set(client.pipeline(transaction=False), key, entry, tag_set, ttl)
+            await pipe.execute()
+            return
+        except RedisError as exc:
+            _drop_redis(exc)
+    _memory_set(key, entry, tag_set, ttl)
+
+
+def cache_invalidate(*tags: str) -> None:
+    if not tags:
+        return
+
+    _invalidate(tags)
+    if settings.database_replica_url:
+        # A miss served from a lagging replica can re-cache the old row, so drop
+        # the tags again once the replica should have caught up.
+        _schedule_reinvalidation(tags)
+
+
+def _schedule_reinvalidation(tags: tuple[str, ...]) -> None:
+    # One thread per process serves every write; a tag written again only moves
+    # its deadline, so a burst of writes costs a single second pass.
+    global _reinvalidate_thread
+    deadline = time.monotonic() + settings.db_replica_sticky_sec
+    with _reinvalidate_cond:
+        for tag in tags:
+            _reinvalidate_at[tag] = deadline
+        # is_alive() also covers a forked worker, which does not inherit the thread.
+        if _reinvalidate_thread is None or not _reinvalidate_thread.is_alive():
+            _reinvalidate_thread = threading.Thread(
+                target=_run_reinvalidations, name="cache-reinvalidate", daemon=True
+            )
+            _reinvalidate_thread.start()
+        _reinvalidate_cond.notify()
+
+
+def _run_reinvalidations() -> None:
+    while True:
+        with _reinvalidate_cond:
+            while not _reinvalidate_at:
+                _reinvalidate_cond.wait()
+            now = time.monotonic()
+            due = tuple(tag for tag, deadline in _reinvalidate_at.items() if deadline <= now)
+            if not due:
+                _reinvalidate_cond.wait(min(_reinvalidate_at.values()) - now)
+                continue
+            for tag in due:
+                del _reinvalidate_at[tag]
+        _invalidate(due)
+
+
+def _invalidate(tags: tuple[str, ...]) -> None:
+    _count("invalidations")
+    # Local entries may have been written while Redis was unavailable.
+    _memory_invalidate(set(tags))
+    client = get_redis()
+    if not client:
+        return
+    try:
+        tag_keys = [f"{TAG_PREFIX}{tag}" for tag in tags]
+        pipe = client.pipeline(transaction=False)
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        members: set[bytes] = set()
+        for result in pipe.execute():
+            members.update(result)
+        client.delete(*members, *tag_keys)
+    except RedisError as exc:
+        _drop_redis(exc)
+        logger.warning("cache_invalidate_failed tags=%s", ",".join(tags))
+
+
+def cache_clear() -> None:
+    with _lock:
+        _memory_cache.clear()
+    client = get_redis()
+    if not client:
+        return
+    try:
+        keys = list(client.scan_iter(match=f"{KEY_PREFIX}*", count=500))
+        if keys:
+            client.delete(*keys)
+    except RedisError as exc:
+        _drop_redis(exc)
+
+
+def cache_stats() -> dict[str, object]:
+    with _lock:
+        stats: dict[str, object] = dict(_stats)
+        stats["memory_entries"] = len(_memory_cache)
+    stats["enabled"] = settings.cache_enabled
+    stats["backend"] = "redis" if redis_status()["state"] == "closed" else "memory"
+    return stats
+
+
+def cached_json_response(
+    payload: bytes, hit: bool, headers: dict[str, str] | None = None
+) -> Response:
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={**(headers or {}), "X-Cache": "HIT" if hit else "MISS"},
+    )
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_uri(database_uri: str) -> str:
+    scheme, separator, rest = database_uri.partition("://")
+    driver = ASYNC_DRIVERS.get(scheme, scheme)
+    return f"{driver}{separator}{rest}"
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -12,6 +26,9 @@ class Settings(BaseSettings):
     app_env: str = Field("production", alias="APP_ENV")
     base_url: str = Field("http://localhost:3000", alias="BASE_URL")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
+    log_format: Literal["text", "json"] = Field("text", alias="LOG_FORMAT")
+    log_sample_rate: float = Field(1.0, ge=0.0, le=1.0, alias="LOG_SAMPLE_RATE")
+    log_slow_request_ms: float = Field(1000.0, alias="LOG_SLOW_REQUEST_MS")
 
     db_host: str = Field("127.0.0.1", alias="DB_HOST")
     db_port: int = Field(3306, alias="DB_PORT")
@@ -20,8 +37,41 @@ class Settings(BaseSettings):
     db_password: str = Field("", alias="DB_PASSWORD")
 
     database_url: str | None = Field(default=None, alias="DATABASE_URL")
+    async_database_url: str | None = Field(default=None, alias="ASYNC_DATABASE_URL")
+    database_replica_url: str | None = Field(default=None, alias="DATABASE_REPLICA_URL")
+    db_replica_sticky_sec: int = Field(5, alias="DB_REPLICA_STICKY_SEC")
+
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_sec: float = Field(30.0, alias="DB_POOL_TIMEOUT_SEC")
+    db_pool_recycle_sec: int = Field(1800, alias="DB_POOL_RECYCLE_SEC")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
 
     redis_url: str = Field("redis://127.0.0.1:6379/0", alias="REDIS_URL")
+    redis_max_connections: int = Field(50, alias="REDIS_MAX_CONNECTIONS")
+
+    cache_enabled: bool = Field(True, alias="CACHE_ENABLED")
+    cache_ttl_sec: int = Field(300, alias="CACHE_TTL_SEC")
+    # Per-worker fallback while Redis is down: invalidation cannot reach other
+    # workers, so their copies may stay stale for up to this long.
+    cache_memory_ttl_sec: int = Field(3, ge=0, le=10, alias="CACHE_MEMORY_TTL_SEC")
+
+    user_cache_ttl_sec: int = Field(10, alias="USER_CACHE_TTL_SEC")
+
+    metrics_enabled: bool = Field(True, alias="METRICS_ENABLED")
+    # Comma-separated multiprocess directories of other services (Celery) merged into /metrics.
+    metrics_merge_dirs: str = Field("", alias="METRICS_MERGE_DIRS")
+    frontend_revalidate_url: str = Field("", alias="FRONTEND_REVALIDATE_URL")
+    frontend_revalidate_secret: str = Field("", alias="FRONTEND_REVALIDATE_SECRET")
+    revalidate_debounce_sec: float = Field(2.0, alias="REVALIDATE_DEBOUNCE_SEC")
+    bulk_max_items: int = Field(5000, alias="BULK_MAX_ITEMS")
+    bulk_max_mb: int = Field(20, alias="BULK_MAX_MB")
+    bulk_sanitize_workers: int = Field(4, alias="BULK_SANITIZE_WORKERS")
+    audit_buffer_enabled: bool = Field(False, alias="AUDIT_BUFFER_ENABLED")
+    audit_flush_interval_sec: float = Field(5.0, alias="AUDIT_FLUSH_INTERVAL_SEC")
+    query_debug: bool = Field(False, alias="QUERY_DEBUG")
+    query_repeat_warn: int = Field(5, alias="QUERY_REPEAT_WARN")
+
     cors_allow_origins: str | None = Field(default=None, alias="CORS_ALLOW_ORIGINS")
 
     jwt_secret: str = Field("CHANGE_ME", alias="JWT_SECRET")
@@ -36,6 +86,9 @@ class Settings(BaseSettings):
     telegram_confirm_token: str = Field("", alias="TELEGRAM_CONFIRM_TOKEN")
     tg_confirm_code_ttl_min: int = Field(10, alias="TG_CONFIRM_CODE_TTL_MIN")
     tg_confirm_max_attempts: int = Field(5, alias="TG_CONFIRM_MAX_ATTEMPTS")
+    telegram_global_rate: int = Field(30, alias="TELEGRAM_GLOBAL_RATE")
+    telegram_chat_rate: int = Field(1, alias="TELEGRAM_CHAT_RATE")
+    telegram_notify_updates: bool = Field(False, alias="TELEGRAM_NOTIFY_UPDATES")
 
     installer_enabled: bool = Field(False, alias="INSTALLER_ENABLED")
     installer_token: str = Field("", alias="INSTALLER_TOKEN")
@@ -50,6 +103,11 @@ class Settings(BaseSettings):
 
     rate_limit_enabled: bool = Field(True, alias="RATE_LIMIT_ENABLED")
     rate_limit_window_sec: int = Field(60, alias="RATE_LIMIT_WINDOW_SEC")
+    rate_limit_algorithm: Literal["sliding_log", "token_bucket"] = Field(
+        "sliding_log", alias="RATE_LIMIT_ALGORITHM"
+    )
+    rate_limit_scope_algorithms: str = Field("", alias="RATE_LIMIT_SCOPE_ALGORITHMS")
+    rate_limit_memory_max_keys: int = Field(10000, alias="RATE_LIMIT_MEMORY_MAX_KEYS")
     rate_limit_login_max: int = Field(10, alias="RATE_LIMIT_LOGIN_MAX")
     rate_limit_register_max: int = Field(5, alias="RATE_LIMIT_REGISTER_MAX")
     rate_limit_confirm_max: int = Field(10, alias="RATE_LIMIT_CONFIRM_MAX")
@@ -63,6 +121,16 @@ class Settings(BaseSettings):
             f"{self.db_name}?charset=utf8mb4"
         )
 
+    def sqlalchemy_async_database_uri(self) -> str:
+        if self.async_database_url:
+            return self.async_database_url
+        return to_async_uri(self.sqlalchemy_database_uri())
+
+    def sqlalchemy_async_replica_uri(self) -> str | None:
+        if not self.database_replica_url:
+            return None
+        return to_async_uri(self.database_replica_url)
+
 
 settings = Settings()
 
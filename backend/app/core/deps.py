@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.principal_cache import (
+    Principal,
+    get_principal,
+    get_principal_async,
+    store_principal,
+)
 from app.core.security import decode_token
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal, SessionLocal
 from app.models.user import User
 
+PRIMARY_STICKY_COOKIE = "db_primary"
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -19,11 +29,40 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _reads_from_replica(request: Request) -> bool:
+    # Clients that just wrote stay on the primary until the sticky cookie expires.
+    return request.cookies.get(PRIMARY_STICKY_COOKIE) is None
+
+
+def uses_primary(request: Request) -> bool:
+    return not _reads_from_replica(request)
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    db = SessionLocal()
+    db.read_only = _reads_from_replica(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        db.sync_session.read_only = _reads_from_replica(request)
+        yield db
+
+
 def _get_token_from_cookie(request: Request, cookie_name: str) -> str | None:
     return request.cookies.get(cookie_name)
 
 
-def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> Principal:
     token = _get_token_from_cookie(request, settings.access_cookie_name)
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -42,14 +81,20 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user or not user.is_active:
+    principal = get_principal(user_id)
+    if principal is None:
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User inactive")
+        principal = store_principal(user)
+
+    if not principal.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User inactive")
 
-    return user
+    return principal
 
 
-def get_current_user_optional(request: Request, db: Session = Depends(get_db)) -> User | None:
+def _optional_user_id(request: Request) -> str | None:
     token = _get_token_from_cookie(request, settings.access_cookie_name)
     if not token:
         return None
@@ -66,15 +111,31 @@ def get_current_user_optional(request: Request, db: Session = Depends(get_db)) -
     if not isinstance(user_id, str):
         return None
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user or not user.is_active:
+    return user_id
+
+
+async def get_current_user_optional(
+    request: Request, db: AsyncSession = Depends(get_async_read_db)
+) -> Principal | None:
+    user_id = _optional_user_id(request)
+    if user_id is None:
+        return None
+
+    principal = await get_principal_async(user_id)
+    if principal is None:
+        user = (await db.execute(select(User).where(User.id == user_id))).scalars().first()
+        if not user:
+            return None
+        principal = store_principal(user)
+
+    if not principal.is_active:
         return None
 
-    return user
+    return principal
 
 
 def require_role(roles: list[str]):
-    def _role_checker(current_user: User = Depends(get_current_user)) -> User:
+    def _role_checker(current_user: Principal = Depends(get_current_user)) -> Principal:
         if current_user.role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions"
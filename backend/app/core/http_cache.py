@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from starlette.responses import Response
+
+from app.core.cache import cached_json_response
+
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def entity_headers(payload: bytes, *timestamps: datetime | None) -> dict[str, str]:
+    headers = {"ETag": f'"{hashlib.sha256(payload).hexdigest()[:32]}"'}
+    known = [_as_utc(value) for value in timestamps if value is not None]
+    if known:
+        headers["Last-Modified"] = format_datetime(max(known).replace(microsecond=0), usegmt=True)
+    return headers
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(request: Request, headers: dict[str, str]) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        etag = headers.get("ETag")
+        return bool(etag) and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    last_modified = headers.get("Last-Modified")
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return parsedate_to_datetime(last_modified) <= _as_utc(since)
+
+
+def conditional_json_response(
+    request: Request,
+    payload: bytes,
+    headers: dict[str, str],
+    hit: bool,
+    cache_control: str = PUBLIC_CACHE_CONTROL,
+) -> Response:
+    response_headers = {"Cache-Control": cache_control, **headers}
+    if is_not_modified(request, headers):
+        response_headers["X-Cache"] = "HIT" if hit else "MISS"
+        return Response(status_code=304, headers=response_headers)
+    return cached_json_response(payload, hit=hit, headers=response_headers)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import settings
+
+REQUEST_FIELDS = ("request_id", "method", "path", "status_code", "duration_ms", "client_ip")
+
+TEXT_FORMAT = (
+    "%(asctime)s %(levelname)s %(name)s %(message)s "
+    "request_id=%(request_id)s method=%(method)s path=%(path)s "
+    "status=%(status_code)s duration_ms=%(duration_ms)s client_ip=%(client_ip)s"
+)
+
+# Attributes every LogRecord has; anything else was passed through `extra`.
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)).keys()
+) | {"message", "asctime"}
+
+_listener: QueueListener | None = None
+
+
+class _DefaultLogFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key in REQUEST_FIELDS:
+            if not hasattr(record, key):
+                setattr(record, key, "-")
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, object] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and value is not None:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+class _QueueHandler(QueueHandler):
+    # Keep structured extras intact: only merge args and render the traceback,
+    # the listener thread applies the real formatter.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging() -> None:
+    global _listener
+    if _listener is not None:
+        return
+
+    handler = logging.StreamHandler()
+    if settings.log_format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        handler.addFilter(_DefaultLogFilter())
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [_QueueHandler(log_queue)]
+    root.setLevel(settings.log_level.upper())
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def should_log_request(method: str, status_code: int, duration_ms: float) -> bool:
+    # Successful reads, 304 revalidations included, are sampled; writes, errors
+    # and slow requests are always kept.
+    if status_code >= 400 or method not in ("GET", "HEAD"):
+        return True
+    if duration_ms >= settings.log_slow_request_ms:
+        return True
+    rate = settings.log_sample_rate
+    return rate >= 1.0 or random.random() < rate
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import glob
+import os
+
+from fastapi import Request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from app.core.config import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+TASK_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "bdm_http_requests_total",
+    "HTTP requests by route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "bdm_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_DB_QUERIES = Histogram(
+    "bdm_http_request_db_queries",
+    "SQL statements executed per HTTP request.",
+    ["route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_DB_SECONDS = Histogram(
+    "bdm_http_request_db_seconds",
+    "Total SQL time per HTTP request.",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_SECONDS = Histogram(
+    "bdm_db_query_duration_seconds",
+    "Duration of individual SQL statements.",
+    buckets=FAST_BUCKETS,
+)
+REDIS_COMMAND_SECONDS = Histogram(
+    "bdm_redis_command_duration_seconds",
+    "Redis command latency.",
+    ["command"],
+    buckets=FAST_BUCKETS,
+)
+CELERY_TASK_SECONDS = Histogram(
+    "bdm_celery_task_duration_seconds",
+    "Celery task run time.",
+    ["task", "state"],
+    buckets=TASK_BUCKETS,
+)
+
+
+def route_template(request: Request) -> str:
+    # Label by the matched template ("/api/articles/{slug}") to keep cardinality bounded.
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def observe_request(
+    request: Request,
+    status_code: int,
+    duration_sec: float,
+    db_queries: int,
+    db_seconds: float,
+) -> None:
+    route = route_template(request)
+    HTTP_REQUESTS.labels(request.method, route, str(status_code)).inc()
+    HTTP_LATENCY.labels(request.method, route).observe(duration_sec)
+    HTTP_DB_QUERIES.labels(route).observe(db_queries)
+    HTTP_DB_SECONDS.labels(route).observe(db_seconds)
+
+
+class _MultiDirCollector:
+    # Each service owns its multiprocess directory so a restart only wipes its own
+    # files; the scrape merges this service's directory with METRICS_MERGE_DIRS.
+    def __init__(self, paths: list[str]):
+        self._paths = paths
+
+    def collect(self):
+        files = [file for path in self._paths for file in glob.glob(os.path.join(path, "*.db"))]
+        return multiprocess.MultiProcessCollector.merge(files, accumulate=True)
+
+
+def _merge_dirs() -> list[str]:
+    return [path.strip() for path in settings.metrics_merge_dirs.split(",") if path.strip()]
+
+
+def render_metrics() -> tuple[bytes, str]:
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        # Each gunicorn/celery process writes its own files; merge them per scrape.
+        registry = CollectorRegistry()
+        registry.register(_MultiDirCollector([multiproc_dir, *_merge_dirs()]))
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TypeVar
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel, ValidationError
+from starlette.responses import StreamingResponse
+
+from app.core.config import settings
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+MAX_LINE_ERRORS = 50
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+async def read_ndjson(request: Request, model: type[ModelT]) -> list[ModelT]:
+    # Validate the whole stream before anything is written; errors carry line numbers.
+    max_bytes = settings.bulk_max_mb * 1024 * 1024
+    items: list[ModelT] = []
+    errors: list[dict[str, object]] = []
+    size = 0
+    line_no = 0
+    buffer = bytearray()
+
+    def parse(line: bytes) -> None:
+        nonlocal line_no
+        line_no += 1
+        if not line.strip():
+            return
+        if len(items) + len(errors) >= settings.bulk_max_items:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.bulk_max_items} items per request",
+            )
+        try:
+            items.append(model.model_validate_json(line))
+        except ValidationError as exc:
+            if len(errors) < MAX_LINE_ERRORS:
+                errors.append({"line": line_no, "errors": exc.errors(include_url=False)})
+
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Payload too large"
+            )
+        # Only the new bytes are searched for newlines, so a line spread over many
+        # chunks is not rescanned (or recopied) on every chunk.
+        start = 0
+        search_from = len(buffer)
+        buffer += chunk
+        newline = buffer.find(b"\n", search_from)
+        while newline != -1:
+            parse(bytes(buffer[start:newline]))
+            start = newline + 1
+            newline = buffer.find(b"\n", start)
+        del buffer[:start]
+    parse(bytes(buffer))
+
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=errors)
+    if not items:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No items")
+    return items
+
+
+def _lines(rows: Iterable[dict]) -> Iterator[bytes]:
+    for row in rows:
+        yield json.dumps(row, default=str, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def ndjson_response(rows: Iterable[dict], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        _lines(rows),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _csv_value(value: object) -> object:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _csv_lines(rows: Iterable[dict], fields: Sequence[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow([_csv_value(row[field]) for field in fields])
+        # One small chunk per row keeps memory flat however many rows there are.
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def csv_response(rows: Iterable[dict], fields: Sequence[str], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        _csv_lines(rows, fields),
+        media_type=CSV_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _encode_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: object) -> object:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("Unknown cursor value")
+    return value
+
+
+def encode_cursor(values: Sequence[object]) -> str:
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _expected_type(key) -> type | None:
+    try:
+        return key.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _matches(value: object, expected: type | None) -> bool:
+    # Only scalar values of the key column's type may reach SQL; bool is an int
+    # subclass and datetime a date subclass, so both are checked exactly.
+    if value is None or isinstance(value, bool):
+        return False
+    if not isinstance(value, (str, int, float, date, datetime)):
+        return False
+    if expected is None:
+        return True
+    if expected is date:
+        return type(value) is date
+    if expected is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, keys: Sequence) -> list[object]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(raw, list) or len(raw) != len(keys):
+            raise ValueError("Invalid cursor size")
+        values = [_decode_value(value) for value in raw]
+        if not all(_matches(value, _expected_type(key)) for value, key in zip(values, keys)):
+            raise ValueError("Invalid cursor value")
+        return values
+    except (ValueError, TypeError, KeyError, binascii.Error, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from None
+
+
+def keyset_after(
+    columns: Sequence[ColumnElement], values: Sequence[object], descending: bool = True
+) -> ColumnElement:
+    # Expanded form of (a, b, c) < (x, y, z) for descending keysets (> for ascending);
+    # row-value comparisons are not reliably index-driven on MySQL/MariaDB.
+    clauses = []
+    for index, column in enumerate(columns):
+        prefix = [columns[i] == values[i] for i in range(index)]
+        bound = column < values[index] if descending else column > values[index]
+        clauses.append(and_(*prefix, bound))
+    return or_(*clauses)
+
+
+def keyset_statement(
+    statement,
+    keys: Sequence,
+    per_page: int,
+    cursor: str | None = None,
+    offset: int = 0,
+    descending: bool = True,
+):
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        statement = statement.filter(keyset_after(keys, values, descending=descending))
+    statement = statement.order_by(*(key.desc() if descending else key.asc() for key in keys))
+    if offset and not cursor:
+        statement = statement.offset(offset)
+    return statement.limit(per_page + 1)
+
+
+def keyset_page(rows: Sequence, keys: Sequence, per_page: int) -> tuple[list, str | None]:
+    items = list(rows[:per_page])
+    next_cursor = None
+    if len(rows) > per_page and items:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, key.key) for key in keys])
+    return items, next_cursor
+
+
+def paginate_keyset(
+    query,
+    keys: Sequence,
+    per_page: int,
+    cursor: str | None = None,
+    offset: int = 0,
+) -> tuple[list, str | None]:
+    rows = keyset_statement(query, keys, per_page, cursor=cursor, offset=offset).all()
+    return keyset_page(rows, keys, per_page)
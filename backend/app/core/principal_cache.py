@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.core.redis_client import get_async_redis, get_redis, report_redis_error
+from app.models.user import User
+
+EPOCH_KEY = "principal:epoch"
+EPOCH_CHECK_SEC = 1.0
+MAX_ENTRIES = 4096
+PRINCIPAL_FIELDS = ("username", "role", "telegram_id", "is_active")
+_PENDING_KEY = "principal_invalidations"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: str
+    username: str
+    role: str
+    telegram_id: str | None
+    is_active: bool
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> Principal:
+        return cls(
+            id=user.id,
+            username=user.username,
+            role=user.role,
+            telegram_id=user.telegram_id,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+
+_principals: OrderedDict[str, tuple[Principal, float]] = OrderedDict()
+_lock = threading.Lock()
+_epoch: int | None = None
+_epoch_checked_at = 0.0
+
+
+def _epoch_due(now: float) -> bool:
+    global _epoch_checked_at
+    if now - _epoch_checked_at < EPOCH_CHECK_SEC:
+        return False
+    _epoch_checked_at = now
+    return True
+
+
+def _apply_epoch(raw: bytes | str | None) -> None:
+    # Other workers bump the shared epoch on role/is_active changes; seeing a new
+    # value drops every local entry, which is cheap because such changes are rare.
+    global _epoch
+    epoch = int(raw) if raw is not None else 0
+    with _lock:
+        if _epoch is not None and epoch != _epoch:
+            _principals.clear()
+        _epoch = epoch
+
+
+def _sync_epoch(now: float) -> None:
+    if not _epoch_due(now):
+        return
+    client = get_redis()
+    if not client:
+        return
+    try:
+        raw = client.get(EPOCH_KEY)
+    except RedisError as exc:
+        report_redis_error(exc)
+        return
+    _apply_epoch(raw)
+
+
+async def _sync_epoch_async(now: float) -> None:
+    if not _epoch_due(now):
+        return
+    client = await get_async_redis()
+    if not client:
+        return
+    try:
+        raw = await client.get(EPOCH_KEY)
+    except RedisError as exc:
+        report_redis_error(exc)
+        return
+    _apply_epoch(raw)
+
+
+def _cached(user_id: str, now: float) -> Principal | None:
+    with _lock:
+        entry = _principals.get(user_id)
+        if entry is None:
+            return None
+        principal, expires_at = entry
+        if expires_at <= now:
+            del _principals[user_id]
+            return None
+        _principals.move_to_end(user_id)
+        return principal
+
+
+def get_principal(user_id: str) -> Principal | None:
+    if settings.user_cache_ttl_sec <= 0:
+        return None
+
+    now = time.monotonic()
+    _sync_epoch(now)
+    return _cached(user_id, now)
+
+
+async def get_principal_async(user_id: str) -> Principal | None:
+    # Same as get_principal, without blocking the event loop on the epoch read.
+    if settings.user_cache_ttl_sec <= 0:
+        return None
+
+    now = time.monotonic()
+    await _sync_epoch_async(now)
+    return _cached(user_id, now)
+
+
+def store_principal(user: User) -> Principal:
+    principal = Principal.from_user(user)
+    if settings.user_cache_ttl_sec <= 0:
+        return principal
+
+    expires_at = time.monotonic() + settings.user_cache_ttl_sec
+    with _lock:
+        _principals[principal.id] = (principal, expires_at)
+        _principals.move_to_end(principal.id)
+        while len(_principals) > MAX_ENTRIES:
+            _principals.popitem(last=False)
+    return principal
+
+
+def invalidate_principals(*user_ids: str) -> None:
+    with _lock:
+        for user_id in user_ids:
+            _principals.pop(user_id, None)
+    client = get_redis()
+    if not client:
+        return
+    try:
+        client.incr(EPOCH_KEY)
+    except RedisError as exc:
+        report_redis_error(exc)
+
+
+def clear_principal_cache() -> None:
+    global _epoch, _epoch_checked_at
+    with _lock:
+        _principals.clear()
+        _epoch = None
+        _epoch_checked_at = 0.0
+
+
+def _mark_changed(target: User) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in PRINCIPAL_FIELDS):
+        _mark_changed(target)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    _mark_changed(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    # Invalidate only after commit so a concurrent request cannot re-cache the old row.
+    user_ids = session.info.pop(_PENDING_KEY, None)
+    if user_ids:
+        invalidate_principals(*user_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,16 +1,111 @@
 from __future__ import annotations
 
+import math
 import threading
 import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 
 from fastapi import HTTPException, Request, status
 from redis import Redis
 from redis.exceptions import RedisError
 
 from app.core.config import settings
+from app.core.redis_client import get_redis, redis_status, report_redis_error
 
-_redis_client: Redis | None = None
-_memory_cache: dict[str, tuple[int, float]] = {}
+SLIDING_LOG = "sliding_log"
+TOKEN_BUCKET = "token_bucket"
+ALGORITHMS = (SLIDING_LOG, TOKEN_BUCKET)
+
+# Both scripts return {allowed, remaining, reset_ms} in a single round trip and
+# always refresh the TTL, so no key can outlive its window. When a request is
+# denied, reset_ms is the wait until the next request would be allowed.
+SLIDING_LOG_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local now = redis.call("TIME")
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+redis.call("ZREMRANGEBYSCORE", key, "-inf", now_ms - window_ms)
+local count = redis.call("ZCARD", key)
+local allowed = 0
+if count < limit then
+  redis.call("ZADD", key, now_ms, ARGV[3])
+  count = count + 1
+  allowed = 1
+end
+redis.call("PEXPIRE", key, window_ms)
+local reset_ms = window_ms
+local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+if oldest[2] then
+  reset_ms = tonumber(oldest[2]) + window_ms - now_ms
+end
+return {allowed, limit - count, reset_ms}
+"""
+
+TOKEN_BUCKET_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local rate = capacity / window_ms
+local now = redis.call("TIME")
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local state = redis.call("HMGET", key, "tokens", "ts")
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now_ms
+tokens = math.min(capacity, tokens + math.max(0, now_ms - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+redis.call("HSET", key, "tokens", tostring(tokens), "ts", now_ms)
+redis.call("PEXPIRE", key, window_ms)
+local missing = capacity - tokens
+if allowed == 0 then
+  missing = 1 - tokens
+end
+return {allowed, math.floor(tokens), math.ceil(missing / rate)}
+"""
+
+_LUA_SOURCES = {SLIDING_LOG: SLIDING_LOG_LUA, TOKEN_BUCKET: TOKEN_BUCKET_LUA}
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_sec: int
+
+    def headers(self) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(self.remaining, 0)),
+            "X-RateLimit-Reset": str(self.reset_sec),
+        }
+
+
+def _parse_scope_algorithms(value: str) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for item in value.split(","):
+        scope, _, algorithm = item.strip().partition("=")
+        if not scope or not algorithm:
+            continue
+        if algorithm.strip() not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm for {scope}: {algorithm}")
+        mapping[scope.strip()] = algorithm.strip()
+    return mapping
+
+
+SCOPE_ALGORITHMS = _parse_scope_algorithms(settings.rate_limit_scope_algorithms)
+
+_scripts: dict[str, object] = {}
+_memory_cache: OrderedDict[str, tuple[object, float]] = OrderedDict()
+_memory_stats = {"expired": 0, "evictions": 0}
 _lock = threading.Lock()
 
 
@@ -23,47 +118,137 @@ def _client_id(request: Request) -> str:
     return "unknown"
 
 
-def _get_redis() -> Redis | None:
-    global _redis_client
-    if _redis_client is not None:
-        return _redis_client
-    try:
-        client = Redis.from_url(
-            settings.redis_url,
-            socket_connect_timeout=0.2,
-            socket_timeout=0.2,
-        )
-        client.ping()
-        _redis_client = client
-        return client
-    except Exception:
-        _redis_client = None
-        return None
+def _algorithm_for(scope: str) -> str:
+    return SCOPE_ALGORITHMS.get(scope, settings.rate_limit_algorithm)
+
+
+def _run_script(
+    client: Redis, key: str, algorithm: str, limit: int, window_ms: int
+) -> tuple[int, int, int]:
+    script = _scripts.get(algorithm)
+    if script is None:
+        # Script objects call EVALSHA and only resend the source after NOSCRIPT.
+        script = _scripts[algorithm] = client.register_script(_LUA_SOURCES[algorithm])
+    args = [limit, window_ms]
+    if algorithm == SLIDING_LOG:
+        args.append(uuid.uuid4().hex)
+    allowed, remaining, reset_ms = script(keys=[key], args=args, client=client)
+    return int(allowed), int(remaining), int(reset_ms)
+
 
+def _hit_redis(
+    client: Redis, key: str, algorithm: str, limit: int, window_sec: int
+) -> RateLimitResult:
+    allowed, remaining, reset_ms = _run_script(client, key, algorithm, limit, window_sec * 1000)
+    return RateLimitResult(
+        allowed=bool(allowed),
+        limit=limit,
+        remaining=remaining,
+        reset_sec=max(math.ceil(reset_ms / 1000), 0),
+    )
 
-def _increment_redis(key: str, window_sec: int) -> int | None:
-    client = _get_redis()
+
+def _limit_redis(key: str, algorithm: str, limit: int, window_sec: int) -> RateLimitResult | None:
+    client = get_redis()
     if not client:
         return None
     try:
-        count = int(client.incr(key))
-        if count == 1:
-            client.expire(key, window_sec)
-        return count
-    except RedisError:
+        return _hit_redis(client, key, algorithm, limit, window_sec)
+    except RedisError as exc:
+        report_redis_error(exc)
         return None
 
 
-def _increment_memory(key: str, window_sec: int) -> int:
-    now = time.time()
+def _sliding_log_memory(
+    state: deque[float] | None, now: float, limit: int, window_sec: int
+) -> tuple[deque[float], RateLimitResult]:
+    log = state if state is not None else deque()
+    while log and log[0] <= now - window_sec:
+        log.popleft()
+    allowed = len(log) < limit
+    if allowed:
+        log.append(now)
+    reset = log[0] + window_sec - now if log else window_sec
+    result = RateLimitResult(allowed, limit, limit - len(log), max(math.ceil(reset), 0))
+    return log, result
+
+
+def _token_bucket_memory(
+    state: tuple[float, float] | None, now: float, limit: int, window_sec: int
+) -> tuple[tuple[float, float], RateLimitResult]:
+    rate = limit / window_sec
+    tokens, updated_at = state if state is not None else (float(limit), now)
+    tokens = min(limit, tokens + max(0.0, now - updated_at) * rate)
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    missing = limit - tokens if allowed else 1 - tokens
+    reset = math.ceil(missing / rate)
+    return (tokens, now), RateLimitResult(allowed, limit, math.floor(tokens), reset)
+
+
+def _sweep_memory(now: float) -> None:
+    # Every hit moves its key to the tail with a fresh expiry, so the head holds
+    # the stalest keys; popping expired heads is amortised O(1) per request.
+    while _memory_cache:
+        _, expires_at = next(iter(_memory_cache.values()))
+        if expires_at > now:
+            break
+        _memory_cache.popitem(last=False)
+        _memory_stats["expired"] += 1
+
+
+def _hit_memory(
+    key: str, algorithm: str, limit: int, window_sec: float
+) -> tuple[object, RateLimitResult]:
+    now = time.monotonic()
     with _lock:
-        count, expires_at = _memory_cache.get(key, (0, now + window_sec))
+        _sweep_memory(now)
+        state, expires_at = _memory_cache.pop(key, (None, 0.0))
         if expires_at <= now:
-            count = 0
-            expires_at = now + window_sec
-        count += 1
-        _memory_cache[key] = (count, expires_at)
-        return count
+            state = None
+        if algorithm == TOKEN_BUCKET:
+            state, result = _token_bucket_memory(state, now, limit, window_sec)
+        else:
+            state, result = _sliding_log_memory(state, now, limit, window_sec)
+        _memory_cache[key] = (state, now + window_sec)
+        while len(_memory_cache) > settings.rate_limit_memory_max_keys:
+            _memory_cache.popitem(last=False)
+            _memory_stats["evictions"] += 1
+        return state, result
+
+
+def _limit_memory(key: str, algorithm: str, limit: int, window_sec: int) -> RateLimitResult:
+    return _hit_memory(key, algorithm, limit, window_sec)[1]
+
+
+def acquire_token(key: str, limit: int, window_sec: float) -> float:
+    # For outbound senders: takes a token from a shared bucket and returns 0.0, or
+    # returns the seconds until one is available. Falls back to a per-process bucket.
+    window_ms = max(int(window_sec * 1000), 1)
+    client = get_redis()
+    if client:
+        try:
+            allowed, _, reset_ms = _run_script(client, key, TOKEN_BUCKET, limit, window_ms)
+            return 0.0 if allowed else reset_ms / 1000
+        except RedisError as exc:
+            report_redis_error(exc)
+    (tokens, _), result = _hit_memory(key, TOKEN_BUCKET, limit, window_ms / 1000)
+    return 0.0 if result.allowed else (1 - tokens) * window_ms / 1000 / limit
+
+
+def rate_limit_stats() -> dict[str, object]:
+    with _lock:
+        stats: dict[str, object] = dict(_memory_stats)
+        stats["memory_entries"] = len(_memory_cache)
+    stats["memory_max_entries"] = settings.rate_limit_memory_max_keys
+    stats["backend"] = "redis" if redis_status()["state"] == "closed" else "memory"
+    return stats
+
+
+def rate_limit_clear() -> None:
+    with _lock:
+        _memory_cache.clear()
 
 
 def enforce_rate_limit(
@@ -77,23 +262,25 @@ def enforce_rate_limit(
         return
 
     window = window_sec or settings.rate_limit_window_sec
+    algorithm = _algorithm_for(scope)
     client_id = _client_id(request)
     if identity:
         client_id = f"{client_id}:{identity}"
-    key = f"rl:{scope}:{client_id}"
+    key = f"rl:{scope}:{algorithm}:{client_id}"
 
-    count = _increment_redis(key, window)
-    if count is None:
+    result = _limit_redis(key, algorithm, limit, window)
+    if result is None:
         if settings.app_env == "production":
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Rate limiter unavailable",
             )
-        count = _increment_memory(key, window)
+        result = _limit_memory(key, algorithm, limit, window)
 
-    if count > limit:
+    request.state.rate_limit = result
+    if not result.allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Too many requests",
-            headers={"Retry-After": str(window)},
+            headers={"Retry-After": str(max(result.reset_sec, 1)), **result.headers()},
         )
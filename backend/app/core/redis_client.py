@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+from redis import ConnectionPool, Redis
+from redis import asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.core.config import settings
+from app.core.metrics import REDIS_COMMAND_SECONDS
+
+logger = logging.getLogger("bdm.redis")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+SOCKET_TIMEOUT_SEC = 0.2
+BACKOFF_BASE_SEC = 0.5
+BACKOFF_MAX_SEC = 30.0
+
+
+class CircuitBreaker:
+    def __init__(self, base_sec: float = BACKOFF_BASE_SEC, max_sec: float = BACKOFF_MAX_SEC):
+        self.base_sec = base_sec
+        self.max_sec = max_sec
+        # Start closed: a half-open start would turn away every caller but the
+        # first probe while the process warms up.
+        self.state = CLOSED
+        self.failures = 0
+        self.retry_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str | None:
+        # Returns the state the caller may proceed in, or None while the circuit is open.
+        with self._lock:
+            if self.state == CLOSED:
+                return CLOSED
+            if time.monotonic() < self.retry_at or self._probing:
+                return None
+            self.state = HALF_OPEN
+            self._probing = True
+            return HALF_OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("redis_circuit_closed failures=%s", self.failures)
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def abort_probe(self) -> None:
+        # The probe ended without an answer (e.g. the request was cancelled).
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            delay = min(self.base_sec * 2 ** (self.failures - 1), self.max_sec)
+            self.retry_at = time.monotonic() + delay
+            if self.state != OPEN:
+                logger.warning("redis_circuit_open retry_in_sec=%.1f", delay)
+            self.state = OPEN
+            self._probing = False
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "retry_in_sec": round(max(self.retry_at - time.monotonic(), 0.0), 3),
+            }
+
+
+class _TimedRedis(Redis):
+    def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_SECONDS.labels(str(args[0]).upper()).observe(time.perf_counter() - start)
+
+
+class _TimedAsyncRedis(aioredis.Redis):
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_SECONDS.labels(str(args[0]).upper()).observe(time.perf_counter() - start)
+
+
+breaker = CircuitBreaker()
+
+_pool: ConnectionPool | None = None
+_client: Redis | None = None
+_async_clients: dict[int, _TimedAsyncRedis] = {}
+_client_lock = threading.Lock()
+
+
+def _sync_client() -> Redis:
+    global _pool, _client
+    with _client_lock:
+        if _client is None:
+            _pool = ConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                socket_connect_timeout=SOCKET_TIMEOUT_SEC,
+                socket_timeout=SOCKET_TIMEOUT_SEC,
+            )
+            _client = _TimedRedis(connection_pool=_pool)
+        return _client
+
+
+def _async_client() -> aioredis.Redis:
+    # asyncio connections are bound to the loop that opened them.
+    loop_id = id(asyncio.get_running_loop())
+    client = _async_clients.get(loop_id)
+    if client is None:
+        client = _TimedAsyncRedis.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            socket_connect_timeout=SOCKET_TIMEOUT_SEC,
+            socket_timeout=SOCKET_TIMEOUT_SEC,
+        )
+        _async_clients.clear()
+        _async_clients[loop_id] = client
+    return client
+
+
+def get_redis() -> Redis | None:
+    state = breaker.acquire()
+    if state is None:
+        return None
+    client = _sync_client()
+    if state == HALF_OPEN:
+        try:
+            client.ping()
+        except (RedisError, OSError):
+            breaker.record_failure()
+            return None
+        finally:
+            breaker.abort_probe()
+        breaker.record_success()
+    return client
+
+
+async def get_async_redis() -> aioredis.Redis | None:
+    state = breaker.acquire()
+    if state is None:
+        return None
+    client = _async_client()
+    if state == HALF_OPEN:
+        try:
+            await client.ping()
+        except (RedisError, OSError):
+            breaker.record_failure()
+            return None
+        finally:
+            # A cancelled ping must not leave the breaker waiting on a probe forever.
+            breaker.abort_probe()
+        breaker.record_success()
+    return client
+
+
+def report_redis_error(exc: Exception) -> None:
+    # Only an unreachable server opens the circuit; a rejected command
+    # (ResponseError, NoScriptError, ...) says nothing about availability.
+    if isinstance(exc, (RedisConnectionError, RedisTimeoutError, OSError)):
+        breaker.record_failure()
+
+
+def redis_status() -> dict[str, object]:
+    return breaker.snapshot()
@@ -1,4 +1,4 @@
 from app.db.base import Base
-from app.db.session import SessionLocal, engine
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine, engine
 
-__all__ = ["Base", "SessionLocal", "engine"]
+__all__ = ["AsyncSessionLocal", "Base", "SessionLocal", "async_engine", "engine"]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+WAIT_BUCKETS_MS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 5000.0)
+
+
+class PoolWaitStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.timeouts = 0
+
+    def observe(self, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.buckets[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+            self.count += 1
+            self.sum_ms += wait_ms
+            self.max_ms = max(self.max_ms, wait_ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            labels = [f"le_{int(bound)}ms" for bound in WAIT_BUCKETS_MS] + ["le_inf"]
+            cumulative: dict[str, int] = {}
+            running = 0
+            for label, value in zip(labels, self.buckets):
+                running += value
+                cumulative[label] = running
+            return {
+                "count": self.count,
+                "sum_ms": round(self.sum_ms, 3),
+                "max_ms": round(self.max_ms, 3),
+                "timeouts": self.timeouts,
+                "buckets": cumulative,
+            }
+
+
+class _WaitTimingMixin:
+    # Times how long a checkout waits on the pool queue (including opening a new
+    # connection when the pool is below its limit).
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.wait_stats.observe((time.perf_counter() - start) * 1000, timed_out)
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(pool: Pool) -> dict[str, object]:
+    status: dict[str, object] = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "timeout_sec": pool.timeout(),
+            }
+        )
+    wait_stats = getattr(pool, "wait_stats", None)
+    if isinstance(wait_stats, PoolWaitStats):
+        status["wait"] = wait_stats.snapshot()
+    return status
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import DB_QUERY_SECONDS
+
+
+@dataclass(slots=True)
+class QueryStats:
+    count: int = 0
+    duration_sec: float = 0.0
+    statements: dict[str, int] | None = field(default=None)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        if not self.statements:
+            return []
+        return [(sql, count) for sql, count in self.statements.items() if count >= threshold]
+
+    def server_timing(self, total_ms: float) -> str:
+        db_ms = self.duration_sec * 1000
+        return f'db;dur={db_ms:.2f};desc="{self.count} queries", app;dur={total_ms:.2f}'
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def query_debug_enabled() -> bool:
+    return settings.query_debug or settings.app_env != "production"
+
+
+@contextmanager
+def track_queries(record_statements: bool = False) -> Iterator[QueryStats]:
+    # Recording statement texts lets the caller spot N+1 patterns (same SQL, many times).
+    stats = QueryStats(statements={} if record_statements else None)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    DB_QUERY_SECONDS.observe(elapsed)
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration_sec += elapsed
+        if stats.statements is not None:
+            stats.statements[statement] = stats.statements.get(statement, 0) + 1
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_status
+from app.db.query_stats import instrument_engine
 
 
-def _build_engine():
-    database_uri = settings.sqlalchemy_database_uri()
+def _pool_kwargs(poolclass: type) -> dict[str, object]:
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_sec,
+        "pool_recycle": settings.db_pool_recycle_sec,
+    }
+
+
+def _build_engine(database_uri: str):
     connect_args: dict[str, object] = {}
     engine_kwargs: dict[str, object] = {
-        "pool_pre_ping": True,
+        "pool_pre_ping": settings.db_pool_pre_ping,
         "future": True,
         "hide_parameters": True,
     }
@@ -24,9 +37,83 @@ def _build_engine():
         connect_args["connect_timeout"] = 5
         connect_args["read_timeout"] = 10
         connect_args["write_timeout"] = 10
+        engine_kwargs.update(_pool_kwargs(InstrumentedQueuePool))
 
-    return create_engine(database_uri, connect_args=connect_args, **engine_kwargs)
+    built = create_engine(database_uri, connect_args=connect_args, **engine_kwargs)
+    instrument_engine(built)
+    return built
 
 
-engine = _build_engine()
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+def _build_async_engine(database_uri: str):
+    connect_args: dict[str, object] = {}
+    engine_kwargs: dict[str, object] = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "hide_parameters": True,
+    }
+
+    if database_uri.startswith("sqlite"):
+        # aiosqlite connections are bound to the loop that opened them.
+        engine_kwargs["poolclass"] = StaticPool if database_uri.endswith(":memory:") else NullPool
+    else:
+        connect_args["connect_timeout"] = 5
+        engine_kwargs.update(_pool_kwargs(InstrumentedAsyncQueuePool))
+
+    built = create_async_engine(database_uri, connect_args=connect_args, **engine_kwargs)
+    instrument_engine(built.sync_engine)
+    return built
+
+
+class RoutingSession(Session):
+    def __init__(self, *args, replica_bind: Engine | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.read_only = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        # Flushes always hit the primary, even from a session marked read-only.
+        if self.read_only and self.replica_bind is not None and not self._flushing:
+            return self.replica_bind
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+engine = _build_engine(settings.sqlalchemy_database_uri())
+replica_engine = (
+    _build_engine(settings.database_replica_url) if settings.database_replica_url else None
+)
+SessionLocal = sessionmaker(
+    bind=engine,
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    replica_bind=replica_engine,
+)
+
+async_engine = _build_async_engine(settings.sqlalchemy_async_database_uri())
+async_replica_uri = settings.sqlalchemy_async_replica_uri()
+async_replica_engine = _build_async_engine(async_replica_uri) if async_replica_uri else None
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    replica_bind=async_replica_engine.sync_engine if async_replica_engine else None,
+)
+
+
+def pool_statistics() -> dict[str, object]:
+    stats: dict[str, object] = {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool),
+        "config": {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout_sec": settings.db_pool_timeout_sec,
+            "pool_recycle_sec": settings.db_pool_recycle_sec,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        },
+    }
+    if replica_engine is not None:
+        stats["replica_sync"] = pool_status(replica_engine.pool)
+    if async_replica_engine is not None:
+        stats["replica_async"] = pool_status(async_replica_engine.sync_engine.pool)
+    return stats
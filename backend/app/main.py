@@ -4,6 +4,8 @@ import asyncio
 import logging
 import time
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import httpx
@@ -17,41 +19,25 @@ from starlette.responses import JSONResponse
 
 from app.api.api import api_router
 from app.core.config import settings
+from app.core.deps import PRIMARY_STICKY_COOKIE
+from app.core.logging_config import configure_logging, should_log_request
+from app.core.metrics import observe_request
+from app.db.query_stats import query_debug_enabled, track_queries
+from app.services.bulk import shutdown_executor
 
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-class _DefaultLogFilter(logging.Filter):
-    def filter(self, record: logging.LogRecord) -> bool:
-        defaults = {
-            "request_id": "-",
-            "method": "-",
-            "path": "-",
-            "status_code": "-",
-            "duration_ms": "-",
-            "client_ip": "-",
-        }
-        for key, value in defaults.items():
-            if not hasattr(record, key):
-                setattr(record, key, value)
-        return True
-
-
-LOG_FORMAT = (
-    "%(asctime)s %(levelname)s %(name)s %(message)s "
-    "request_id=%(request_id)s method=%(method)s path=%(path)s "
-    "status=%(status_code)s duration_ms=%(duration_ms)s client_ip=%(client_ip)s"
-)
-logging.basicConfig(level=settings.log_level.upper(), format=LOG_FORMAT)
-logging.getLogger().addFilter(_DefaultLogFilter())
-
+configure_logging()
 logger = logging.getLogger("bdm")
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    handler.addFilter(_DefaultLogFilter())
-    logger.addHandler(handler)
-    logger.propagate = False
-
-app = FastAPI(title="BDM Knowledge Base")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    shutdown_executor()
+
+
+app = FastAPI(title="BDM Knowledge Base", lifespan=lifespan)
 app.include_router(api_router, prefix="/api")
 
 media_path = Path(settings.media_dir)
@@ -109,7 +95,7 @@ def _error_payload(request: Request, detail: object, code: str) -> dict[str, obj
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     payload = _error_payload(request, exc.detail, f"http_{exc.status_code}")
-    return JSONResponse(status_code=exc.status_code, content=payload)
+    return JSONResponse(status_code=exc.status_code, content=payload, headers=exc.headers)
 
 
 @app.exception_handler(RequestValidationError)
@@ -146,20 +132,56 @@ async def timeout_error_handler(request: Request, exc: asyncio.TimeoutError):
 async def request_logger(request: Request, call_next):
     request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
     request.state.request_id = request_id
-    start = time.time()
-    response = await call_next(request)
-    duration = (time.time() - start) * 1000
-
-    logger.info(
-        "request",
-        extra={
-            "request_id": request_id,
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "duration_ms": round(duration, 2),
-            "client_ip": request.client.host if request.client else None,
-        },
+    start = time.perf_counter_ns()
+    query_debug = query_debug_enabled()
+    with track_queries(record_statements=query_debug) as queries:
+        response = await call_next(request)
+    duration_ms = (time.perf_counter_ns() - start) / 1_000_000
+    observe_request(
+        request,
+        response.status_code,
+        duration_ms / 1000,
+        db_queries=queries.count,
+        db_seconds=queries.duration_sec,
     )
+
+    if should_log_request(request.method, response.status_code, duration_ms):
+        logger.info(
+            "request",
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "duration_ms": round(duration_ms, 2),
+                "client_ip": request.client.host if request.client else None,
+            },
+        )
     response.headers["X-Request-ID"] = request_id
+    if query_debug:
+        response.headers["Server-Timing"] = queries.server_timing(duration_ms)
+        response.headers["X-Query-Count"] = str(queries.count)
+        for statement, count in queries.repeated(settings.query_repeat_warn):
+            logger.warning(
+                "repeated_query count=%s statement=%s",
+                count,
+                " ".join(statement.split())[:200],
+                extra=_log_extra(request),
+            )
+    rate_limit = getattr(request.state, "rate_limit", None)
+    if rate_limit is not None:
+        response.headers.update(rate_limit.headers())
+    if (
+        settings.database_replica_url
+        and request.method not in SAFE_METHODS
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            "1",
+            max_age=settings.db_replica_sticky_sec,
+            httponly=True,
+            samesite="lax",
+            secure=settings.app_env == "production",
+        )
     return response
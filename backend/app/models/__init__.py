@@ -3,6 +3,7 @@ from app.models.comment import Comment
 from app.models.game_update import GameUpdate, GameUpdateAudit
 from app.models.installation_state import InstallationState
 from app.models.registration_request import RegistrationRequest
+from app.models.search_document import SearchDocument
 from app.models.section import Section
 from app.models.user import User
 
@@ -13,6 +14,7 @@ __all__ = [
     "GameUpdateAudit",
     "InstallationState",
     "RegistrationRequest",
+    "SearchDocument",
     "Section",
     "User",
 ]
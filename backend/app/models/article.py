@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -11,12 +11,19 @@ from app.models.utils import generate_uuid
 
 class Article(Base):
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_status_section_published", "status", "section_id", "published_at", "id"),
+        Index("ix_articles_status_published", "status", "published_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     section_id: Mapped[str] = mapped_column(String(36), ForeignKey("sections.id"), index=True)
     slug: Mapped[str] = mapped_column(String(128), unique=True, index=True)
     title: Mapped[str] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text)
+    excerpt: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    word_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    toc: Mapped[list | None] = mapped_column(JSON, nullable=True)
     status: Mapped[str] = mapped_column(
         Enum("draft", "published", "archived", name="article_status", native_enum=False),
         default="draft",
@@ -27,6 +34,11 @@ class Article(Base):
         DateTime(timezone=True), onupdate=func.now(), nullable=True
     )
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Visible comments only; kept in step by the comment routes and reconciled hourly.
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    last_commented_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     section = relationship("Section", back_populates="articles")
     author = relationship("User", back_populates="articles")
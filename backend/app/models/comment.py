@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -11,6 +12,11 @@ from app.models.utils import generate_uuid
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_root_created", "root_id", "created_at"),
+        Index("ix_comments_article_visible", "article_id", "is_hidden", "created_at"),
+        Index("ix_comments_article_roots", "article_id", "parent_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     article_id: Mapped[str] = mapped_column(String(36), ForeignKey("articles.id"), index=True)
@@ -18,9 +24,17 @@ class Comment(Base):
     parent_id: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("comments.id"), nullable=True
     )
+    # Top-level ancestor, so a page of threads loads its replies with one query.
+    root_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    depth: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    reply_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     content: Mapped[str] = mapped_column(Text)
     is_hidden: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Microseconds on MySQL too (migration 0011): thread cursors order by created_at, id.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True).with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        server_default=func.now(),
+    )
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), onupdate=func.now(), nullable=True
     )
@@ -2,7 +2,18 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import JSON, Date, DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -11,11 +22,24 @@ from app.models.utils import generate_uuid
 
 class GameUpdate(Base):
     __tablename__ = "game_updates"
+    __table_args__ = (
+        Index(
+            "ix_game_updates_status_feed",
+            "status",
+            "deleted_at",
+            "patch_date",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     title: Mapped[str] = mapped_column(String(255))
     patch_date: Mapped[date] = mapped_column(Date)
     content: Mapped[str] = mapped_column(Text)
+    excerpt: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    word_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    toc: Mapped[list | None] = mapped_column(JSON, nullable=True)
     status: Mapped[str] = mapped_column(
         Enum("draft", "published", "archived", name="game_update_status", native_enum=False),
         default="draft",
@@ -39,6 +63,7 @@ class GameUpdate(Base):
 
 class GameUpdateAudit(Base):
     __tablename__ = "game_update_audits"
+    __table_args__ = (Index("ix_game_update_audits_update_created", "update_id", "created_at"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     update_id: Mapped[str] = mapped_column(String(36), ForeignKey("game_updates.id"), index=True)
@@ -1,6 +1,18 @@
-from app.schemas.articles import ArticleCreate, ArticleOut, ArticleUpdate
+from app.schemas.articles import (
+    ArticleCreate,
+    ArticleListOut,
+    ArticleOut,
+    ArticleSummaryOut,
+    ArticleUpdate,
+)
 from app.schemas.auth import AuthResponse, LoginIn, RegisterIn, RegisterOut, TelegramConfirmIn
-from app.schemas.comments import CommentCreate, CommentOut
+from app.schemas.base import BulkImportOut, TocEntry
+from app.schemas.comments import (
+    CommentCreate,
+    CommentOut,
+    CommentThreadListOut,
+    CommentThreadOut,
+)
 from app.schemas.install import (
     InstallerAdminIn,
     InstallerChecksOut,
@@ -17,6 +29,7 @@ from app.schemas.install import (
     InstallerStatusOut,
     InstallerStepResult,
 )
+from app.schemas.search import SearchHit, SearchOut
 from app.schemas.sections import SectionCreate, SectionOut
 from app.schemas.updates import (
     MediaUploadOut,
@@ -33,7 +46,9 @@ from app.schemas.updates import (
 
 __all__ = [
     "ArticleCreate",
+    "ArticleListOut",
     "ArticleOut",
+    "ArticleSummaryOut",
     "ArticleUpdate",
     "AuthResponse",
     "LoginIn",
@@ -42,8 +57,14 @@ __all__ = [
     "TelegramConfirmIn",
     "CommentCreate",
     "CommentOut",
+    "CommentThreadListOut",
+    "CommentThreadOut",
+    "SearchHit",
+    "SearchOut",
     "SectionCreate",
     "SectionOut",
+    "BulkImportOut",
+    "TocEntry",
     "InstallerAdminIn",
     "InstallerChecksOut",
     "InstallerFinishOut",
@@ -3,9 +3,20 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_core import PydanticCustomError
 
-from app.schemas.base import StrictBaseModel
+from app.schemas.base import StrictBaseModel, TocEntry
+
+# Static GET routes under /articles; an article with one of these slugs would be unreachable.
+RESERVED_SLUGS = frozenset({"all", "bulk", "export"})
+
+
+def _allowed_slug(value: str | None) -> str | None:
+    if value in RESERVED_SLUGS:
+        # A custom error keeps ctx free of exception objects, so it serializes as JSON.
+        raise PydanticCustomError("slug_reserved", "Slug is reserved")
+    return value
 
 
 class ArticleBase(BaseModel):
@@ -21,6 +32,8 @@ class ArticleInBase(StrictBaseModel):
     title: str = Field(min_length=1, max_length=255)
     content: str
 
+    _check_slug = field_validator("slug")(_allowed_slug)
+
 
 class ArticleCreate(ArticleInBase):
     status: Literal["draft", "published", "archived"] = Field(default="draft")
@@ -33,13 +46,41 @@ class ArticleUpdate(StrictBaseModel):
     content: str | None = None
     status: Literal["draft", "published", "archived"] | None = None
 
+    _check_slug = field_validator("slug")(_allowed_slug)
+
 
 class ArticleOut(ArticleBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: str
+    excerpt: str | None = None
+    word_count: int = 0
+    toc: list[TocEntry] | None = None
     status: str
     author_id: str
+    comment_count: int = 0
+    last_commented_at: datetime | None = None
     created_at: datetime
     updated_at: datetime | None
     published_at: datetime | None
+
+
+class ArticleSummaryOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    slug: str
+    title: str
+    section_id: str
+    excerpt: str | None = None
+    word_count: int = 0
+    comment_count: int = 0
+    last_commented_at: datetime | None = None
+    published_at: datetime | None
+
+
+class ArticleListOut(BaseModel):
+    items: list[ArticleSummaryOut]
+    per_page: int
+    has_more: bool
+    next_cursor: str | None = None
@@ -5,3 +5,12 @@ from pydantic import BaseModel, ConfigDict
 
 class StrictBaseModel(BaseModel):
     model_config = ConfigDict(extra="forbid", strict=True)
+
+
+class TocEntry(BaseModel):
+    level: int
+    title: str
+
+
+class BulkImportOut(BaseModel):
+    created: int
@@ -19,7 +19,30 @@ class CommentOut(BaseModel):
     article_id: str
     author_id: str
     parent_id: str | None
+    depth: int = 0
+    reply_count: int = 0
     content: str
     is_hidden: bool
     created_at: datetime
     updated_at: datetime | None
+
+
+class CommentThreadOut(CommentOut):
+    replies: list[CommentThreadOut] = Field(default_factory=list)
+    # Set on top-level comments whose replies were cut at `replies_per_page`.
+    has_more_replies: bool = False
+    replies_cursor: str | None = None
+
+
+class CommentThreadListOut(BaseModel):
+    items: list[CommentThreadOut]
+    per_page: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class CommentReplyListOut(BaseModel):
+    items: list[CommentOut]
+    per_page: int
+    has_more: bool
+    next_cursor: str | None = None
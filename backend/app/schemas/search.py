@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    kind: Literal["article", "update"]
+    id: str
+    slug: str | None
+    title: str
+    snippet: str
+    score: float
+
+
+class SearchOut(BaseModel):
+    query: str
+    items: list[SearchHit]
@@ -4,7 +4,7 @@ from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.schemas.base import StrictBaseModel
+from app.schemas.base import StrictBaseModel, TocEntry
 
 
 class UpdateBase(StrictBaseModel):
@@ -30,6 +30,8 @@ class UpdatePublicListItem(BaseModel):
     id: str
     title: str
     patch_date: date
+    excerpt: str | None = None
+    word_count: int = 0
 
 
 class UpdatePublicDetail(BaseModel):
@@ -39,6 +41,8 @@ class UpdatePublicDetail(BaseModel):
     title: str
     patch_date: date
     content: str
+    word_count: int = 0
+    toc: list[TocEntry] | None = None
     published_at: datetime | None
 
 
@@ -49,6 +53,9 @@ class UpdateAdminOut(BaseModel):
     title: str
     patch_date: date
     content: str
+    excerpt: str | None = None
+    word_count: int = 0
+    toc: list[TocEntry] | None = None
     status: str
     created_by_id: str
     updated_by_id: str | None
@@ -61,18 +68,20 @@ class UpdateAdminOut(BaseModel):
 
 class UpdateListOut(BaseModel):
     items: list[UpdatePublicListItem]
-    total: int
+    total: int | None = None
     page: int
     per_page: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class UpdateAdminListOut(BaseModel):
     items: list[UpdateAdminOut]
-    total: int
+    total: int | None = None
     page: int
     per_page: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class UpdateAuditOut(BaseModel):
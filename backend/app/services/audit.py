@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis_client import get_redis, report_redis_error
+from app.models.game_update import GameUpdateAudit
+from app.models.utils import generate_uuid
+
+logger = logging.getLogger("bdm.audit")
+
+BUFFER_KEY = "audit:updates"
+LOCK_KEY = "audit:updates:flush_lock"
+FLUSH_BATCH = 500
+# Far longer than one batch takes; only bounds how long a crashed flusher blocks others.
+LOCK_TTL_SEC = 60
+_PENDING_KEY = "update_audits"
+
+RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def audit_entry(
+    update_id: str,
+    actor_id: str,
+    action: str,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    return {
+        "id": generate_uuid(),
+        "update_id": update_id,
+        "actor_id": actor_id,
+        "action": action,
+        "meta": metadata,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def record_update_audits(db: Session, entries: list[dict[str, Any]]) -> None:
+    # Entries join the caller's transaction; with buffering on they are queued in
+    # Redis after commit instead and written in batches by the flush task.
+    if settings.audit_buffer_enabled:
+        db.info.setdefault(_PENDING_KEY, []).extend(entries)
+    elif len(entries) == 1:
+        db.add(GameUpdateAudit(**entries[0]))
+    elif entries:
+        db.execute(insert(GameUpdateAudit), entries)
+
+
+def record_update_audit(
+    db: Session,
+    update_id: str,
+    actor_id: str,
+    action: str,
+    metadata: dict[str, Any] | None = None,
+) -> None:
+    record_update_audits(db, [audit_entry(update_id, actor_id, action, metadata)])
+
+
+def _encode(entry: dict[str, Any]) -> str:
+    return json.dumps({**entry, "created_at": entry["created_at"].isoformat()})
+
+
+def _decode(raw: bytes | str) -> dict[str, Any]:
+    entry = json.loads(raw)
+    entry["created_at"] = datetime.fromisoformat(entry["created_at"])
+    return entry
+
+
+def _write(db: Session, entries: list[dict[str, Any]]) -> None:
+    if entries:
+        db.execute(insert(GameUpdateAudit), entries)
+    db.commit()
+
+
+def _push(entries: list[dict[str, Any]], bind) -> None:
+    client = get_redis()
+    if client:
+        try:
+            client.rpush(BUFFER_KEY, *(_encode(entry) for entry in entries))
+            return
+        except RedisError as exc:
+            report_redis_error(exc)
+    # Without Redis the entries are written right away rather than dropped.
+    logger.warning("audit_buffer_unavailable entries=%s", len(entries))
+    with Session(bind=bind) as db:
+        _write(db, entries)
+
+
+def flush_update_audits(db: Session, batch: int = FLUSH_BATCH) -> int:
+    client = get_redis()
+    if not client:
+        return 0
+    # Beat can start a flush while the previous one still runs on another worker;
+    # without the lock the second LTRIM would drop entries nobody has written.
+    token = generate_uuid()
+    try:
+        if not client.set(LOCK_KEY, token, nx=True, ex=LOCK_TTL_SEC):
+            return 0
+    except RedisError as exc:
+        report_redis_error(exc)
+        return 0
+    try:
+        return _flush_batch(db, client, batch)
+    finally:
+        try:
+            client.eval(RELEASE_LOCK_LUA, 1, LOCK_KEY, token)
+        except RedisError as exc:
+            report_redis_error(exc)
+
+
+def _flush_batch(db: Session, client, batch: int) -> int:
+    try:
+        raw = client.lrange(BUFFER_KEY, 0, batch - 1)
+    except RedisError as exc:
+        report_redis_error(exc)
+        return 0
+    if not raw:
+        return 0
+    entries = [_decode(item) for item in raw]
+    # Trim only after the insert committed so a failed flush keeps the entries;
+    # skipping known ids makes a retry after a failed trim harmless.
+    ids = [entry["id"] for entry in entries]
+    existing = set(db.scalars(select(GameUpdateAudit.id).where(GameUpdateAudit.id.in_(ids))))
+    _write(db, [entry for entry in entries if entry["id"] not in existing])
+    try:
+        client.ltrim(BUFFER_KEY, len(raw), -1)
+    except RedisError as exc:
+        report_redis_error(exc)
+    return len(raw)
+
+
+@event.listens_for(Session, "after_commit")
+def _push_committed(session: Session) -> None:
+    entries = session.info.pop(_PENDING_KEY, None)
+    if entries:
+        _push(entries, session.get_bind())
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.article import Article
+from app.models.game_update import GameUpdate
+from app.models.search_document import SearchDocument
+from app.models.section import Section
+from app.models.utils import generate_uuid
+from app.schemas.articles import ArticleCreate
+from app.schemas.updates import UpdateCreate
+from app.services.audit import audit_entry, record_update_audits
+from app.services.sanitize import content_fields, html_to_text, sanitize_html
+from app.services.search import KIND_ARTICLE, KIND_UPDATE
+
+BATCH_SIZE = 200
+SANITIZE_CHUNK_SIZE = 8
+
+UPDATE_EXPORT_FIELDS = ("title", "patch_date", "content", "status")
+ARTICLE_EXPORT_FIELDS = ("section_id", "slug", "title", "content", "status")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _prepare(content: str) -> tuple[str, dict[str, object], str]:
+    sanitized = sanitize_html(content)
+    return sanitized, content_fields(sanitized), html_to_text(sanitized)
+
+
+def _executor() -> ProcessPoolExecutor:
+    # Spawned workers do not inherit the API process' threads and locks.
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.bulk_sanitize_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_executor() -> None:
+    # Called on app shutdown so the spawned sanitizer processes exit with the worker.
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+
+def prepare_contents(contents: list[str]) -> list[tuple[str, dict[str, object], str]]:
+    # bleach is pure Python, so only separate processes sanitize in parallel.
+    if settings.bulk_sanitize_workers <= 1 or len(contents) < SANITIZE_CHUNK_SIZE:
+        return [_prepare(content) for content in contents]
+    return list(_executor().map(_prepare, contents, chunksize=SANITIZE_CHUNK_SIZE))
+
+
+def _batches(items: list[Any]) -> Iterator[list[Any]]:
+    for start in range(0, len(items), BATCH_SIZE):
+        yield items[start : start + BATCH_SIZE]
+
+
+def _search_row(kind: str, ref_id: str, slug: str | None, title: str, text: str) -> dict:
+    return {"kind": kind, "ref_id": ref_id, "slug": slug, "title": title, "body": text}
+
+
+def import_updates(db: Session, items: list[UpdateCreate], actor_id: str) -> int:
+    for batch in _batches(items):
+        prepared = prepare_contents([item.content for item in batch])
+        now = datetime.now(timezone.utc)
+        rows, documents, audits = [], [], []
+        for item, (content, fields, text) in zip(batch, prepared):
+            published = item.status == "published"
+            row = {
+                "id": generate_uuid(),
+                "title": item.title,
+                "patch_date": item.patch_date,
+                "content": content,
+                "status": item.status,
+                "created_by_id": actor_id,
+                "created_at": now,
+                "published_at": now if published else None,
+                "published_by_id": actor_id if published else None,
+                **fields,
+            }
+            rows.append(row)
+            if published:
+                documents.append(_search_row(KIND_UPDATE, row["id"], None, item.title, text))
+            audits.append(
+                audit_entry(
+                    row["id"], actor_id, "import", {"status": item.status, "title": item.title}
+                )
+            )
+        db.execute(insert(GameUpdate), rows)
+        if documents:
+            db.execute(insert(SearchDocument), documents)
+        record_update_audits(db, audits)
+        db.commit()
+    return len(items)
+
+
+def article_conflicts(db: Session, items: list[ArticleCreate]) -> list[dict[str, object]]:
+    taken: set[str] = set()
+    for batch in _batches([item.slug for item in items]):
+        taken.update(db.scalars(select(Article.slug).where(Article.slug.in_(batch))))
+    section_ids = {item.section_id for item in items}
+    sections = set(db.scalars(select(Section.id).where(Section.id.in_(section_ids))))
+
+    errors: list[dict[str, object]] = []
+    for index, item in enumerate(items, start=1):
+        if item.section_id not in sections:
+            errors.append({"item": index, "detail": "Invalid section"})
+        elif item.slug in taken:
+            errors.append({"item": index, "detail": "Slug already exists"})
+        taken.add(item.slug)
+    return errors
+
+
+def import_articles(db: Session, items: list[ArticleCreate], actor_id: str) -> int:
+    for batch in _batches(items):
+        prepared = prepare_contents([item.content for item in batch])
+        now = datetime.now(timezone.utc)
+        rows, documents = [], []
+        for item, (content, fields, text) in zip(batch, prepared):
+            published = item.status == "published"
+            row = {
+                "id": generate_uuid(),
+                "section_id": item.section_id,
+                "slug": item.slug,
+                "title": item.title,
+                "content": content,
+                "status": item.status,
+                "author_id": actor_id,
+                "created_at": now,
+                "published_at": now if published else None,
+                **fields,
+            }
+            rows.append(row)
+            if published:
+                documents.append(_search_row(KIND_ARTICLE, row["id"], item.slug, item.title, text))
+        db.execute(insert(Article), rows)
+        if documents:
+            db.execute(insert(SearchDocument), documents)
+        db.commit()
+    return len(items)
+
+
+def export_rows(db: Session, columns: Iterable, *filters, order_by) -> Iterator[dict]:
+    statement = db.query(*columns).filter(*filters).order_by(*order_by)
+    for row in statement.yield_per(BATCH_SIZE):
+        yield row._asdict()
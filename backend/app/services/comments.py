@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from sqlalchemy import CTE, Exists, func, select
+from sqlalchemy.orm import Session, aliased
+
+from app.models.comment import Comment
+
+
+def visible_comments(*filters) -> CTE:
+    # Same rule as the threads view: a comment is shown only while it and every
+    # ancestor are visible, so hiding a comment also hides its replies.
+    tree = (
+        select(Comment.id, Comment.article_id, Comment.created_at)
+        .where(Comment.parent_id.is_(None), Comment.is_hidden.is_(False), *filters)
+        .cte("visible_comments", recursive=True)
+    )
+    child = aliased(Comment)
+    return tree.union_all(
+        select(child.id, child.article_id, child.created_at).where(
+            child.parent_id == tree.c.id, child.is_hidden.is_(False)
+        )
+    )
+
+
+def hidden_in_ancestry(comment_id: str) -> Exists:
+    # True when the comment or any ancestor is hidden; walks up parent_id, so the
+    # cost is bounded by the thread depth rather than the article size.
+    chain = (
+        select(Comment.id, Comment.parent_id, Comment.is_hidden)
+        .where(Comment.id == comment_id)
+        .cte("comment_ancestry", recursive=True)
+    )
+    parent = aliased(Comment)
+    chain = chain.union_all(
+        select(parent.id, parent.parent_id, parent.is_hidden).where(parent.id == chain.c.parent_id)
+    )
+    return select(chain.c.id).where(chain.c.is_hidden.is_(True)).exists()
+
+
+def article_comment_stats(db: Session, article_id: str) -> tuple[int, object]:
+    tree = visible_comments(Comment.article_id == article_id)
+    count, last = db.execute(select(func.count(), func.max(tree.c.created_at))).one()
+    return count, last
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import logging
+import math
+
+import httpx
+from redis.exceptions import RedisError
+
+from app.celery_app import celery_app
+from app.core.config import settings
+from app.core.redis_client import get_redis, report_redis_error
+
+logger = logging.getLogger("bdm.revalidate")
+
+PENDING_KEY = "revalidate:pending"
+SCHEDULED_KEY = "revalidate:scheduled"
+FLUSH_TASK = "app.tasks.revalidate.flush_revalidations"
+# Collection tags also map to the frontend pages that list them.
+TAG_PATHS = {"articles": "/", "sections": "/", "updates": "/updates"}
+
+
+def request_revalidation(*tags: str) -> None:
+    # Tags are the backend cache tags. No frontend fetch carries them yet (the public
+    # pages are client-rendered), so the webhook is groundwork until they do.
+    # Writes within the debounce window share one webhook call.
+    if not settings.frontend_revalidate_url or not tags:
+        return
+    client = get_redis()
+    if not client:
+        logger.warning("revalidate_skipped reason=redis_unavailable tags=%s", ",".join(tags))
+        return
+    debounce = settings.revalidate_debounce_sec
+    try:
+        client.sadd(PENDING_KEY, *tags)
+        # The marker outlives the countdown so a lost task cannot block later flushes forever.
+        scheduled = client.set(SCHEDULED_KEY, 1, nx=True, ex=math.ceil(debounce) + 60)
+    except RedisError as exc:
+        report_redis_error(exc)
+        return
+    if not scheduled:
+        return
+    try:
+        celery_app.send_task(FLUSH_TASK, countdown=debounce)
+    except Exception:
+        logger.exception("revalidate_schedule_failed")
+        try:
+            client.delete(SCHEDULED_KEY)
+        except RedisError as exc:
+            report_redis_error(exc)
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def flush_pending_revalidations() -> int:
+    client = get_redis()
+    if not client or not settings.frontend_revalidate_url:
+        return 0
+    # Clear the marker first: writes during the call schedule a follow-up flush.
+    client.delete(SCHEDULED_KEY)
+    tags = sorted(_decode(tag) for tag in client.smembers(PENDING_KEY))
+    if not tags:
+        return 0
+
+    payload = {
+        "tags": tags,
+        "paths": sorted({TAG_PATHS[tag] for tag in tags if tag in TAG_PATHS}),
+    }
+    response = httpx.post(
+        settings.frontend_revalidate_url,
+        json=payload,
+        headers={"X-Revalidate-Secret": settings.frontend_revalidate_secret},
+        timeout=httpx.Timeout(10.0, connect=3.0),
+    )
+    response.raise_for_status()
+    # Removed only after success, so a failed call is retried with the same tags.
+    client.srem(PENDING_KEY, *tags)
+    return len(tags)
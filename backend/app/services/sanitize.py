@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
 from urllib.parse import urlparse
 
-import bleach
+from bleach.sanitizer import Cleaner
 
 from app.core.config import settings
 
@@ -48,11 +53,43 @@ ALLOWED_ATTRIBUTES = {
 
 ALLOWED_PROTOCOLS = ["http", "https", "mailto"]
 
+BLOCK_TAGS = {
+    "blockquote",
+    "br",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "hr",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "ul",
+}
+
+TOC_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# The memo is bounded by size, not entry count: patch notes can be hundreds of KiB.
+MEMO_MAX_BYTES = 4 * 1024 * 1024
+MEMO_MAX_ITEM_BYTES = 256 * 1024
+EXCERPT_MAX_CHARS = 280
+
+
+def _parse_hosts(value: str) -> frozenset[str]:
+    return frozenset(host.strip().lower() for host in value.split(",") if host.strip())
 
-def _allowed_iframe_hosts() -> set[str]:
-    return {
-        host.strip().lower() for host in settings.iframe_allowed_hosts.split(",") if host.strip()
-    }
+
+ALLOWED_IFRAME_HOSTS = _parse_hosts(settings.iframe_allowed_hosts)
+_IFRAME_HOST_SUFFIXES = tuple(f".{host}" for host in ALLOWED_IFRAME_HOSTS)
+
+_local = threading.local()
+_memo: OrderedDict[bytes, str] = OrderedDict()
+_memo_bytes = 0
+_memo_lock = threading.Lock()
 
 
 def _is_allowed_iframe_src(value: str) -> bool:
@@ -68,10 +105,7 @@ def _is_allowed_iframe_src(value: str) -> bool:
     if not hostname:
         return False
 
-    for allowed in _allowed_iframe_hosts():
-        if hostname == allowed or hostname.endswith(f".{allowed}"):
-            return True
-    return False
+    return hostname in ALLOWED_IFRAME_HOSTS or hostname.endswith(_IFRAME_HOST_SUFFIXES)
 
 
 def _attribute_filter(tag: str, name: str, value: str) -> str | None:
@@ -85,12 +119,108 @@ def _attribute_filter(tag: str, name: str, value: str) -> str | None:
     return value
 
 
+def _cleaner() -> Cleaner:
+    # bleach cleaners keep parser state, so each thread gets its own instance.
+    cleaner = getattr(_local, "cleaner", None)
+    if cleaner is None:
+        cleaner = Cleaner(
+            tags=ALLOWED_TAGS,
+            attributes=_attribute_filter,
+            protocols=ALLOWED_PROTOCOLS,
+            strip=True,
+            strip_comments=True,
+        )
+        _local.cleaner = cleaner
+    return cleaner
+
+
 def sanitize_html(content: str) -> str:
-    return bleach.clean(
-        content,
-        tags=ALLOWED_TAGS,
-        attributes=_attribute_filter,
-        protocols=ALLOWED_PROTOCOLS,
-        strip=True,
-        strip_comments=True,
-    )
+    global _memo_bytes
+    raw = content.encode("utf-8")
+    if len(raw) > MEMO_MAX_ITEM_BYTES:
+        return _cleaner().clean(content)
+
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached is not None:
+            _memo.move_to_end(key)
+            return cached
+
+    cleaned = _cleaner().clean(content)
+    with _memo_lock:
+        if key not in _memo:
+            _memo[key] = cleaned
+            _memo_bytes += len(cleaned)
+        while _memo_bytes > MEMO_MAX_BYTES:
+            _, evicted = _memo.popitem(last=False)
+            _memo_bytes -= len(evicted)
+    return cleaned
+
+
+def clear_sanitize_cache() -> None:
+    global _memo_bytes
+    with _memo_lock:
+        _memo.clear()
+        _memo_bytes = 0
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self.headings: list[tuple[int, str]] = []
+        self._heading: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in BLOCK_TAGS:
+            self.parts.append(" ")
+        if tag in TOC_LEVELS:
+            self._heading = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in BLOCK_TAGS:
+            self.parts.append(" ")
+        if tag in TOC_LEVELS and self._heading is not None:
+            title = _WHITESPACE_RE.sub(" ", "".join(self._heading)).strip()
+            if title:
+                self.headings.append((TOC_LEVELS[tag], title))
+            self._heading = None
+
+    def handle_data(self, data: str) -> None:
+        self.parts.append(data)
+        if self._heading is not None:
+            self._heading.append(data)
+
+    def text(self) -> str:
+        return _WHITESPACE_RE.sub(" ", "".join(self.parts)).strip()
+
+
+def _extract(content: str) -> _TextExtractor:
+    extractor = _TextExtractor()
+    extractor.feed(content)
+    extractor.close()
+    return extractor
+
+
+def html_to_text(content: str) -> str:
+    return _extract(content).text()
+
+
+def _excerpt(text: str) -> str:
+    if len(text) <= EXCERPT_MAX_CHARS:
+        return text
+    cut = text[:EXCERPT_MAX_CHARS]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def content_fields(content: str) -> dict[str, object]:
+    extractor = _extract(content)
+    text = extractor.text()
+    return {
+        "excerpt": _excerpt(text),
+        "word_count": len(text.split()),
+        "toc": [{"level": level, "title": title} for level, title in extractor.headings],
+    }
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import column, literal_column, or_, select, table
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from app.models.article import Article
+from app.models.game_update import GameUpdate
+from app.models.search_document import SearchDocument
+from app.schemas.search import SearchHit
+from app.services.sanitize import html_to_text
+
+KIND_ARTICLE = "article"
+KIND_UPDATE = "update"
+MAX_TERMS = 8
+SNIPPET_CHARS = 160
+
+_TERM_RE = re.compile(r"\w+")
+_fts = table("search_documents_fts", column("rowid"))
+
+
+def _upsert(
+    db: Session, kind: str, ref_id: str, slug: str | None, title: str, content: str
+) -> None:
+    document = (
+        db.query(SearchDocument)
+        .filter(SearchDocument.kind == kind, SearchDocument.ref_id == ref_id)
+        .first()
+    )
+    if document is None:
+        document = SearchDocument(kind=kind, ref_id=ref_id)
+        db.add(document)
+    document.slug = slug
+    document.title = title
+    document.body = html_to_text(content)
+
+
+def _remove(db: Session, kind: str, ref_id: str) -> None:
+    db.query(SearchDocument).filter(
+        SearchDocument.kind == kind, SearchDocument.ref_id == ref_id
+    ).delete(synchronize_session=False)
+
+
+def index_article(db: Session, article: Article) -> None:
+    if article.status == "published":
+        _upsert(db, KIND_ARTICLE, article.id, article.slug, article.title, article.content)
+    else:
+        _remove(db, KIND_ARTICLE, article.id)
+
+
+def index_update(db: Session, update: GameUpdate) -> None:
+    if update.status == "published" and update.deleted_at is None:
+        _upsert(db, KIND_UPDATE, update.id, None, update.title, update.content)
+    else:
+        _remove(db, KIND_UPDATE, update.id)
+
+
+def rebuild_index(db: Session) -> int:
+    db.query(SearchDocument).delete(synchronize_session=False)
+    count = 0
+    for article in db.query(Article).filter(Article.status == "published").yield_per(100):
+        index_article(db, article)
+        count += 1
+    updates = db.query(GameUpdate).filter(
+        GameUpdate.status == "published", GameUpdate.deleted_at.is_(None)
+    )
+    for update in updates.yield_per(100):
+        index_update(db, update)
+        count += 1
+    db.commit()
+    return count
+
+
+def _snippet(body: str, terms: list[str]) -> str:
+    lowered = body.lower()
+    positions = [pos for pos in (lowered.find(term) for term in terms) if pos >= 0]
+    start = max(min(positions) - SNIPPET_CHARS // 4, 0) if positions else 0
+    end = start + SNIPPET_CHARS
+    snippet = body[start:end].strip()
+    if start > 0:
+        snippet = f"…{snippet}"
+    if end < len(body):
+        snippet = f"{snippet}…"
+    return snippet
+
+
+def _ranked_statement(db: Session, terms: list[str]):
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        score = match(SearchDocument.title, SearchDocument.body, against=" ".join(terms))
+        score = score.in_natural_language_mode()
+        return select(SearchDocument, score.label("score")).where(score > 0).order_by(score.desc())
+
+    if dialect == "sqlite":
+        # bm25() is lower-is-better; titles weigh 10x the body.
+        rank = literal_column("bm25(search_documents_fts, 10.0, 1.0)")
+        fts_query = " OR ".join(f'"{term}"*' for term in terms)
+        return (
+            select(SearchDocument, (-rank).label("score"))
+            .join(_fts, _fts.c.rowid == SearchDocument.id)
+            .where(literal_column("search_documents_fts").op("MATCH")(fts_query))
+            .order_by(rank)
+        )
+
+    conditions = []
+    for term in terms:
+        pattern = f"%{term}%"
+        conditions.extend([SearchDocument.title.ilike(pattern), SearchDocument.body.ilike(pattern)])
+    return (
+        select(SearchDocument, literal_column("1.0").label("score"))
+        .where(or_(*conditions))
+        .order_by(SearchDocument.updated_at.desc())
+    )
+
+
+def search(db: Session, query: str, kind: str | None = None, limit: int = 20) -> list[SearchHit]:
+    terms = _TERM_RE.findall(query.lower())[:MAX_TERMS]
+    if not terms:
+        return []
+
+    statement = _ranked_statement(db, terms)
+    if kind:
+        statement = statement.where(SearchDocument.kind == kind)
+
+    hits = []
+    for document, score in db.execute(statement.limit(limit)).all():
+        hits.append(
+            SearchHit(
+                kind=document.kind,
+                id=document.ref_id,
+                slug=document.slug,
+                title=document.title,
+                snippet=_snippet(document.body, terms),
+                score=round(float(score), 4),
+            )
+        )
+    return hits
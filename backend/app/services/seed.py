@@ -5,6 +5,8 @@ from datetime import datetime, timezone
 from app.models.article import Article
 from app.models.section import Section
 from app.models.user import User
+from app.services.sanitize import content_fields
+from app.services.search import index_article
 
 SECTIONS = [
     {
@@ -84,10 +86,13 @@ def seed_articles(db, author: User, sections: dict[str, Section], upsert: bool)
             if upsert:
                 article.title = payload["title"]
                 article.content = payload["content"]
+                for field, value in content_fields(article.content).items():
+                    setattr(article, field, value)
                 article.status = payload["status"]
                 if payload["status"] == "published" and not article.published_at:
                     article.published_at = datetime.now(timezone.utc)
                 db.add(article)
+                index_article(db, article)
             continue
 
         article = Article(
@@ -98,7 +103,10 @@ def seed_articles(db, author: User, sections: dict[str, Section], upsert: bool)
             status=payload["status"],
             author_id=author.id,
             published_at=datetime.now(timezone.utc) if payload["status"] == "published" else None,
+            **content_fields(payload["content"]),
         )
         db.add(article)
+        db.flush()
+        index_article(db, article)
 
     db.commit()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import logging
+import time
+
+import httpx
+from celery.signals import worker_process_shutdown
+
+from app.celery_app import celery_app
+from app.core.config import settings
+from app.core.rate_limit import acquire_token
+
+logger = logging.getLogger("bdm.telegram")
+
+API_URL = "https://api.telegram.org"
+GLOBAL_KEY = "tg:send:global"
+BROADCAST_TASK = "app.tasks.telegram.broadcast_telegram_message"
+# Waits up to this long happen inline; longer ones go back to the broker.
+MAX_INLINE_WAIT_SEC = 1.0
+DEFAULT_RETRY_AFTER_SEC = 5.0
+
+_client: httpx.Client | None = None
+
+
+class TelegramRetry(Exception):
+    def __init__(self, delay: float, reason: str):
+        super().__init__(f"{reason} retry_in_sec={delay:.2f}")
+        self.delay = delay
+        self.reason = reason
+
+
+def _http() -> httpx.Client:
+    # One keep-alive pool per worker process; prefork children create their own after fork.
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            base_url=f"{API_URL}/bot{settings.telegram_bot_token}",
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+    return _client
+
+
+@worker_process_shutdown.connect
+def _close_client(**kwargs) -> None:
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def _take(key: str, limit: int) -> float:
+    wait = acquire_token(key, limit, 1.0)
+    while 0 < wait <= MAX_INLINE_WAIT_SEC:
+        time.sleep(wait)
+        wait = acquire_token(key, limit, 1.0)
+    return wait
+
+
+def _reserve(chat_id: str) -> None:
+    # Per-chat first so a busy chat does not burn global tokens while it waits.
+    for key, limit in (
+        (f"tg:send:chat:{chat_id}", settings.telegram_chat_rate),
+        (GLOBAL_KEY, settings.telegram_global_rate),
+    ):
+        wait = _take(key, limit)
+        if wait:
+            raise TelegramRetry(wait, "rate_limited")
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        return DEFAULT_RETRY_AFTER_SEC
+
+
+def send_message(chat_id: str, text: str) -> bool:
+    # Raises TelegramRetry when the message should be sent again later and
+    # httpx.RequestError on network failures; returns False for permanent errors.
+    _reserve(chat_id)
+    response = _http().post("/sendMessage", json={"chat_id": chat_id, "text": text})
+    if response.status_code == 200:
+        return True
+    if response.status_code == 429 or response.status_code >= 500:
+        logger.warning(
+            "telegram_send_retry status=%s body=%s",
+            response.status_code,
+            response.text[:200],
+        )
+        if response.status_code == 429:
+            raise TelegramRetry(_retry_after(response), "too_many_requests")
+        raise TelegramRetry(DEFAULT_RETRY_AFTER_SEC, "server_error")
+    logger.warning(
+        "telegram_send_failed status=%s body=%s",
+        response.status_code,
+        response.text[:200],
+    )
+    return False
+
+
+def notify_update_published(title: str) -> None:
+    if not settings.telegram_notify_updates or not settings.telegram_bot_token:
+        return
+    text = f"Новые патчноуты: {title}\n{settings.base_url.rstrip('/')}/updates"
+    try:
+        celery_app.send_task(BROADCAST_TASK, args=[text])
+    except Exception:
+        logger.exception("telegram_broadcast_schedule_failed")
@@ -1,4 +1,19 @@
+from app.tasks.audit import flush_update_audit_buffer
 from app.tasks.cleanup import cleanup_expired_registration_requests
-from app.tasks.telegram import send_telegram_message
+from app.tasks.comments import reconcile_article_comment_stats
+from app.tasks.revalidate import flush_revalidations
+from app.tasks.telegram import (
+    broadcast_telegram_message,
+    send_telegram_batch,
+    send_telegram_message,
+)
 
-__all__ = ["cleanup_expired_registration_requests", "send_telegram_message"]
+__all__ = [
+    "broadcast_telegram_message",
+    "cleanup_expired_registration_requests",
+    "flush_revalidations",
+    "flush_update_audit_buffer",
+    "reconcile_article_comment_stats",
+    "send_telegram_batch",
+    "send_telegram_message",
+]
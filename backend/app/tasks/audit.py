@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from app.celery_app import celery_app
+from app.db.session import SessionLocal
+from app.services.audit import flush_update_audits
+
+MAX_BATCHES = 20
+
+
+@celery_app.task
+def flush_update_audit_buffer() -> int:
+    db = SessionLocal()
+    try:
+        total = 0
+        for _ in range(MAX_BATCHES):
+            written = flush_update_audits(db)
+            total += written
+            if not written:
+                break
+        return total
+    finally:
+        db.close()
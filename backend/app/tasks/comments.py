@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import and_, bindparam, func, select, update
+from sqlalchemy.orm import Session
+
+from app.celery_app import celery_app
+from app.db.session import SessionLocal
+from app.models.article import Article
+from app.services.comments import visible_comments
+
+logger = logging.getLogger("bdm.comments")
+
+RECONCILE_BATCH = 500
+
+
+def reconcile_comment_stats(db: Session) -> int:
+    tree = visible_comments()
+    stats = {
+        row.article_id: (row.count, row.last)
+        for row in db.execute(
+            select(
+                tree.c.article_id,
+                func.count().label("count"),
+                func.max(tree.c.created_at).label("last"),
+            ).group_by(tree.c.article_id)
+        )
+    }
+
+    drifted = []
+    current = select(Article.id, Article.comment_count, Article.last_commented_at)
+    for row in db.execute(current.execution_options(yield_per=RECONCILE_BATCH)):
+        count, last = stats.get(row.id, (0, None))
+        if (row.comment_count, row.last_commented_at) != (count, last):
+            drifted.append(
+                {"b_id": row.id, "b_seen": row.comment_count, "count": count, "last": last}
+            )
+
+    # Only rows still holding the value we read are touched, so a comment posted
+    # meanwhile is not overwritten; the next run picks up anything skipped.
+    statement = (
+        update(Article)
+        .where(and_(Article.id == bindparam("b_id"), Article.comment_count == bindparam("b_seen")))
+        .values(
+            comment_count=bindparam("count"),
+            last_commented_at=bindparam("last"),
+            updated_at=Article.updated_at,
+        )
+    )
+    for start in range(0, len(drifted), RECONCILE_BATCH):
+        db.connection().execute(statement, drifted[start : start + RECONCILE_BATCH])
+    db.commit()
+    if drifted:
+        logger.warning("comment_stats_drift articles=%s", len(drifted))
+    return len(drifted)
+
+
+@celery_app.task
+def reconcile_article_comment_stats() -> int:
+    db = SessionLocal()
+    try:
+        return reconcile_comment_stats(db)
+    finally:
+        db.close()
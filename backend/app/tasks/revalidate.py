@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import httpx
+
+from app.celery_app import celery_app
+from app.services.revalidate import flush_pending_revalidations
+
+
+@celery_app.task(
+    autoretry_for=(httpx.HTTPError,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+def flush_revalidations() -> int:
+    return flush_pending_revalidations()
@@ -3,12 +3,19 @@ from __future__ import annotations
 import logging
 
 import httpx
+from sqlalchemy import select
 
 from app.celery_app import celery_app
 from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.user import User
+from app.services.telegram import TelegramRetry, send_message
 
 logger = logging.getLogger("bdm.telegram")
 
+BROADCAST_CHUNK = 100
+RATE_LIMIT_MAX_RETRIES = 10
+
 
 @celery_app.task(
     bind=True,
@@ -20,26 +27,54 @@ logger = logging.getLogger("bdm.telegram")
 def send_telegram_message(self, telegram_id: str, text: str) -> bool:
     if not settings.telegram_bot_token:
         return False
+    try:
+        return send_message(telegram_id, text)
+    except TelegramRetry as exc:
+        # Rate-limit waits are expected during broadcasts and get more attempts.
+        raise self.retry(exc=exc, countdown=exc.delay, max_retries=RATE_LIMIT_MAX_RETRIES)
+
+
+@celery_app.task
+def send_telegram_batch(telegram_ids: list[str], text: str, attempt: int = 0) -> int:
+    # Sends over the worker's pooled client. retry_after applies to the whole bot, so a
+    # 429 stops the batch and re-queues everything not yet sent after that delay.
+    if not settings.telegram_bot_token:
+        return 0
+    sent = 0
+    for index, telegram_id in enumerate(telegram_ids):
+        try:
+            sent += send_message(telegram_id, text)
+        except TelegramRetry as exc:
+            # attempt counts 429s in a row without sending anything.
+            attempt = attempt + 1 if index == 0 else 1
+            if attempt > RATE_LIMIT_MAX_RETRIES:
+                logger.warning("telegram_batch_dropped recipients=%s", len(telegram_ids) - index)
+                break
+            send_telegram_batch.apply_async(
+                (telegram_ids[index:], text), {"attempt": attempt}, countdown=exc.delay
+            )
+            break
+        except httpx.RequestError:
+            send_telegram_message.delay(telegram_id, text)
+    return sent
+
 
-    url = f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage"
-    payload = {
-        "chat_id": telegram_id,
-        "text": text,
-    }
-    timeout = httpx.Timeout(10.0, connect=3.0)
-    response = httpx.post(url, json=payload, timeout=timeout)
-    if response.status_code == 200:
-        return True
-    if response.status_code == 429 or response.status_code >= 500:
-        logger.warning(
-            "telegram_send_retry status=%s body=%s",
-            response.status_code,
-            response.text[:200],
+@celery_app.task
+def broadcast_telegram_message(text: str) -> int:
+    if not settings.telegram_bot_token:
+        return 0
+    db = SessionLocal()
+    try:
+        statement = (
+            select(User.telegram_id)
+            .where(User.is_active.is_(True), User.telegram_id.is_not(None))
+            .execution_options(yield_per=BROADCAST_CHUNK)
         )
-        raise self.retry()
-    logger.warning(
-        "telegram_send_failed status=%s body=%s",
-        response.status_code,
-        response.text[:200],
-    )
-    return False
+        total = 0
+        for chunk in db.scalars(statement).partitions(BROADCAST_CHUNK):
+            send_telegram_batch.delay(list(chunk), text)
+            total += len(chunk)
+    finally:
+        db.close()
+    logger.info("telegram_broadcast_queued recipients=%s", total)
+    return total
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import os
+
+
+def child_exit(server, worker) -> None:
+    # Drop the exited worker's live files from the Prometheus multiprocess directory.
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
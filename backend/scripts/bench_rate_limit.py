@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+from redis import ConnectionPool, Redis
+from redis.connection import Connection
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.rate_limit import ALGORITHMS, _hit_redis
+
+
+class CountingConnection(Connection):
+    round_trips = 0
+
+    def read_response(self, *args, **kwargs):
+        CountingConnection.round_trips += 1
+        return super().read_response(*args, **kwargs)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare rate limiter Redis round trips.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per case")
+    parser.add_argument("--limit", type=int, default=10, help="Requests allowed per window")
+    parser.add_argument("--window", type=int, default=60, help="Window in seconds")
+    return parser.parse_args()
+
+
+def legacy_fixed_window(client: Redis, key: str, limit: int, window_sec: int) -> bool:
+    count = int(client.incr(key))
+    if count == 1:
+        client.expire(key, window_sec)
+    return count <= limit
+
+
+def run(label: str, requests: int, func) -> None:
+    CountingConnection.round_trips = 0
+    start = time.perf_counter()
+    for index in range(requests):
+        func(index)
+    elapsed_us = (time.perf_counter() - start) * 1_000_000 / requests
+    per_request = CountingConnection.round_trips / requests
+    print(f"{label:<16} {per_request:6.2f} round trips/req {elapsed_us:10.1f} us/req")
+
+
+def main() -> None:
+    args = parse_args()
+    pool = ConnectionPool.from_url(settings.redis_url, connection_class=CountingConnection)
+    client = Redis(connection_pool=pool)
+    try:
+        client.ping()
+    except RedisError as exc:
+        raise SystemExit(f"Redis unavailable at {settings.redis_url}: {exc}") from None
+
+    prefix = f"rl:bench:{uuid.uuid4().hex}"
+    # Every request uses a fresh key (a new client/username pair, as in a
+    # credential-stuffing burst), where legacy INCR + EXPIRE needs two round trips.
+    run(
+        "fixed (legacy)",
+        args.requests,
+        lambda i: legacy_fixed_window(client, f"{prefix}:fixed:{i}", args.limit, args.window),
+    )
+    for algorithm in ALGORITHMS:
+        run(
+            algorithm,
+            args.requests,
+            lambda i, algorithm=algorithm: _hit_redis(
+                client, f"{prefix}:{algorithm}:{i}", algorithm, args.limit, args.window
+            ),
+        )
+
+    keys = list(client.scan_iter(match=f"{prefix}:*", count=500))
+    if keys:
+        client.delete(*keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.services.sanitize import MEMO_MAX_ITEM_BYTES, clear_sanitize_cache, sanitize_html
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark HTML sanitizing on large patch notes.")
+    parser.add_argument(
+        "--sections", type=int, default=200, help="Patch note sections per document"
+    )
+    parser.add_argument("--runs", type=int, default=20, help="Iterations per case")
+    return parser.parse_args()
+
+
+def build_patch_notes(sections: int) -> str:
+    parts = []
+    for index in range(sections):
+        parts.append(
+            f"<h2>Change {index}</h2>"
+            f"<p>Adjusted <strong>skill {index}</strong> damage by {index % 7}% "
+            f'and <a href="https://example.com/{index}" onclick="x()">details</a>.</p>'
+            "<ul><li>Cooldown reduced</li><li>Range increased</li></ul>"
+        )
+        if index % 25 == 0:
+            parts.append(
+                '<iframe src="https://www.youtube.com/embed/abc" width="560"></iframe>'
+                '<iframe src="https://evil.example/embed"></iframe><script>alert(1)</script>'
+            )
+    return "".join(parts)
+
+
+def timed(label: str, runs: int, func) -> None:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+    print(f"{label:<28} {elapsed_ms:10.3f} ms/op")
+
+
+def main() -> None:
+    args = parse_args()
+    content = build_patch_notes(args.sections)
+    print(f"document size: {len(content) / 1024:.1f} KiB, runs: {args.runs}")
+
+    memoized = len(content.encode("utf-8")) <= MEMO_MAX_ITEM_BYTES
+    if not memoized:
+        print(f"larger than MEMO_MAX_ITEM_BYTES ({MEMO_MAX_ITEM_BYTES}), never memoized")
+
+    def cold() -> None:
+        clear_sanitize_cache()
+        sanitize_html(content)
+
+    timed("sanitize_html (cold)", args.runs, cold)
+    sanitize_html(content)
+    timed("sanitize_html (repeat)", args.runs, lambda: sanitize_html(content))
+
+
+if __name__ == "__main__":
+    main()
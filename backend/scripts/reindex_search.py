@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from app.db.session import SessionLocal
+from app.services.search import rebuild_index
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        count = rebuild_index(db)
+        print(f"Search index rebuilt: {count} documents")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
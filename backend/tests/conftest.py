@@ -1,22 +1,60 @@
 import os
+from datetime import date, datetime, timedelta
 
 import pytest
+from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 os.environ.setdefault("APP_ENV", "test")
 os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
 
-from app.core.deps import get_db  # noqa: E402
+from app.core.cache import cache_clear  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.deps import get_async_db, get_async_read_db, get_db, get_read_db  # noqa: E402
+from app.core.principal_cache import clear_principal_cache  # noqa: E402
+from app.core.rate_limit import rate_limit_clear  # noqa: E402
+from app.core.security import hash_password  # noqa: E402
 from app.db.base import Base  # noqa: E402
+from app.db.query_stats import instrument_engine  # noqa: E402
 from app.main import app  # noqa: E402
+from app.models.article import Article  # noqa: E402
+from app.models.game_update import GameUpdate  # noqa: E402
+from app.models.section import Section  # noqa: E402
+from app.models.user import User  # noqa: E402
 
 engine = create_engine(
     os.environ["DATABASE_URL"], connect_args={"check_same_thread": False}, future=True
 )
 TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+async_engine = create_async_engine(settings.sqlalchemy_async_database_uri(), poolclass=NullPool)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "query_budget(n): fail if any request in the test runs more than n SQL queries"
+    )
+
+
+def _query_budget_hook(budget: int):
+    def check(response):
+        count = int(response.headers.get("X-Query-Count", "0"))
+        request = response.request
+        assert (
+            count <= budget
+        ), f"{request.method} {request.url.path} ran {count} SQL queries (budget {budget})"
+
+    return check
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_db():
@@ -36,9 +74,12 @@ def db_session():
 
 
 @pytest.fixture()
-def client(db_session):
+def client(request, db_session):
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    cache_clear()
+    clear_principal_cache()
+    rate_limit_clear()
 
     def override_get_db():
         try:
@@ -46,7 +87,143 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
     with TestClient(app) as client:
+        marker = request.node.get_closest_marker("query_budget")
+        if marker is not None:
+            client.event_hooks["response"].append(_query_budget_hook(marker.args[0]))
         yield client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def create_user(db_session):
+    def create(username: str, role: str = "user") -> User:
+        user = User(
+            username=username,
+            password_hash=hash_password("Password123"),
+            role=role,
+            is_active=True,
+        )
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    return create
+
+
+@pytest.fixture()
+def login(client):
+    def log_in(username: str, password: str = "Password123") -> None:
+        response = client.post(
+            "/api/auth/login",
+            json={"username": username, "password": password},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    return log_in
+
+
+@pytest.fixture()
+def create_articles(db_session, create_user):
+    # `count` published guides by @writer (moderator), plus one article in another
+    # section and one draft.
+    def create(count: int) -> tuple[Section, list[Article]]:
+        author = create_user("@writer", role="moderator")
+        guides = Section(slug="guides", title="Guides", sort_order=1, is_visible=True)
+        other = Section(slug="other", title="Other", sort_order=2, is_visible=True)
+        db_session.add_all([guides, other])
+        db_session.commit()
+
+        published = datetime(2025, 1, 1, 12, 0, 0)
+        articles = [
+            Article(
+                section_id=guides.id,
+                slug=f"guide-{index}",
+                title=f"Guide {index}",
+                content="<p>long body</p>" * 50,
+                status="published",
+                author_id=author.id,
+                published_at=published + timedelta(hours=index),
+            )
+            for index in range(count)
+        ]
+        articles.append(
+            Article(
+                section_id=other.id,
+                slug="other-article",
+                title="Other",
+                content="<p>other</p>",
+                status="published",
+                author_id=author.id,
+                published_at=published,
+            )
+        )
+        articles.append(
+            Article(
+                section_id=guides.id,
+                slug="draft",
+                title="Draft",
+                content="<p>draft</p>",
+                status="draft",
+                author_id=author.id,
+            )
+        )
+        db_session.add_all(articles)
+        db_session.commit()
+        return guides, articles
+
+    return create
+
+
+@pytest.fixture()
+def create_updates(db_session, create_user):
+    # `count` published patches by @author (moderator), plus one draft.
+    def create(count: int) -> list[GameUpdate]:
+        author = create_user("@author", role="moderator")
+        created = datetime(2025, 1, 1, 12, 0, 0)
+        updates = []
+        for index in range(count):
+            update = GameUpdate(
+                title=f"Patch {index}",
+                # Pairs share a patch_date so the created_at/id tiebreakers are exercised.
+                patch_date=date(2025, 1, 1) + timedelta(days=index // 2),
+                content="<p>notes</p>",
+                status="published",
+                created_by_id=author.id,
+                created_at=created + timedelta(minutes=index),
+            )
+            updates.append(update)
+        draft = GameUpdate(
+            title="Draft patch",
+            patch_date=date(2030, 1, 1),
+            content="<p>draft</p>",
+            status="draft",
+            created_by_id=author.id,
+            created_at=created,
+        )
+        db_session.add_all([*updates, draft])
+        db_session.commit()
+        return updates
+
+    return create
+
+
+@pytest.fixture()
+def post_comment(client):
+    def post(article_id: str, content: str, parent_id: str | None = None) -> dict:
+        response = client.post(
+            f"/api/articles/{article_id}/comments",
+            json={"content": content, "parent_id": parent_id},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    return post
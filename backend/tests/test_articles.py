@@ -0,0 +1,57 @@
+import pytest
+from fastapi import status
+
+
+@pytest.mark.query_budget(1)
+def test_list_articles_paginates_summaries(client, create_articles):
+    create_articles(3)
+
+    seen: list[str] = []
+    params: dict[str, object] = {"section": "guides", "per_page": 2}
+    while True:
+        response = client.get("/api/articles", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        for item in body["items"]:
+            assert "content" not in item
+            seen.append(item["slug"])
+        if not body["next_cursor"]:
+            break
+        params = {"section": "guides", "per_page": 2, "cursor": body["next_cursor"]}
+
+    assert seen == ["guide-2", "guide-1", "guide-0"]
+
+
+def test_list_articles_unknown_section_is_empty(client, create_articles):
+    create_articles(1)
+
+    response = client.get("/api/articles", params={"section": "missing"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+
+
+def test_create_article_stores_content_meta(client, create_articles):
+    guides, _ = create_articles(0)
+    login = client.post(
+        "/api/auth/login",
+        json={"username": "@writer", "password": "Password123"},
+    )
+    assert login.status_code == status.HTTP_200_OK
+
+    response = client.post(
+        "/api/articles",
+        json={
+            "section_id": guides.id,
+            "slug": "meta",
+            "title": "Meta",
+            "content": "<h2>Intro</h2><p>one two three</p><h3>Details</h3><p>four</p>",
+            "status": "published",
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    body = response.json()
+    assert body["word_count"] == 6
+    assert body["toc"] == [{"level": 2, "title": "Intro"}, {"level": 3, "title": "Details"}]
+
+    items = client.get("/api/articles", params={"section": "guides"}).json()["items"]
+    assert items[0]["excerpt"] == "Intro one two three Details four"
@@ -1,5 +1,9 @@
+import asyncio
+from datetime import datetime, timezone
+
 from fastapi import status
 
+from app.core import principal_cache
 from app.core.security import hash_password
 from app.models.user import User
 
@@ -61,3 +65,69 @@ def test_moderator_create_section(client, db_session):
     )
     assert create.status_code == status.HTTP_201_CREATED
     assert create.json()["slug"] == "general"
+
+
+def test_role_change_invalidates_cached_principal(client, db_session):
+    moderator = User(
+        username="@demoted",
+        password_hash=hash_password("Password123"),
+        role="moderator",
+        is_active=True,
+    )
+    db_session.add(moderator)
+    db_session.commit()
+
+    login = client.post(
+        "/api/auth/login",
+        json={"username": "@demoted", "password": "Password123"},
+    )
+    assert login.status_code == status.HTTP_200_OK
+    assert client.get("/api/sections/all").status_code == status.HTTP_200_OK
+
+    moderator.role = "user"
+    db_session.commit()
+    assert client.get("/api/sections/all").status_code == status.HTTP_403_FORBIDDEN
+
+    moderator.is_active = False
+    db_session.commit()
+    assert client.get("/api/auth/me").status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_async_principal_lookup_reads_epoch_from_async_client(monkeypatch):
+    class FakeAsyncRedis:
+        def __init__(self, epoch: str) -> None:
+            self.epoch = epoch
+
+        async def get(self, key: str) -> str:
+            assert key == principal_cache.EPOCH_KEY
+            return self.epoch
+
+    fake = FakeAsyncRedis("1")
+
+    async def get_async_redis():
+        return fake
+
+    def get_redis():
+        raise AssertionError("the async path must not use the sync client")
+
+    monkeypatch.setattr(principal_cache, "get_async_redis", get_async_redis)
+    monkeypatch.setattr(principal_cache, "get_redis", get_redis)
+    monkeypatch.setattr(principal_cache.settings, "user_cache_ttl_sec", 60)
+    user = User(
+        id="u1",
+        username="@cached",
+        password_hash="hash",
+        role="user",
+        is_active=True,
+        created_at=datetime.now(timezone.utc),
+    )
+
+    assert asyncio.run(principal_cache.get_principal_async("u1")) is None
+    principal_cache.store_principal(user)
+    monkeypatch.setattr(principal_cache, "_epoch_checked_at", 0.0)
+    assert asyncio.run(principal_cache.get_principal_async("u1")).username == "@cached"
+
+    # Another worker bumped the epoch: the local entry is dropped.
+    fake.epoch = "2"
+    monkeypatch.setattr(principal_cache, "_epoch_checked_at", 0.0)
+    assert asyncio.run(principal_cache.get_principal_async("u1")) is None
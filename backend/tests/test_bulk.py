@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+from fastapi import status
+
+from app.core.config import settings
+from app.core.ndjson import read_ndjson
+from app.models.article import Article
+from app.models.game_update import GameUpdate, GameUpdateAudit
+from app.schemas.updates import UpdateCreate
+from app.services import bulk
+
+
+def _ndjson(items: list[dict]) -> bytes:
+    return "\n".join(json.dumps(item) for item in items).encode("utf-8") + b"\n"
+
+
+def test_bulk_import_updates_and_export_round_trip(
+    client, db_session, monkeypatch, create_updates, login
+):
+    monkeypatch.setattr(settings, "bulk_sanitize_workers", 2)
+    create_updates(0)
+    login("@author")
+    items = [
+        {
+            "title": f"Patch {index}",
+            "patch_date": f"2024-02-{index + 1:02d}",
+            "content": f"<h2>Fixes</h2><p>note {index}</p><script>x()</script>",
+            "status": "published" if index % 2 else "draft",
+        }
+        for index in range(12)
+    ]
+
+    response = client.post(
+        "/api/updates/bulk",
+        content=_ndjson(items),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json() == {"created": 12}
+    stored = (
+        db_session.query(GameUpdate)
+        .filter(GameUpdate.title.like("Patch %"))
+        .order_by(GameUpdate.patch_date)
+        .all()
+    )
+    assert len(stored) == 12
+    assert "<script>" not in stored[0].content
+    assert stored[0].toc == [{"level": 2, "title": "Fixes"}]
+    assert db_session.query(GameUpdateAudit).filter_by(action="import").count() == 12
+
+    public = client.get("/api/updates", params={"per_page": 50}).json()
+    assert public["total"] == 6
+
+    export = client.get("/api/updates/export")
+    assert export.status_code == status.HTTP_200_OK
+    assert export.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in export.text.splitlines()]
+    assert [line["title"] for line in lines] == [item["title"] for item in items] + ["Draft patch"]
+    assert set(lines[0]) == {"title", "patch_date", "content", "status"}
+
+    bulk.shutdown_executor()
+    assert bulk._pool is None
+
+
+def test_bulk_import_rejects_invalid_lines_without_writing(
+    client, db_session, create_updates, login
+):
+    create_updates(0)
+    login("@author")
+    body = _ndjson(
+        [
+            {"title": "Patch ok", "patch_date": "2024-01-01", "content": "<p>x</p>"},
+            {"title": "Patch bad", "patch_date": "not-a-date", "content": "<p>x</p>"},
+        ]
+    )
+
+    response = client.post("/api/updates/bulk", content=body)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert [error["line"] for error in response.json()["detail"]] == [2]
+    assert db_session.query(GameUpdate).count() == 1
+
+
+def test_bulk_import_articles_checks_slugs(client, db_session, create_articles):
+    guides, _ = create_articles(1)
+    login = client.post(
+        "/api/auth/login",
+        json={"username": "@writer", "password": "Password123"},
+    )
+    assert login.status_code == status.HTTP_200_OK
+
+    def article(slug: str) -> dict:
+        return {"section_id": guides.id, "slug": slug, "title": slug, "content": "<p>x</p>"}
+
+    conflict = client.post(
+        "/api/articles/bulk", content=_ndjson([article("guide-0"), article("new"), article("new")])
+    )
+    assert conflict.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert [error["item"] for error in conflict.json()["detail"]] == [1, 3]
+
+    # "export" would be shadowed by GET /articles/export.
+    reserved = client.post("/api/articles/bulk", content=_ndjson([article("export")]))
+    assert reserved.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert [error["line"] for error in reserved.json()["detail"]] == [1]
+
+    response = client.post("/api/articles/bulk", content=_ndjson([article("a"), article("b")]))
+    assert response.status_code == status.HTTP_201_CREATED
+    assert db_session.query(Article).filter(Article.slug.in_(["a", "b"])).count() == 2
+
+
+class _ChunkedRequest:
+    def __init__(self, body: bytes, size: int) -> None:
+        self.chunks = [body[start : start + size] for start in range(0, len(body), size)]
+
+    async def stream(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def test_read_ndjson_joins_lines_split_across_chunks():
+    items = [
+        {"title": f"Patch {index}", "patch_date": "2024-01-01", "content": "<p>" + "x" * 300}
+        for index in range(3)
+    ]
+    body = _ndjson(items).rstrip(b"\n")
+
+    parsed = asyncio.run(read_ndjson(_ChunkedRequest(body, 7), UpdateCreate))
+    assert [item.title for item in parsed] == ["Patch 0", "Patch 1", "Patch 2"]
+    assert all(len(item.content) == 303 for item in parsed)
+
+
+def test_reserved_article_slugs_are_rejected(client, create_articles):
+    guides, _ = create_articles(1)
+    login = client.post(
+        "/api/auth/login",
+        json={"username": "@writer", "password": "Password123"},
+    )
+    assert login.status_code == status.HTTP_200_OK
+
+    response = client.post(
+        "/api/articles",
+        json={"section_id": guides.id, "slug": "export", "title": "t", "content": "<p>x</p>"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response.json()["detail"][0]["type"] == "slug_reserved"
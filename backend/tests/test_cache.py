@@ -0,0 +1,26 @@
+import time
+
+from app.core import cache
+from app.core.config import settings
+
+
+def test_memory_fallback_bounds_the_cross_worker_stale_window(monkeypatch):
+    # Without Redis an invalidation only reaches this worker's dict; other workers
+    # keep their copy until CACHE_MEMORY_TTL_SEC runs out.
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    monkeypatch.setattr(settings, "cache_memory_ttl_sec", 1)
+    cache.cache_clear()
+
+    cache.cache_set("sections:list", b"[]", tags=["sections"])
+    assert cache.cache_get("sections:list") == (b"[]", {})
+    time.sleep(1.05)
+    assert cache.cache_get("sections:list") is None
+
+
+def test_memory_fallback_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    monkeypatch.setattr(settings, "cache_memory_ttl_sec", 0)
+    cache.cache_clear()
+
+    cache.cache_set("sections:list", b"[]", tags=["sections"])
+    assert cache.cache_get("sections:list") is None
@@ -0,0 +1,190 @@
+from datetime import datetime
+
+import pytest
+from fastapi import status
+
+from app.models.article import Article
+from app.models.comment import Comment
+from app.tasks.comments import reconcile_comment_stats
+
+
+@pytest.mark.query_budget(7)
+def test_comment_threads_are_paginated_and_nested(client, create_articles, login, post_comment):
+    _, articles = create_articles(1)
+    article_id = articles[0].id
+    login("@writer")
+
+    first = post_comment(article_id, "first")
+    reply = post_comment(article_id, "reply", first["id"])
+    nested = post_comment(article_id, "nested", reply["id"])
+    post_comment(article_id, "second reply", first["id"])
+    second = post_comment(article_id, "second")
+    assert nested["depth"] == 2
+
+    response = client.get(f"/api/articles/{article_id}/comments/threads", params={"per_page": 1})
+    assert response.status_code == status.HTTP_200_OK
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == [second["id"]]
+    assert page["has_more"] is True
+
+    response = client.get(
+        f"/api/articles/{article_id}/comments/threads",
+        params={"per_page": 1, "cursor": page["next_cursor"]},
+    )
+    thread = response.json()["items"][0]
+    assert thread["id"] == first["id"]
+    assert thread["reply_count"] == 2
+    assert thread["updated_at"] is None
+    assert [child["content"] for child in thread["replies"]] == ["reply", "second reply"]
+    assert thread["replies"][0]["replies"][0]["id"] == nested["id"]
+    assert response.json()["has_more"] is False
+
+
+def test_thread_replies_are_capped_and_continue_by_cursor(
+    client, monkeypatch, create_articles, login, post_comment
+):
+    _, articles = create_articles(1)
+    article_id = articles[0].id
+    login("@writer")
+    invalidated: list[tuple[str, ...]] = []
+    monkeypatch.setattr(
+        "app.api.routes.comments.cache_invalidate", lambda *tags: invalidated.append(tags)
+    )
+
+    root = post_comment(article_id, "root")
+    first = post_comment(article_id, "r0", root["id"])
+    post_comment(article_id, "r0 nested", first["id"])
+    for index in range(1, 4):
+        post_comment(article_id, f"r{index}", root["id"])
+    assert invalidated[-1] == (f"article:{articles[0].slug}",)
+
+    response = client.get(
+        f"/api/articles/{article_id}/comments/threads", params={"replies_per_page": 2}
+    )
+    thread = response.json()["items"][0]
+    assert [child["content"] for child in thread["replies"]] == ["r0"]
+    assert thread["replies"][0]["replies"][0]["content"] == "r0 nested"
+    assert thread["has_more_replies"] is True
+
+    response = client.get(
+        f"/api/comments/{root['id']}/replies",
+        params={"per_page": 2, "cursor": thread["replies_cursor"]},
+    )
+    page = response.json()
+    assert [item["content"] for item in page["items"]] == ["r1", "r2"]
+    assert page["has_more"] is True
+
+    response = client.get(
+        f"/api/comments/{root['id']}/replies",
+        params={"per_page": 2, "cursor": page["next_cursor"]},
+    )
+    assert [item["content"] for item in response.json()["items"]] == ["r3"]
+    assert response.json()["has_more"] is False
+
+    response = client.get(f"/api/comments/{first['id']}/replies")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_hidden_reply_updates_count_and_depth_is_bounded(
+    client, db_session, create_articles, login, post_comment
+):
+    _, articles = create_articles(1)
+    article_id = articles[0].id
+    login("@writer")
+
+    parent = post_comment(article_id, "level 0")
+    chain = [parent]
+    for level in range(1, 7):
+        chain.append(post_comment(article_id, f"level {level}", chain[-1]["id"]))
+    too_deep = client.post(
+        f"/api/articles/{article_id}/comments",
+        json={"content": "level 7", "parent_id": chain[-1]["id"]},
+    )
+    assert too_deep.status_code == status.HTTP_400_BAD_REQUEST
+
+    hidden = client.patch(f"/api/comments/{chain[1]['id']}/hide")
+    assert hidden.status_code == status.HTTP_200_OK
+    db_session.expire_all()
+    assert db_session.get(Comment, parent["id"]).reply_count == 0
+
+    # chain[2] is itself visible, but its parent is hidden.
+    under_hidden = client.post(
+        f"/api/articles/{article_id}/comments",
+        json={"content": "orphan", "parent_id": chain[2]["id"]},
+    )
+    assert under_hidden.status_code == status.HTTP_400_BAD_REQUEST
+
+    client.post("/api/auth/logout")
+    thread = client.get(f"/api/articles/{article_id}/comments/threads").json()["items"][0]
+    assert thread["replies"] == []
+
+
+def test_article_comment_stats_follow_writes_and_reconcile(
+    client, db_session, create_articles, login, post_comment
+):
+    _, articles = create_articles(1)
+    article = articles[0]
+    edited_at = article.updated_at
+    login("@writer")
+
+    first = post_comment(article.id, "first")
+    second = post_comment(article.id, "second", first["id"])
+    listed = client.get("/api/articles", params={"section": "guides"}).json()["items"][0]
+    assert listed["comment_count"] == 2
+    assert listed["last_commented_at"] == second["created_at"]
+
+    assert client.patch(f"/api/comments/{second['id']}/hide").status_code == status.HTTP_200_OK
+    detail = client.get(f"/api/articles/{article.slug}").json()
+    assert detail["comment_count"] == 1
+    assert detail["last_commented_at"] == first["created_at"]
+
+    # Hiding a thread root hides its replies too; hiding under it changes nothing.
+    third = post_comment(article.id, "third")
+    post_comment(article.id, "reply to third", third["id"])
+    nested = post_comment(article.id, "nested under third", third["id"])
+    assert client.get(f"/api/articles/{article.slug}").json()["comment_count"] == 4
+    assert client.patch(f"/api/comments/{third['id']}/hide").status_code == status.HTTP_200_OK
+    assert client.get(f"/api/articles/{article.slug}").json()["comment_count"] == 1
+    assert client.patch(f"/api/comments/{nested['id']}/hide").status_code == status.HTTP_200_OK
+    assert client.get(f"/api/articles/{article.slug}").json()["comment_count"] == 1
+
+    # Comment counters do not make the article look edited.
+    db_session.expire_all()
+    stored = db_session.get(Article, article.id)
+    assert stored.updated_at == edited_at
+    stored.comment_count = 40
+    db_session.commit()
+    edited_at = stored.updated_at
+    assert reconcile_comment_stats(db_session) == 1
+    assert reconcile_comment_stats(db_session) == 0
+    db_session.expire_all()
+    assert db_session.get(Article, article.id).comment_count == 1
+    assert db_session.get(Article, article.id).updated_at == edited_at
+
+
+def test_new_comment_moves_article_last_modified(
+    client, db_session, create_articles, login, post_comment
+):
+    _, articles = create_articles(1)
+    article = articles[0]
+    # Older than any comment, so a same-second comment still moves Last-Modified.
+    article.created_at = article.updated_at = datetime(2025, 1, 1, 12, 0, 0)
+    db_session.commit()
+    url = f"/api/articles/{article.slug}"
+    last_modified = client.get(url).headers["Last-Modified"]
+
+    login("@writer")
+    post_comment(article.id, "first")
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["comment_count"] == 1
+    assert response.headers["Last-Modified"] != last_modified
+
+
+def test_reconcile_task_is_registered_with_the_worker():
+    import app.tasks  # noqa: F401  - what the worker imports at startup
+    from app.celery_app import celery_app
+
+    assert celery_app.conf.beat_schedule["reconcile-article-comment-stats"]["task"] in (
+        celery_app.tasks
+    )
@@ -0,0 +1,34 @@
+import pytest
+from fastapi import status
+
+INTERNAL_ROUTES = (
+    "/api/health/cache",
+    "/api/health/db-pool",
+    "/api/health/rate-limit",
+    "/api/health/redis",
+)
+
+
+def test_health_is_public(client):
+    response = client.get("/api/health")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.parametrize("path", INTERNAL_ROUTES)
+def test_internal_health_requires_admin(client, create_user, login, path):
+    assert client.get(path).status_code == status.HTTP_401_UNAUTHORIZED
+
+    create_user("@moderator", role="moderator")
+    login("@moderator")
+    assert client.get(path).status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_internal_health_reports_state_to_admin(client, create_user, login):
+    create_user("@admin", role="admin")
+    login("@admin")
+
+    assert "hits" in client.get("/api/health/cache").json()
+    assert "sync" in client.get("/api/health/db-pool").json()
+    assert "backend" in client.get("/api/health/rate-limit").json()
+    assert client.get("/api/health/redis").json()["state"] in ("closed", "open", "half_open")
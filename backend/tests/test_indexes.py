@@ -0,0 +1,111 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def captured_selects():
+    # Listening on Engine catches both the sync and the async (aiosqlite) engines.
+    seen: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            seen.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield seen
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def explain(db_session, statement: str, parameters) -> str:
+    # Plans are returned as text so assertions read the same on SQLite and MySQL.
+    connection = db_session.connection()
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        return "\n".join(row[-1] for row in rows)
+    rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+    return "\n".join(f"{row['table']}: {row['key']}" for row in rows)
+
+
+def route_plan(client, db_session, method: str, path: str, marker: str, **kwargs) -> str:
+    # Runs the real route and explains the statement it issued that contains `marker`.
+    with captured_selects() as seen:
+        response = client.request(method, path, **kwargs)
+    assert response.status_code < 300, response.text
+    matches = [(sql, params) for sql, params in seen if marker in " ".join(sql.split())]
+    assert matches, f"{path} issued no statement containing {marker!r}"
+    return explain(db_session, *matches[0])
+
+
+@pytest.fixture()
+def seeded(client, create_articles, create_updates, login, post_comment):
+    _, articles = create_articles(3)
+    create_updates(4)
+    login("@writer")
+    root = post_comment(articles[0].id, "root")
+    post_comment(articles[0].id, "reply", root["id"])
+    client.post("/api/auth/logout")
+    return articles[0]
+
+
+def test_article_feeds_use_composite_indexes(client, db_session, seeded):
+    plan = route_plan(client, db_session, "GET", "/api/articles", "ORDER BY articles.published_at")
+    assert "ix_articles_status_published" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+    # The section filter joins sections on slug, as the route does.
+    plan = route_plan(
+        client,
+        db_session,
+        "GET",
+        "/api/articles?section=guides",
+        "ORDER BY articles.published_at",
+    )
+    assert "ix_articles_status_section_published" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+def test_updates_feed_uses_composite_index(client, db_session, seeded):
+    plan = route_plan(client, db_session, "GET", "/api/updates", "ORDER BY game_updates.patch_date")
+    assert "ix_game_updates_status_feed" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+def test_comment_queries_use_composite_indexes(client, db_session, seeded):
+    path = f"/api/articles/{seeded.id}/comments"
+    plan = route_plan(client, db_session, "GET", path, "FROM comments")
+    assert "ix_comments_article_visible" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+    plan = route_plan(client, db_session, "GET", f"{path}/threads", "parent_id IS NULL")
+    assert "ix_comments_article_roots" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+    # Replies of a page of roots: the IN list is merged with a sort, but by index.
+    plan = route_plan(client, db_session, "GET", f"{path}/threads", "comments.root_id IN")
+    assert "ix_comments_root_created" in plan, plan
+
+
+def test_registration_and_audit_lookups_use_composite_indexes(client, db_session, seeded, login):
+    plan = route_plan(
+        client,
+        db_session,
+        "POST",
+        "/api/auth/register",
+        "FROM registration_requests",
+        json={"username": "@newcomer", "password": "Password123"},
+    )
+    assert "ix_registration_requests_username_status" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+    login("@author")
+    update_id = client.get("/api/updates").json()["items"][0]["id"]
+    plan = route_plan(
+        client, db_session, "GET", f"/api/updates/{update_id}/audit", "FROM game_update_audits"
+    )
+    assert "ix_game_update_audits_update_created" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
@@ -0,0 +1,28 @@
+import json
+import logging
+
+from app.core.config import settings
+from app.core.logging_config import JsonFormatter, should_log_request
+
+
+def test_successful_reads_are_sampled(monkeypatch):
+    monkeypatch.setattr(settings, "log_sample_rate", 0.0)
+
+    assert not should_log_request("GET", 200, 5.0)
+    assert not should_log_request("GET", 304, 5.0)
+    assert should_log_request("GET", 404, 5.0)
+    assert should_log_request("POST", 201, 5.0)
+    assert should_log_request("GET", 200, settings.log_slow_request_ms)
+
+
+def test_json_formatter_keeps_extra_fields():
+    record = logging.LogRecord("bdm", logging.INFO, __file__, 1, "request %s", ("done",), None)
+    record.request_id = "abc"
+    record.status_code = 200
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "request done"
+    assert payload["request_id"] == "abc"
+    assert payload["status_code"] == 200
+    assert payload["level"] == "INFO"
@@ -0,0 +1,46 @@
+from fastapi import status
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from app.core.config import settings
+from app.core.metrics import render_metrics
+
+ROUTE = "/api/articles/{slug}"
+
+
+def _sample(body: str, prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_metrics_label_routes_by_template(client):
+    count_key = f'bdm_http_request_db_queries_count{{route="{ROUTE}"}}'
+    sum_key = f'bdm_http_request_db_queries_sum{{route="{ROUTE}"}}'
+    before = client.get("/api/metrics").text
+
+    assert client.get("/api/articles/missing").status_code == status.HTTP_404_NOT_FOUND
+
+    response = client.get("/api/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert f'bdm_http_requests_total{{method="GET",route="{ROUTE}",status="404"}}' in body
+    assert "/api/articles/missing" not in body
+    assert _sample(body, count_key) == _sample(before, count_key) + 1
+    assert _sample(body, sum_key) > _sample(before, sum_key)
+
+
+def test_multiprocess_scrape_merges_service_directories(tmp_path, monkeypatch):
+    api_dir, celery_dir = tmp_path / "api", tmp_path / "celery"
+    for path, value in ((api_dir, 2.0), (celery_dir, 3.0)):
+        path.mkdir()
+        values = MmapedDict(str(path / "counter_1.db"))
+        key = mmap_key("bdm_demo", "bdm_demo_total", [], [], "demo")
+        values.write_value(key, value, 0)
+        values.close()
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(api_dir))
+    monkeypatch.setattr(settings, "metrics_merge_dirs", str(celery_dir))
+
+    body, _ = render_metrics()
+    assert "bdm_demo_total 5.0" in body.decode()
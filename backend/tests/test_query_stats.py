@@ -0,0 +1,27 @@
+from fastapi import status
+from sqlalchemy import select
+
+from app.db.query_stats import track_queries
+from app.models.user import User
+
+
+def test_server_timing_reports_db_time(client):
+    response = client.get("/api/sections")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Query-Count"] == "1"
+    db_part, app_part = response.headers["Server-Timing"].split(", ")
+    assert db_part.startswith("db;dur=") and db_part.endswith('desc="1 queries"')
+    assert app_part.startswith("app;dur=")
+
+
+def test_track_queries_flags_repeated_statements(db_session):
+    with track_queries(record_statements=True) as stats:
+        for index in range(5):
+            db_session.execute(select(User).where(User.username == f"@user{index}")).all()
+        db_session.execute(select(User.id)).all()
+
+    assert stats.count == 6
+    repeated = stats.repeated(5)
+    assert len(repeated) == 1
+    assert repeated[0][1] == 5
+    assert "FROM users" in repeated[0][0]
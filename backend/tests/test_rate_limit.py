@@ -0,0 +1,79 @@
+from fastapi import status
+
+from app.core.config import settings
+from app.core.rate_limit import (
+    _limit_memory,
+    _sliding_log_memory,
+    _token_bucket_memory,
+    rate_limit_clear,
+    rate_limit_stats,
+)
+
+
+def test_login_rate_limit_headers(client, monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_login_max", 2)
+    payload = {"username": "@limited", "password": "Password123"}
+
+    first = client.post("/api/auth/login", json=payload)
+    assert first.status_code == status.HTTP_401_UNAUTHORIZED
+    assert first.headers["X-RateLimit-Limit"] == "2"
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+
+    client.post("/api/auth/login", json=payload)
+    blocked = client.post("/api/auth/login", json=payload)
+    assert blocked.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert blocked.headers["X-RateLimit-Remaining"] == "0"
+    assert int(blocked.headers["Retry-After"]) >= 1
+
+
+def test_sliding_log_frees_slots_as_window_slides():
+    state = None
+    for now in (0.0, 1.0):
+        state, result = _sliding_log_memory(state, now, limit=2, window_sec=10)
+        assert result.allowed
+
+    state, result = _sliding_log_memory(state, 5.0, limit=2, window_sec=10)
+    assert not result.allowed
+    assert result.reset_sec == 5
+
+    state, result = _sliding_log_memory(state, 10.5, limit=2, window_sec=10)
+    assert result.allowed
+    assert result.remaining == 0
+
+
+def test_token_bucket_refills_over_time():
+    state = None
+    for _ in range(3):
+        state, result = _token_bucket_memory(state, 0.0, limit=3, window_sec=30)
+        assert result.allowed
+
+    state, result = _token_bucket_memory(state, 0.0, limit=3, window_sec=30)
+    assert not result.allowed
+    assert result.reset_sec == 10
+
+    state, result = _token_bucket_memory(state, 10.0, limit=3, window_sec=30)
+    assert result.allowed
+
+
+def test_memory_store_is_bounded(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_memory_max_keys", 3)
+    rate_limit_clear()
+    before = rate_limit_stats()["evictions"]
+
+    for index in range(10):
+        _limit_memory(f"rl:test:sliding_log:ip:user{index}", "sliding_log", 5, 60)
+
+    stats = rate_limit_stats()
+    assert stats["memory_entries"] == 3
+    assert stats["evictions"] - before == 7
+
+
+def test_memory_store_sweeps_expired_keys():
+    rate_limit_clear()
+    before = rate_limit_stats()["expired"]
+    _limit_memory("rl:test:sliding_log:ip:short", "sliding_log", 5, 0)
+    _limit_memory("rl:test:sliding_log:ip:other", "sliding_log", 5, 60)
+
+    stats = rate_limit_stats()
+    assert stats["memory_entries"] == 1
+    assert stats["expired"] - before == 1
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError, ResponseError
+
+from app.core import redis_client
+from app.core.redis_client import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def test_circuit_breaker_opens_and_backs_off():
+    breaker = CircuitBreaker(base_sec=10.0, max_sec=25.0)
+    # Closed from the start, so callers are not turned away before a first probe.
+    assert breaker.acquire() == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.acquire() is None
+    assert 9.0 < breaker.snapshot()["retry_in_sec"] <= 10.0
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert 24.0 < breaker.snapshot()["retry_in_sec"] <= 25.0
+
+
+def test_circuit_breaker_closes_after_successful_probe():
+    breaker = CircuitBreaker(base_sec=0.0)
+    breaker.record_failure()
+    assert breaker.acquire() == HALF_OPEN
+    # Only one probe at a time while half-open.
+    assert breaker.acquire() is None
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.acquire() == CLOSED
+    assert breaker.snapshot()["failures"] == 0
+
+
+def test_only_connection_errors_open_the_circuit(monkeypatch):
+    breaker = CircuitBreaker()
+    monkeypatch.setattr(redis_client, "breaker", breaker)
+
+    redis_client.report_redis_error(ResponseError("NOSCRIPT"))
+    assert breaker.state == CLOSED
+    redis_client.report_redis_error(ConnectionError("refused"))
+    assert breaker.state == OPEN
+
+
+def test_cancelled_async_probe_releases_the_breaker(monkeypatch):
+    breaker = CircuitBreaker(base_sec=0.0)
+    breaker.record_failure()
+    monkeypatch.setattr(redis_client, "breaker", breaker)
+
+    class _HangingClient:
+        async def ping(self):
+            await asyncio.sleep(10)
+
+    monkeypatch.setattr(redis_client, "_async_client", lambda: _HangingClient())
+
+    async def probe():
+        task = asyncio.create_task(redis_client.get_async_redis())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(probe())
+    assert breaker.acquire() == HALF_OPEN
@@ -0,0 +1,54 @@
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import cache
+from app.core.config import settings
+from app.core.deps import PRIMARY_STICKY_COOKIE
+from app.db.session import RoutingSession
+
+
+def test_routing_session_reads_from_replica():
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    factory = sessionmaker(bind=primary, class_=RoutingSession, replica_bind=replica)
+
+    with factory() as db:
+        assert db.get_bind() is primary
+        db.read_only = True
+        assert db.get_bind() is replica
+
+
+def test_write_sets_primary_sticky_cookie(client, monkeypatch):
+    monkeypatch.setattr(settings, "database_replica_url", "sqlite://")
+
+    response = client.get("/api/sections")
+    assert PRIMARY_STICKY_COOKIE not in response.cookies
+
+    response = client.post("/api/auth/logout")
+    assert response.status_code == 200
+    assert response.cookies.get(PRIMARY_STICKY_COOKIE) == "1"
+    assert f"Max-Age={settings.db_replica_sticky_sec}" in response.headers["set-cookie"]
+
+
+def test_sticky_client_bypasses_response_cache(client):
+    assert client.get("/api/sections").headers["X-Cache"] == "MISS"
+    assert client.get("/api/sections").headers["X-Cache"] == "HIT"
+
+    client.cookies.set(PRIMARY_STICKY_COOKIE, "1")
+    assert client.get("/api/sections").headers["X-Cache"] == "MISS"
+
+
+def test_delayed_invalidations_share_one_thread(monkeypatch):
+    monkeypatch.setattr(settings, "database_replica_url", "sqlite://")
+    monkeypatch.setattr(settings, "db_replica_sticky_sec", 60)
+
+    for _ in range(20):
+        cache.cache_invalidate("articles", "article:demo")
+
+    workers = [t for t in threading.enumerate() if t.name == "cache-reinvalidate"]
+    assert len(workers) == 1
+    with cache._reinvalidate_cond:
+        assert set(cache._reinvalidate_at) == {"articles", "article:demo"}
+        cache._reinvalidate_at.clear()
@@ -0,0 +1,77 @@
+import httpx
+from fastapi import status
+
+from app.services import revalidate
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.sets: dict[str, set[bytes]] = {}
+        self.keys: dict[str, object] = {}
+
+    def sadd(self, key: str, *values: str) -> None:
+        self.sets.setdefault(key, set()).update(value.encode() for value in values)
+
+    def smembers(self, key: str) -> set[bytes]:
+        return set(self.sets.get(key, set()))
+
+    def srem(self, key: str, *values: str) -> None:
+        self.sets.get(key, set()).difference_update(value.encode() for value in values)
+
+    def set(self, key: str, value: object, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.keys:
+            return False
+        self.keys[key] = value
+        return True
+
+    def delete(self, key: str) -> None:
+        self.keys.pop(key, None)
+
+
+def test_writes_are_batched_into_one_revalidation_call(client, monkeypatch, create_updates, login):
+    fake = _FakeRedis()
+    scheduled: list[float] = []
+    posted: list[dict] = []
+
+    def fake_post(url, json, headers, timeout):
+        posted.append({"url": url, "json": json, "secret": headers["X-Revalidate-Secret"]})
+        return httpx.Response(200, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(
+        revalidate.settings, "frontend_revalidate_url", "http://front/api/revalidate"
+    )
+    monkeypatch.setattr(revalidate.settings, "frontend_revalidate_secret", "s3cret")
+    monkeypatch.setattr(revalidate, "get_redis", lambda: fake)
+    monkeypatch.setattr(
+        revalidate.celery_app, "send_task", lambda name, countdown: scheduled.append(countdown)
+    )
+    monkeypatch.setattr(revalidate.httpx, "post", fake_post)
+
+    first, second = create_updates(2)
+    login("@author")
+    for update in (first, second):
+        response = client.post(f"/api/updates/{update.id}/unpublish")
+        assert response.status_code == status.HTTP_200_OK
+
+    assert scheduled == [revalidate.settings.revalidate_debounce_sec]
+    assert revalidate.flush_pending_revalidations() == 3
+    assert posted == [
+        {
+            "url": "http://front/api/revalidate",
+            "json": {
+                "tags": sorted(["updates", f"update:{first.id}", f"update:{second.id}"]),
+                "paths": ["/updates"],
+            },
+            "secret": "s3cret",
+        }
+    ]
+    assert revalidate.flush_pending_revalidations() == 0
+
+    assert client.post(f"/api/updates/{first.id}/publish").status_code == status.HTTP_200_OK
+    assert len(scheduled) == 2
+
+
+def test_flush_task_is_registered_with_the_worker():
+    import app.tasks  # noqa: F401  - what the worker imports at startup
+
+    assert revalidate.FLUSH_TASK in revalidate.celery_app.tasks
@@ -0,0 +1,33 @@
+from app.services import sanitize
+from app.services.sanitize import sanitize_html
+
+
+def test_sanitize_filters_iframes_and_scripts():
+    content = (
+        '<p onclick="x()">Patch</p><script>alert(1)</script>'
+        '<iframe src="https://www.youtube.com/embed/abc"></iframe>'
+        '<iframe src="https://evil.example/embed"></iframe>'
+    )
+
+    cleaned = sanitize_html(content)
+
+    assert cleaned == sanitize_html(content)
+    assert "onclick" not in cleaned
+    assert "<script>" not in cleaned
+    assert 'src="https://www.youtube.com/embed/abc"' in cleaned
+    assert "evil.example" not in cleaned
+
+
+def test_sanitize_memo_is_bounded_by_size(monkeypatch):
+    monkeypatch.setattr(sanitize, "MEMO_MAX_BYTES", 100)
+    monkeypatch.setattr(sanitize, "MEMO_MAX_ITEM_BYTES", 60)
+    sanitize.clear_sanitize_cache()
+
+    sanitize_html("<p>" + "x" * 80 + "</p>")
+    assert len(sanitize._memo) == 0
+
+    for index in range(5):
+        sanitize_html(f"<p>{index}{'y' * 30}</p>")
+    assert sanitize._memo_bytes <= 100
+    assert len(sanitize._memo) == 2
+    sanitize.clear_sanitize_cache()
@@ -0,0 +1,68 @@
+from datetime import date
+
+from fastapi import status
+
+from app.core.security import hash_password
+from app.models.game_update import GameUpdate
+from app.models.section import Section
+from app.models.user import User
+
+
+def login_moderator(client, db_session) -> tuple[User, Section]:
+    moderator = User(
+        username="@searcher",
+        password_hash=hash_password("Password123"),
+        role="moderator",
+        is_active=True,
+    )
+    section = Section(slug="guides", title="Guides", sort_order=1, is_visible=True)
+    db_session.add_all([moderator, section])
+    db_session.commit()
+
+    response = client.post(
+        "/api/auth/login",
+        json={"username": "@searcher", "password": "Password123"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return moderator, section
+
+
+def test_search_indexes_published_content(client, db_session):
+    moderator, section = login_moderator(client, db_session)
+
+    article = client.post(
+        "/api/articles",
+        json={
+            "section_id": section.id,
+            "slug": "kzarka",
+            "title": "Kzarka boss guide",
+            "content": "<p>Dodge the <strong>sword</strong> slam, then burst.</p>",
+            "status": "published",
+        },
+    )
+    assert article.status_code == status.HTTP_201_CREATED
+    draft = GameUpdate(
+        title="Sword rebalance",
+        patch_date=date(2025, 2, 1),
+        content="<p>Sword damage reduced.</p>",
+        status="draft",
+        created_by_id=moderator.id,
+    )
+    db_session.add(draft)
+    db_session.commit()
+
+    response = client.get("/api/search", params={"q": "sword"})
+    assert response.status_code == status.HTTP_200_OK
+    items = response.json()["items"]
+    assert [(item["kind"], item["slug"]) for item in items] == [("article", "kzarka")]
+    assert "<strong>" not in items[0]["snippet"]
+    assert "sword slam" in items[0]["snippet"]
+
+    publish = client.post(f"/api/updates/{draft.id}/publish")
+    assert publish.status_code == status.HTTP_200_OK
+    response = client.get("/api/search", params={"q": "rebalance", "kind": "update"})
+    assert [item["id"] for item in response.json()["items"]] == [draft.id]
+
+    client.delete(f"/api/updates/{draft.id}")
+    response = client.get("/api/search", params={"q": "rebalance"})
+    assert response.json()["items"] == []
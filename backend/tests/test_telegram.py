@@ -0,0 +1,109 @@
+import httpx
+import pytest
+
+from app.core import rate_limit
+from app.core.config import settings
+from app.core.security import hash_password
+from app.models.user import User
+from app.services import telegram
+from app.tasks import telegram as telegram_tasks
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture()
+def telegram_api(monkeypatch):
+    sent: list[dict] = []
+    responses: list[httpx.Response] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append({"path": request.url.path, "body": request.read()})
+        return responses.pop(0) if responses else httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr(settings, "telegram_bot_token", "test-token")
+    monkeypatch.setattr(
+        telegram,
+        "_client",
+        httpx.Client(
+            base_url="https://api.telegram.test/bottest-token",
+            transport=httpx.MockTransport(handler),
+        ),
+    )
+    monkeypatch.setattr(telegram, "acquire_token", lambda key, limit, window_sec: 0.0)
+    return sent, responses
+
+
+def test_token_bucket_reports_wait_until_next_token(monkeypatch):
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: None)
+    rate_limit.rate_limit_clear()
+
+    assert rate_limit.acquire_token("tg:test", 2, 1.0) == 0.0
+    assert rate_limit.acquire_token("tg:test", 2, 1.0) == 0.0
+    wait = rate_limit.acquire_token("tg:test", 2, 1.0)
+    assert 0 < wait <= 0.5
+
+
+def test_send_honors_retry_after(telegram_api):
+    sent, responses = telegram_api
+    responses.append(
+        httpx.Response(429, json={"ok": False, "error_code": 429, "parameters": {"retry_after": 7}})
+    )
+
+    with pytest.raises(telegram.TelegramRetry) as exc_info:
+        telegram.send_message("100", "hello")
+    assert exc_info.value.delay == 7
+
+    assert telegram.send_message("100", "hello") is True
+    assert [item["path"] for item in sent] == ["/bottest-token/sendMessage"] * 2
+
+
+def test_batch_stops_and_requeues_the_rest_on_rate_limit(telegram_api, monkeypatch):
+    sent, responses = telegram_api
+    responses.extend(
+        [
+            httpx.Response(200, json={"ok": True}),
+            httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 3}}),
+        ]
+    )
+    deferred: list[tuple] = []
+    monkeypatch.setattr(
+        telegram_tasks.send_telegram_batch,
+        "apply_async",
+        lambda args, kwargs, countdown: deferred.append((args, kwargs, countdown)),
+    )
+
+    assert telegram_tasks.send_telegram_batch(["1", "2", "3"], "news") == 1
+    # retry_after holds for the whole bot: nothing is sent after the 429.
+    assert len(sent) == 2
+    assert deferred == [((["2", "3"], "news"), {"attempt": 1}, 3.0)]
+
+    # A batch that keeps hitting 429 without progress is eventually dropped.
+    responses.append(httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 3}}))
+    attempts = telegram_tasks.RATE_LIMIT_MAX_RETRIES
+    assert telegram_tasks.send_telegram_batch(["2", "3"], "news", attempt=attempts) == 0
+    assert len(deferred) == 1
+
+
+def test_broadcast_fans_out_to_linked_active_users(client, db_session, monkeypatch):
+    password_hash = hash_password("Password123")
+    users = [
+        User(
+            username=f"@tg{index}",
+            password_hash=password_hash,
+            telegram_id=str(1000 + index) if index % 5 else None,
+            is_active=index != 1,
+        )
+        for index in range(250)
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+
+    batches: list[list[str]] = []
+    monkeypatch.setattr(settings, "telegram_bot_token", "test-token")
+    monkeypatch.setattr(telegram_tasks, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(
+        telegram_tasks.send_telegram_batch, "delay", lambda ids, text: batches.append(ids)
+    )
+
+    assert telegram_tasks.broadcast_telegram_message("patch notes") == 199
+    assert [len(batch) for batch in batches] == [100, 99]
+    assert "1001" not in {telegram_id for batch in batches for telegram_id in batch}
@@ -0,0 +1,212 @@
+import base64
+import csv
+import io
+import json
+
+import pytest
+from fastapi import status
+
+from app.models.game_update import GameUpdateAudit
+from app.services import audit as audit_service
+
+
+@pytest.mark.query_budget(2)
+def test_list_updates_cursor_matches_page_order(client, create_updates):
+    create_updates(5)
+
+    first = client.get("/api/updates", params={"per_page": 10})
+    assert first.status_code == status.HTTP_200_OK
+    data = first.json()
+    assert data["total"] == 5
+    assert data["has_more"] is False
+    expected = [item["id"] for item in data["items"]]
+    assert len(expected) == 5
+
+    seen: list[str] = []
+    params: dict[str, object] = {"per_page": 2, "with_total": False}
+    while True:
+        response = client.get("/api/updates", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["total"] is None
+        seen.extend(item["id"] for item in body["items"])
+        if not body["next_cursor"]:
+            assert body["has_more"] is False
+            break
+        params = {"per_page": 2, "cursor": body["next_cursor"]}
+
+    assert seen == expected
+
+
+def test_list_updates_rejects_invalid_cursor(client):
+    response = client.get("/api/updates", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def _raw_cursor(values: list) -> str:
+    raw = json.dumps(values).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize(
+    ("path", "values"),
+    [
+        ("/api/updates", [None, None, None]),
+        ("/api/updates", [[1], [2], [3]]),
+        ("/api/updates", [{"d": "2025-01-01"}, True, "id"]),
+        ("/api/updates", [{"dt": "2025-01-01T00:00:00"}, {"dt": "2025-01-01T00:00:00"}, "id"]),
+        ("/api/articles", [None, None]),
+        ("/api/articles", [{"dt": "2025-01-01T00:00:00"}, {"a": 1}]),
+        ("/api/articles", ["2025-01-01", 5]),
+    ],
+)
+def test_list_feeds_reject_cursor_values_of_the_wrong_type(client, path, values):
+    # Well-formed base64 JSON, but the values do not fit the key columns.
+    response = client.get(path, params={"cursor": _raw_cursor(values)})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_get_update_cache_invalidated_on_write(client, create_updates):
+    updates = create_updates(1)
+    update_id = updates[0].id
+
+    first = client.get(f"/api/updates/{update_id}")
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["X-Cache"] == "MISS"
+    second = client.get(f"/api/updates/{update_id}")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+    login = client.post(
+        "/api/auth/login",
+        json={"username": "@author", "password": "Password123"},
+    )
+    assert login.status_code == status.HTTP_200_OK
+    patch = client.patch(f"/api/updates/{update_id}", json={"title": "Patch renamed"})
+    assert patch.status_code == status.HTTP_200_OK
+
+    third = client.get(f"/api/updates/{update_id}")
+    assert third.headers["X-Cache"] == "MISS"
+    assert third.json()["title"] == "Patch renamed"
+
+
+def test_get_update_conditional_requests(client, create_updates):
+    updates = create_updates(1)
+    url = f"/api/updates/{updates[0].id}"
+
+    first = client.get(url)
+    assert first.status_code == status.HTTP_200_OK
+    etag = first.headers["ETag"]
+    last_modified = first.headers["Last-Modified"]
+
+    for headers in ({"If-None-Match": etag}, {"If-Modified-Since": last_modified}):
+        response = client.get(url, headers=headers)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    stale = client.get(url, headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == status.HTTP_200_OK
+    assert stale.json() == first.json()
+
+
+@pytest.mark.query_budget(6)
+def test_unpublish_writes_audit_in_same_transaction(client, create_updates, login):
+    update = create_updates(1)[0]
+    login("@author")
+
+    response = client.post(f"/api/updates/{update.id}/unpublish")
+    assert response.status_code == status.HTTP_200_OK
+
+    audit = client.get(f"/api/updates/{update.id}/audit").json()
+    assert [entry["action"] for entry in audit] == ["unpublish"]
+    assert audit[0]["metadata"] == {"title": update.title}
+
+
+class _FakeList:
+    def __init__(self) -> None:
+        self.items: list[str] = []
+        self.keys: dict[str, str] = {}
+
+    def rpush(self, key: str, *values: str) -> None:
+        self.items.extend(values)
+
+    def lrange(self, key: str, start: int, end: int) -> list[str]:
+        return self.items[start : end + 1]
+
+    def ltrim(self, key: str, start: int, end: int) -> None:
+        self.items = self.items[start:]
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.keys:
+            return False
+        self.keys[key] = value
+        return True
+
+    def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.keys.get(key) != token:
+            return 0
+        del self.keys[key]
+        return 1
+
+
+def test_buffered_audits_are_flushed_in_batches(
+    client, db_session, monkeypatch, create_updates, login
+):
+    buffer = _FakeList()
+    monkeypatch.setattr(audit_service.settings, "audit_buffer_enabled", True)
+    monkeypatch.setattr(audit_service, "get_redis", lambda: buffer)
+    update = create_updates(1)[0]
+    login("@author")
+
+    for action in ("unpublish", "publish"):
+        response = client.post(f"/api/updates/{update.id}/{action}")
+        assert response.status_code == status.HTTP_200_OK
+    assert len(buffer.items) == 2
+    assert db_session.query(GameUpdateAudit).count() == 0
+
+    # A flush already holding the lock is left alone.
+    buffer.set(audit_service.LOCK_KEY, "other-worker")
+    assert audit_service.flush_update_audits(db_session, batch=10) == 0
+    assert len(buffer.items) == 2
+    buffer.keys.clear()
+
+    assert audit_service.flush_update_audits(db_session, batch=10) == 2
+    assert buffer.items == []
+    assert buffer.keys == {}
+    actions = [row.action for row in db_session.query(GameUpdateAudit).order_by("created_at")]
+    assert actions == ["unpublish", "publish"]
+
+
+def test_audit_export_streams_filtered_rows(client, create_updates, login):
+    first, second = create_updates(2)
+    login("@author")
+    for update in (first, second):
+        assert client.post(f"/api/updates/{update.id}/unpublish").status_code == 200
+    assert client.post(f"/api/updates/{first.id}/publish").status_code == 200
+
+    response = client.get("/api/updates/audit/export", params={"action": "unpublish"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["update_id"] for row in rows] == [first.id, second.id]
+    assert rows[0]["metadata"] == {"title": first.title}
+
+    csv_export = client.get(
+        "/api/updates/audit/export", params={"format": "csv", "update_id": first.id}
+    )
+    assert csv_export.headers["content-type"].startswith("text/csv")
+    records = list(csv.DictReader(io.StringIO(csv_export.text)))
+    assert [record["action"] for record in records] == ["unpublish", "publish"]
+    assert json.loads(records[0]["metadata"]) == {"title": first.title}
+
+    future = client.get("/api/updates/audit/export", params={"since": "2999-01-01T00:00:00"})
+    assert future.text == ""
+
+
+def test_audit_flush_task_is_registered_with_the_worker():
+    import app.tasks  # noqa: F401  - what the worker imports at startup
+    from app.celery_app import celery_app
+
+    assert "app.tasks.audit.flush_update_audit_buffer" in celery_app.tasks
@@ -0,0 +1,27 @@
+import { revalidatePath, revalidateTag } from "next/cache";
+import { NextRequest, NextResponse } from "next/server";
+
+// Called by the backend (Celery) after content changes; tags match the backend cache tags.
+// No fetch is tagged yet (public pages are client-rendered), so tags have no effect until then.
+const SECRET = process.env.REVALIDATE_SECRET;
+
+const stringList = (value: unknown): string[] =>
+  Array.isArray(value) ? value.filter((item): item is string => typeof item === "string") : [];
+
+export async function POST(request: NextRequest) {
+  if (!SECRET || request.headers.get("x-revalidate-secret") !== SECRET) {
+    return NextResponse.json({ detail: "Forbidden" }, { status: 403 });
+  }
+
+  const body = (await request.json().catch(() => null)) as {
+    tags?: unknown;
+    paths?: unknown;
+  } | null;
+  const tags = stringList(body?.tags);
+  const paths = stringList(body?.paths);
+
+  tags.forEach((tag) => revalidateTag(tag));
+  paths.forEach((path) => revalidatePath(path));
+
+  return NextResponse.json({ revalidated: true, tags, paths });
+}
@@ -12,17 +12,24 @@ type Section = {
   description?: string | null;
 };
 
-type Article = {
+type ArticleSummary = {
   id: string;
   title: string;
   slug: string;
   section_id: string;
-  status: string;
+  published_at: string | null;
+};
+
+type ArticleList = {
+  items: ArticleSummary[];
+  per_page: number;
+  has_more: boolean;
+  next_cursor: string | null;
 };
 
 export default function HomePage() {
   const [sections, setSections] = useState<Section[]>([]);
-  const [articles, setArticles] = useState<Article[]>([]);
+  const [articles, setArticles] = useState<ArticleSummary[]>([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
@@ -38,10 +45,10 @@ export default function HomePage() {
     const load = async () => {
       const [sectionsRes, articlesRes] = await Promise.all([
         apiFetch<Section[]>("/sections"),
-        apiFetch<Article[]>("/articles"),
+        apiFetch<ArticleList>("/articles?per_page=3"),
       ]);
       if (sectionsRes.data) setSections(sectionsRes.data);
-      if (articlesRes.data) setArticles(articlesRes.data);
+      if (articlesRes.data) setArticles(articlesRes.data.items);
       setLoading(false);
     };
     load();